@@ -1,20 +1,73 @@
 """
 App module.
 """
+from asyncio import CancelledError, create_task
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
 from fastapi import FastAPI, status
+from fastapi.responses import PlainTextResponse
 
 from app.auth.routes import router as auth_router
 from app.emotions.routes import router as emotions_router
+from app.health.functions import startup_warm_up
+from app.health.routes import router as health_router
 from app.settings import settings, Tags
+from app.translate.functions import translation_job_runner
 from app.translate.routes import router as translate_router
+from app.usage.functions import usage_aggregator
 from app.users.routes import router as users_router
+from app.utils.cryptography import hashing_executor
+from app.utils.deadline import DeadlineMiddleware
+from app.utils.idempotency import IdempotencyMiddleware, InMemoryIdempotencyStore, RedisIdempotencyStore
+from app.utils.llm import get_model_engine
+from app.utils.load_shedding import event_loop_lag_monitor, LoadSheddingMiddleware
+from app.utils.metrics import metrics
 from app.utils.models import MessageSchema
 
-app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    App lifespan, warms up the worker resources before it accepts traffic, starts the background tasks and releases
+    the app resources on shutdown.
+
+    Args:
+        app (FastAPI): App instance.
+    """
+    await startup_warm_up.run()
+    warm_up_retry_task = create_task(startup_warm_up.retry())
+    usage_flush_task = create_task(usage_aggregator.run())
+    event_loop_lag_task = create_task(event_loop_lag_monitor.run())
+    translation_job_task = create_task(translation_job_runner.run())
+
+    yield
+
+    for task in (warm_up_retry_task, usage_flush_task, event_loop_lag_task, translation_job_task):
+        task.cancel()
+        with suppress(CancelledError):
+            await task
+    await translation_job_runner.close()
+    await usage_aggregator.flush()
+
+    if get_model_engine.cache_info().currsize:
+        await get_model_engine().close()
+
+    hashing_executor.shutdown()
+
+
+app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan)
+app.add_middleware(middleware_class=DeadlineMiddleware, path_prefixes=('/translate', '/emotions'))
+app.add_middleware(middleware_class=LoadSheddingMiddleware)
+app.add_middleware(middleware_class=IdempotencyMiddleware,
+                   store=RedisIdempotencyStore(url=settings.IDEMPOTENCY_REDIS_URL) if settings.IDEMPOTENCY_REDIS_URL
+                   else InMemoryIdempotencyStore(max_keys=settings.IDEMPOTENCY_MAX_KEYS),
+                   path_prefixes=('/translate', '/emotions'))
 app.include_router(router=translate_router, prefix='/translate', tags=[Tags.TRANSLATE])
 app.include_router(router=emotions_router, prefix='/emotions', tags=[Tags.EMOTIONS])
 app.include_router(router=users_router, prefix='/user', tags=[Tags.USER])
 app.include_router(router=auth_router, prefix='/auth', tags=[Tags.AUTH])
+app.include_router(router=health_router, prefix='/health', tags=[Tags.GENERAL])
 
 
 @app.get(path='/',
@@ -33,4 +86,20 @@ async def welcome() -> MessageSchema:
     return MessageSchema(message=f'Welcome to {settings.APP_NAME} API. For more information please refer to /docs')
 
 
+@app.get(path='/metrics',
+         tags=[Tags.GENERAL],
+         summary='Metrics endpoint.',
+         description='Get the service metrics in the Prometheus text format.',
+         status_code=status.HTTP_200_OK,
+         response_class=PlainTextResponse)
+async def get_metrics() -> str:
+    """
+    Get the service metrics in the Prometheus text format.
+
+    Returns:
+        str: Rendered metrics.
+    """
+    return metrics.render()
+
+
 from app.errors import *  # noqa
@@ -0,0 +1 @@
+from .login_rate_limiting import check_login_rate_limit
@@ -0,0 +1,41 @@
+"""
+This module contains the function to throttle the login attempts per email and per client IP.
+"""
+from app.settings import settings
+from app.utils.exceptions import TooManyRequestsException
+from app.utils.metrics import metrics
+from app.utils.rate_limiting import TokenBucketRegistry
+
+metrics.describe(name='login_throttled_total', description='Login attempts rejected by the login rate limits.')
+
+email_buckets = TokenBucketRegistry(capacity=settings.LOGIN_EMAIL_RATE_LIMIT,
+                                    refill_rate=settings.LOGIN_EMAIL_RATE_LIMIT / 60)
+ip_buckets = TokenBucketRegistry(capacity=settings.LOGIN_IP_RATE_LIMIT, refill_rate=settings.LOGIN_IP_RATE_LIMIT / 60)
+
+
+def check_login_rate_limit(email: str, client_ip: str | None) -> None:
+    """
+    Take a login attempt from the client IP and the email token buckets, a limit of 0 disables its bucket.
+
+    Args:
+        email (str): Email used to log in.
+        client_ip (str | None): IP of the client, if it is known.
+
+    Raises:
+        TooManyRequestsException: If the client IP or the email have no login attempts left.
+    """
+    if client_ip is not None and settings.LOGIN_IP_RATE_LIMIT > 0:
+        retry_after = ip_buckets.consume(key=client_ip)
+        if retry_after > 0:
+            metrics.increment(name='login_throttled_total', labels={'scope': 'ip'})
+            raise TooManyRequestsException(message='Too many login attempts. Please try again later.',
+                                           retry_after=retry_after)
+
+    if settings.LOGIN_EMAIL_RATE_LIMIT <= 0:
+        return
+
+    retry_after = email_buckets.consume(key=email.strip().lower())
+    if retry_after > 0:
+        metrics.increment(name='login_throttled_total', labels={'scope': 'email'})
+        raise TooManyRequestsException(message='Too many login attempts. Please try again later.',
+                                       retry_after=retry_after)
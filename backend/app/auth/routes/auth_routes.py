@@ -1,14 +1,16 @@
 """
 Auth routes.
 """
-from fastapi import APIRouter, Body, Depends, status
+from fastapi import APIRouter, Body, Depends, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.functions import check_login_rate_limit
 from app.auth.models import LoginSchema
-from app.database import session_maker
-from app.users.dal import UserDAL
+from app.database import get_session
+from app.users.dal import AsyncUserDAL
 from app.users.models import User
-from app.utils.cryptography import check_user_not_logged_in, create_token
+from app.utils.cryptography import check_user_not_logged_in, create_token, password_hashing_async
 from app.utils.exceptions import InvalidCredentialsException
 from app.utils.models import ErrorSchema, TokenSchema
 
@@ -22,19 +24,26 @@ router = APIRouter()
     'User login using swagger docs. It does the same as the /auth/login endpoint, so use /auth/login for production.',
     response_model=TokenSchema,
     include_in_schema=False)
-async def user_login_docs(user: User = Depends(dependency=check_user_not_logged_in),
-                          login_data: OAuth2PasswordRequestForm = Depends()) -> TokenSchema:
+async def user_login_docs(request: Request,
+                          user: User = Depends(dependency=check_user_not_logged_in),
+                          login_data: OAuth2PasswordRequestForm = Depends(),
+                          session: AsyncSession = Depends(dependency=get_session)) -> TokenSchema:
     """
     User login using swagger docs. It does the same as the /auth/login endpoint, so use /auth/login for production.
 
     Args:
+        request (Request): Request object.
         user (User, optional): User to not be logged in.
         login_data (OAuth2PasswordRequestForm, optional): User login data.
+        session (AsyncSession, optional): Session of the current request.
 
     Returns:
         TokenSchema: Access token and refresh token.
     """
-    return await user_login(user=user, login_data=LoginSchema(email=login_data.username, password=login_data.password))
+    return await user_login(request=request,
+                            user=user,
+                            login_data=LoginSchema(email=login_data.username, password=login_data.password),
+                            session=session)
 
 
 @router.post(
@@ -79,32 +88,53 @@ async def user_login_docs(user: User = Depends(dependency=check_user_not_logged_
                     }
                 }
             }
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message': 'Too many login attempts. Please try again later.',
+                        'error': 'Too Many Requests'
+                    }
+                }
+            }
         }
     })
-async def user_login(user: User = Depends(dependency=check_user_not_logged_in),
-                     login_data: LoginSchema = Body(default=..., description='User login data')) -> TokenSchema:
+async def user_login(request: Request,
+                     user: User = Depends(dependency=check_user_not_logged_in),
+                     login_data: LoginSchema = Body(default=..., description='User login data'),
+                     session: AsyncSession = Depends(dependency=get_session)) -> TokenSchema:
     """
     User login. Returns an access JWT tokens.
 
     Args:
+        request (Request): Request object.
         user (User): User to not be logged in.
         login_data (LoginSchema): User login data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         ValueError: If the user is already logged in.
+        TooManyRequestsException: If the client IP or the email have no login attempts left.
         InvalidCredentialsException: If the credentials are invalid.
 
     Returns:
         TokenSchema: Access token and refresh token.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    check_login_rate_limit(email=login_data.email, client_ip=request.client.host if request.client else None)
+
+    user_dal = AsyncUserDAL(session=session)
+
+    user = await user_dal.get_user_by_email(email=login_data.email)
+    if user is None:
+        raise InvalidCredentialsException(message=f'User with email {login_data.email} not found.')
 
-        user = user_dal.get_user_by_email(email=login_data.email)
-        if user is None:
-            raise InvalidCredentialsException(message=f'User with email {login_data.email} not found.')
+    if not await user.check_password(password=login_data.password):
+        raise InvalidCredentialsException(message=f'Incorrect password for user with email {login_data.email}.')
 
-        if not user.check_password(password=login_data.password):
-            raise InvalidCredentialsException(message=f'Incorrect password for user with email {login_data.email}.')
+    if user.password_needs_rehash():
+        hashed_password = await password_hashing_async(password=login_data.password)
+        await user_dal.rehash_user_password(user=user, hashed_password=hashed_password)
 
-        return create_token(user_id=user.id)
+    return create_token(user_id=user.id)
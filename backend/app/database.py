@@ -1,32 +1,81 @@
 """
 Database configuration file.
 """
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
-from sqlalchemy_utils import create_database as create_database_command
-from sqlalchemy_utils import database_exists, drop_database
 
 from app.settings import settings
+from app.utils.database import (InstrumentedAsyncQueuePool, InstrumentedQueuePool, RoutingSession,
+                                validate_idle_connections)
 
 url = f'mysql+pymysql://{settings.DB_USERNAME}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}'
 
-engine = create_engine(url=url, pool_pre_ping=True, pool_recycle=3600)
+# Idle time validation replaces the pre-ping of every checkout
+pool_arguments = {
+    'pool_size': settings.DB_POOL_SIZE,
+    'max_overflow': settings.DB_MAX_OVERFLOW,
+    'pool_timeout': settings.DB_POOL_TIMEOUT,
+    'pool_recycle': settings.DB_POOL_RECYCLE,
+    'pool_pre_ping': settings.DB_POOL_PRE_PING and not settings.DB_POOL_VALIDATION_IDLE_TIME,
+}
+
+engine = create_engine(url=url, poolclass=InstrumentedQueuePool, pool_logging_name='sync', **pool_arguments)
 
 session_maker = scoped_session(session_factory=sessionmaker(bind=engine, autocommit=False, autoflush=False))
 
+# Async engine used by the app routes, the sync engine is kept for scripts
+async_url = f'mysql+{settings.DB_ASYNC_DRIVER}://{settings.DB_USERNAME}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}'
+
+async_engine = create_async_engine(url=async_url,
+                                   poolclass=InstrumentedAsyncQueuePool,
+                                   pool_logging_name='primary',
+                                   **pool_arguments)
+
+# Read replicas used by the read-only DAL methods
+replica_engines = []
+for index, replica_host in enumerate(filter(None, (settings.DB_REPLICA_HOSTS or '').split(','))):
+    replica_host, _, replica_port = replica_host.strip().partition(':')
+    replica_url = f'mysql+{settings.DB_ASYNC_DRIVER}://{settings.DB_USERNAME}:{settings.DB_PASSWORD}@{replica_host}:{replica_port or settings.DB_PORT}/{settings.DB_NAME}'
+
+    replica_engines.append(
+        create_async_engine(url=replica_url,
+                            poolclass=InstrumentedAsyncQueuePool,
+                            pool_logging_name=f'replica-{index}',
+                            **pool_arguments))
+
+if settings.DB_POOL_VALIDATION_IDLE_TIME:
+    for validated_engine in (engine, async_engine, *replica_engines):
+        validate_idle_connections(engine=getattr(validated_engine, 'sync_engine', validated_engine),
+                                  idle_time=settings.DB_POOL_VALIDATION_IDLE_TIME)
+
+async_session_maker = async_sessionmaker(bind=async_engine,
+                                         sync_session_class=RoutingSession,
+                                         replicas=[replica_engine.sync_engine for replica_engine in replica_engines],
+                                         autoflush=False,
+                                         expire_on_commit=False)
+
 Base = declarative_base()
 
 
-def create_database() -> None:
+async def get_session() -> AsyncIterator[AsyncSession]:
     """
-    Create database tables.
+    Get the session of the current request. FastAPI caches the dependency per request, so the auth dependencies and
+    the route handler share the session. The DAL methods only flush their changes, the session is committed once when
+    the request ends, or rolled back if it fails. The API key dependency also commits the API key lookup before the
+    model call, so the connection is not held while the model answers.
+
+    Yields:
+        AsyncSession: Session of the current request.
     """
-    # Import all database models here
-    from app.users.models import ApiKey, User
+    async with async_session_maker() as session:
+        try:
+            yield session
+            await session.commit()
 
-    print('Creating database tables ...')
-    if database_exists(url=url):
-        drop_database(url=url)
+        except Exception:
+            await session.rollback()
+            raise
 
-    create_database_command(url=url)
-    Base.metadata.create_all(bind=engine)
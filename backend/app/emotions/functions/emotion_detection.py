@@ -1,14 +1,26 @@
 """
 This module contains the function to detect the emotion of the provided text.
 """
-from langchain.prompts import ChatPromptTemplate
-from langchain.pydantic_v1 import SecretStr
-from langchain_openai import ChatOpenAI
-
-from app.settings import settings
+from app.utils.llm import invoke_chat_model
+
+EMOTION_DETECTION_PROMPT = """
+    Detect the emotion of the provided passage. The passage can be with any language. The emotion name must be on
+    lowercase and in english.
+
+    For example:
+    - If the passage is "The sun is shining, and the birds are singing.", the output should be "positive".
+    - If the passage is "I cannot seem to find my keys anywhere.", the output should be "frustrated".
+    - If the passage is "The movie ending was unexpected and left me speechless.", the output should be "surprised".
+    - If the passage is "I miss the way things used to be.", the output should be "nostalgic".
+    - If the passage is "My heart is pounding, and my palms are sweaty.", the output should be "anxious".
+    - If the passage is "I cannot stop laughing at this joke.", the output should be "happy".
+
+    Passage:
+    {text}
+"""
 
 
-def emotion_detection(text: str) -> str:
+async def emotion_detection(text: str) -> str:
     """
     Detect the emotion of the given text.
 
@@ -18,23 +30,6 @@ def emotion_detection(text: str) -> str:
     Returns:
         str: Detected emotion of the text.
     """
-    client = ChatOpenAI(api_key=SecretStr(value=settings.OPENAI_API_KEY), model=settings.AI_MODEL)
-
-    prompt_template = ChatPromptTemplate.from_template(template="""
-        Detect the emotion of the provided passage. The passage can be with any language. The emotion name must be on
-        lowercase and in english.
-
-        For example:
-        - If the passage is "The sun is shining, and the birds are singing.", the output should be "positive".
-        - If the passage is "I cannot seem to find my keys anywhere.", the output should be "frustrated".
-        - If the passage is "The movie ending was unexpected and left me speechless.", the output should be "surprised".
-        - If the passage is "I miss the way things used to be.", the output should be "nostalgic".
-        - If the passage is "My heart is pounding, and my palms are sweaty.", the output should be "anxious".
-        - If the passage is "I cannot stop laughing at this joke.", the output should be "happy".
-
-        Passage:
-        {text}
-    """)
-
-    model_response = client.invoke(input=prompt_template.format_messages(text=text))
-    return model_response.content
+    prompt = EMOTION_DETECTION_PROMPT.format(text=text)
+
+    return await invoke_chat_model(operation='detect-emotion', messages=[{'role': 'user', 'content': prompt}])
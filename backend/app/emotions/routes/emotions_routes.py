@@ -37,6 +37,6 @@ async def detect_emotion_route(user: User = Depends(dependency=check_valid_api_k
     Returns:
         DetectedEmotion: Detected emotion.
     """
-    detected_emotion = emotion_detection(text=detect_emotion.text)
+    detected_emotion = await emotion_detection(text=detect_emotion.text)
 
     return DetectedEmotion(text=detect_emotion.text, emotion=detected_emotion)
@@ -1,13 +1,16 @@
 """
 This module contains error handlers for the app.
 """
+from math import ceil
+
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from app.app import app
-from app.utils.exceptions import (InvalidCredentialsException, NotFoundException, UserCannotBeLoggedInException,
-                                  ValidationException)
+from app.utils.exceptions import (DeadlineExceededException, InvalidCredentialsException, ModelUnavailableException,
+                                  NotFoundException, ServiceUnavailableException, TooManyRequestsException,
+                                  UserCannotBeLoggedInException, ValidationException)
 
 
 @app.exception_handler(exc_class_or_status_code=UserCannotBeLoggedInException)
@@ -108,6 +111,87 @@ async def handle_method_not_allowed_exception(request: Request, exception: HTTPE
                         })
 
 
+@app.exception_handler(exc_class_or_status_code=TooManyRequestsException)
+async def handle_too_many_requests_exception(request: Request, exception: TooManyRequestsException) -> JSONResponse:
+    """
+    Handle TooManyRequestsException.
+
+    Args:
+        request (Request): Request object.
+        exception (TooManyRequestsException): TooManyRequestsException object.
+
+    Returns:
+        JSONResponse: JSONResponse object.
+    """
+    return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                        headers={
+                            **exception.headers, 'Retry-After': str(max(1, ceil(exception.retry_after)))
+                        },
+                        content={
+                            'message': exception.message,
+                            'error': 'Too Many Requests'
+                        })
+
+
+@app.exception_handler(exc_class_or_status_code=ModelUnavailableException)
+async def handle_model_unavailable_exception(request: Request, exception: ModelUnavailableException) -> JSONResponse:
+    """
+    Handle ModelUnavailableException.
+
+    Args:
+        request (Request): Request object.
+        exception (ModelUnavailableException): ModelUnavailableException object.
+
+    Returns:
+        JSONResponse: JSONResponse object.
+    """
+    return JSONResponse(status_code=status.HTTP_502_BAD_GATEWAY,
+                        content={
+                            'message': exception.message,
+                            'error': 'Bad Gateway'
+                        })
+
+
+@app.exception_handler(exc_class_or_status_code=DeadlineExceededException)
+async def handle_deadline_exceeded_exception(request: Request, exception: DeadlineExceededException) -> JSONResponse:
+    """
+    Handle DeadlineExceededException.
+
+    Args:
+        request (Request): Request object.
+        exception (DeadlineExceededException): DeadlineExceededException object.
+
+    Returns:
+        JSONResponse: JSONResponse object.
+    """
+    return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                        content={
+                            'message': exception.message,
+                            'error': 'Gateway Timeout'
+                        })
+
+
+@app.exception_handler(exc_class_or_status_code=ServiceUnavailableException)
+async def handle_service_unavailable_exception(request: Request,
+                                               exception: ServiceUnavailableException) -> JSONResponse:
+    """
+    Handle ServiceUnavailableException.
+
+    Args:
+        request (Request): Request object.
+        exception (ServiceUnavailableException): ServiceUnavailableException object.
+
+    Returns:
+        JSONResponse: JSONResponse object.
+    """
+    return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        headers={'Retry-After': str(max(1, ceil(exception.retry_after)))},
+                        content={
+                            'message': exception.message,
+                            'error': 'Service Unavailable'
+                        })
+
+
 @app.exception_handler(exc_class_or_status_code=ValidationException)
 @app.exception_handler(exc_class_or_status_code=RequestValidationError)
 async def handle_validation_exception(request: Request,
@@ -0,0 +1 @@
+from .startup_warm_up import startup_warm_up, StartupWarmUp
@@ -0,0 +1,171 @@
+"""
+This module contains the warm-up of the worker resources that runs before the worker accepts traffic.
+"""
+from asyncio import gather, sleep, wait_for
+from logging import getLogger
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.database import async_engine, replica_engines
+from app.settings import settings
+from app.translate.models import TextToTranslate
+from app.utils.cryptography import hashing_executor, legacy_api_key_lookup, password_hashing, password_needs_rehash
+from app.utils.llm import get_model_engine
+from app.utils.metrics import metrics
+
+logger = getLogger(__name__)
+
+metrics.describe(name='warm_up_duration_seconds', description='Time spent warming up a worker resource.')
+metrics.describe(name='warm_up_failures_total', description='Failed warm-ups of a worker resource.')
+metrics.describe(name='ready', description='1 if the worker is ready to accept traffic, 0 otherwise.')
+
+# Warm-ups that must succeed before the worker is ready, the rest only make the first requests faster
+REQUIRED_CHECKS = ('database', )
+
+
+async def warm_up_engine(engine: AsyncEngine) -> None:
+    """
+    Open the pool connections of the engine, so the first requests do not pay for the connection and authentication.
+
+    Args:
+        engine (AsyncEngine): Database engine.
+    """
+
+    async def connect() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+    # The connections are opened at the same time, so each one is a different pool connection
+    await gather(*(connect() for _ in range(settings.DB_POOL_SIZE)))
+
+
+async def warm_up_database() -> None:
+    """
+    Open the pool connections of the primary and the read replicas.
+    """
+    await gather(*(warm_up_engine(engine=engine) for engine in (async_engine, *replica_engines)))
+
+
+async def warm_up_model() -> None:
+    """
+    Build the model engine, importing its client library, and open its connection to the provider.
+    """
+    await get_model_engine().warm_up()
+
+
+async def warm_up_hashing() -> None:
+    """
+    Start the hashing processes, and import argon2 in the server worker too, where it checks the parameters of the
+    stored hashes.
+    """
+    await hashing_executor.warm_up(password_hashing, 'warm-up')
+    password_needs_rehash(hashed_password='')
+
+
+async def warm_up_legacy_api_keys() -> None:
+    """
+    Check if API keys hashed with argon2 still exist, so the unknown API keys are only hashed with argon2 while they do.
+    """
+    await legacy_api_key_lookup.check()
+
+
+async def warm_up_languages() -> None:
+    """
+    Load the language tags data used to validate the languages of the requests.
+    """
+    TextToTranslate(text='warm-up', language='en-US')
+
+
+class StartupWarmUp():
+    """
+    Warms up the database pool, the model engine, the hashing processes and the language data, and checks for legacy
+    API keys, before the worker accepts traffic. The failed warm-ups are retried in the background, and the worker is
+    ready once the required ones succeed. The readiness is kept in memory, so the probes do not touch the database.
+    """
+    __warm_ups: dict[str, Callable[[], Awaitable[None]]]
+    __checks: dict[str, bool]
+
+    def __init__(self) -> None:
+        """
+        Create a new StartupWarmUp instance with every warm-up pending.
+        """
+        self.__warm_ups = {
+            'database': warm_up_database,
+            'model': warm_up_model,
+            'hashing': warm_up_hashing,
+            'languages': warm_up_languages,
+            'legacy_api_keys': warm_up_legacy_api_keys,
+        }
+        self.__checks = {name: False for name in self.__warm_ups}
+
+    @property
+    def checks(self) -> dict[str, bool]:
+        """
+        Get the result of every warm-up.
+
+        Returns:
+            dict[str, bool]: True by warm-up name if it succeeded, False otherwise.
+        """
+        return self.__checks.copy()
+
+    @property
+    def ready(self) -> bool:
+        """
+        Check if the worker is ready to accept traffic.
+
+        Returns:
+            bool: True if the required warm-ups succeeded, False otherwise.
+        """
+        return all(self.__checks[name] for name in REQUIRED_CHECKS)
+
+    @property
+    def completed(self) -> bool:
+        """
+        Check if every warm-up succeeded.
+
+        Returns:
+            bool: True if every warm-up succeeded, False otherwise.
+        """
+        return all(self.__checks.values())
+
+    async def __warm_up(self, name: str) -> None:
+        """
+        Run a warm-up and store its result. The failures are logged, not raised.
+
+        Args:
+            name (str): Warm-up name.
+        """
+        start = perf_counter()
+        try:
+            await wait_for(self.__warm_ups[name](), timeout=settings.WARM_UP_TIMEOUT)
+            self.__checks[name] = True
+
+        except Exception:
+            metrics.increment(name='warm_up_failures_total', labels={'resource': name})
+            logger.exception('Could not warm up the %s, it will be retried.', name)
+
+        finally:
+            metrics.observe(name='warm_up_duration_seconds',
+                            value=perf_counter() - start,
+                            labels={'resource': name})
+
+    async def run(self) -> None:
+        """
+        Run the pending warm-ups at the same time.
+        """
+        await gather(*(self.__warm_up(name=name) for name, succeeded in self.__checks.items() if not succeeded))
+        metrics.set_gauge(name='ready', value=int(self.ready))
+
+    async def retry(self) -> None:
+        """
+        Retry the failed warm-ups every WARM_UP_RETRY_INTERVAL seconds until all of them succeed.
+        """
+        while not self.completed:
+            await sleep(settings.WARM_UP_RETRY_INTERVAL)
+            await self.run()
+
+
+startup_warm_up = StartupWarmUp()
@@ -0,0 +1 @@
+from .health_schema import Health
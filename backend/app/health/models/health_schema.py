@@ -0,0 +1,22 @@
+"""
+Health schema.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Health(BaseModel):
+    """
+    Health schema.
+    """
+    status: str = Field(default=..., description='Status of the worker.', examples=['ready'])
+
+    checks: dict[str, bool] = Field(default=...,
+                                    description='Result of the warm-up of every worker resource.',
+                                    examples=[{
+                                        'database': True,
+                                        'model': True,
+                                        'hashing': True,
+                                        'languages': True
+                                    }])
+
+    model_config = ConfigDict(extra='forbid')
@@ -0,0 +1 @@
+from .health_routes import router
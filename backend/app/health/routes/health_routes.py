@@ -0,0 +1,65 @@
+"""
+Health probes routes.
+"""
+from fastapi import APIRouter, status
+
+from app.health.functions import startup_warm_up
+from app.health.models import Health
+from app.settings import settings
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.models import ErrorSchema
+
+router = APIRouter()
+
+
+@router.get(path='/live',
+            summary='Liveness probe.',
+            description='Check that the worker is running. It does not check any dependency.',
+            status_code=status.HTTP_200_OK,
+            response_model=Health)
+async def liveness_route() -> Health:
+    """
+    Check that the worker is running.
+
+    Returns:
+        Health: Worker status.
+    """
+    return Health(status='alive', checks=startup_warm_up.checks)
+
+
+@router.get(path='/ready',
+            summary='Readiness probe.',
+            description='Check that the worker finished its warm-up and can accept traffic. The result of the warm-up '
+            'is kept in memory, so the probe does not touch the database.',
+            responses={
+                status.HTTP_200_OK: {
+                    'model': Health,
+                },
+                status.HTTP_503_SERVICE_UNAVAILABLE: {
+                    'model': ErrorSchema,
+                    'content': {
+                        'application/json': {
+                            'example': {
+                                'message': 'The worker is not ready. Failed warm-ups: database.',
+                                'error': 'Service Unavailable'
+                            }
+                        }
+                    }
+                }
+            })
+async def readiness_route() -> Health:
+    """
+    Check that the worker finished its warm-up and can accept traffic.
+
+    Raises:
+        ServiceUnavailableException: If the required warm-ups did not succeed.
+
+    Returns:
+        Health: Worker status.
+    """
+    if not startup_warm_up.ready:
+        failed_checks = ', '.join(name for name, succeeded in startup_warm_up.checks.items() if not succeeded)
+        raise ServiceUnavailableException(message=f'The worker is not ready. Failed warm-ups: {failed_checks}.',
+                                          retry_after=settings.WARM_UP_RETRY_INTERVAL)
+
+    return Health(status='ready', checks=startup_warm_up.checks)
@@ -0,0 +1,9 @@
+from .api_key_priority import add_api_key_priority
+from .api_key_priority_reset import reset_api_key_priority
+from .api_key_usage import create_api_key_usage_table
+from .api_key_user_creation_index import add_api_key_user_creation_index
+from .binary_uuid_keys import migrate_binary_uuid_keys
+from .initial_schema import create_initial_schema
+from .migration_runner import MIGRATIONS, run_migrations
+from .schema_version_model import SchemaVersion
+from .translation_jobs import create_translation_job_tables
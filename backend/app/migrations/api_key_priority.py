@@ -0,0 +1,18 @@
+"""
+Migration that adds the scheduling priority of the model calls to the ApiKey table.
+"""
+from sqlalchemy import Connection, text
+
+from .schema_inspection import get_column_type
+
+
+def add_api_key_priority(connection: Connection) -> None:
+    """
+    Add the priority column of the ApiKey table, the existing API keys get the standard priority.
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    if get_column_type(connection=connection, table='ApiKey', column='priority') is None:
+        connection.execute(
+            text("ALTER TABLE `ApiKey` ADD COLUMN `priority` VARCHAR(16) NOT NULL DEFAULT 'standard' AFTER `user_id`"))
@@ -0,0 +1,22 @@
+"""
+Migration that resets the interactive priority the API key owners set to their own API keys.
+"""
+from sqlalchemy import Connection, text
+
+from app.settings import Priority
+
+
+def reset_api_key_priority(connection: Connection) -> None:
+    """
+    Give the standard priority to the interactive API keys. Their owners chose the priority when the keys were created
+    or updated, and it is now only set by the administrators with set_api_key_priority.py. The bulk API keys are kept,
+    as they only lower the priority of their owners.
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    connection.execute(text('UPDATE `ApiKey` SET `priority` = :standard WHERE `priority` = :interactive'),
+                       parameters={
+                           'standard': Priority.STANDARD.value,
+                           'interactive': Priority.INTERACTIVE.value
+                       })
@@ -0,0 +1,16 @@
+"""
+Migration that creates the table of the API key usage rollups.
+"""
+from sqlalchemy import Connection
+
+
+def create_api_key_usage_table(connection: Connection) -> None:
+    """
+    Create the ApiKeyUsage table.
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    from app.usage.models import ApiKeyUsage
+
+    ApiKeyUsage.__table__.create(bind=connection, checkfirst=True)
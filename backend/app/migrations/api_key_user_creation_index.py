@@ -0,0 +1,21 @@
+"""
+Migration that replaces the ApiKey user index with the composite index used by the keyset pagination.
+"""
+from sqlalchemy import Connection, text
+
+from .schema_inspection import index_exists
+
+
+def add_api_key_user_creation_index(connection: Connection) -> None:
+    """
+    Create the (user_id, creation_date, id) index of the ApiKey table and drop the user_id index it makes redundant.
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    if not index_exists(connection=connection, table='ApiKey', index='api_key_user_creation_index'):
+        connection.execute(
+            text('CREATE INDEX `api_key_user_creation_index` ON `ApiKey` (`user_id`, `creation_date`, `id`)'))
+
+    if index_exists(connection=connection, table='ApiKey', index='api_key_user_index'):
+        connection.execute(text('DROP INDEX `api_key_user_index` ON `ApiKey`'))
@@ -0,0 +1,117 @@
+"""
+Migration of the User and ApiKey keys, and of every column that references them, from CHAR(36) text to BINARY(16),
+with the duplicate indexes removed and the foreign keys of the models recreated with their ON DELETE rules.
+"""
+from itertools import groupby
+
+from sqlalchemy import Connection, text
+
+from app.database import Base
+
+from .schema_inspection import get_column_type, get_referencing_foreign_keys, index_exists, is_column_nullable
+
+# Tables whose UUID primary keys are converted to BINARY(16), along with the columns that reference them
+REFERENCED_TABLES = ('User', 'ApiKey')
+
+# Table and name of the indexes that duplicate another index of the same column
+DUPLICATE_INDEXES = (('User', 'user_email_index'), ('ApiKey', 'ix_ApiKey_secret_key'))
+
+
+def get_model_foreign_keys() -> dict[tuple[str, str], tuple[str | None, str, str, str | None]]:
+    """
+    Get the foreign keys of the models that reference the converted tables.
+
+    Returns:
+        dict[tuple[str, str], tuple[str | None, str, str, str | None]]: Name, referenced table, referenced column and
+        ON DELETE rule of the foreign keys, by table and column.
+    """
+    # Import all database models here
+    from app.translate.models import TranslationJob, TranslationJobChunk
+    from app.usage.models import ApiKeyUsage
+    from app.users.models import ApiKey, User
+
+    return {(table.name, foreign_key.parent.name): (foreign_key.constraint.name, foreign_key.column.table.name,
+                                                    foreign_key.column.name, foreign_key.ondelete)
+            for table in Base.metadata.sorted_tables
+            for foreign_key in table.foreign_keys
+            if foreign_key.column.table.name in REFERENCED_TABLES}
+
+
+def convert_column(connection: Connection, table: str, column: str) -> None:
+    """
+    Convert a CHAR(36) or VARCHAR(36) UUID column to BINARY(16) through VARBINARY(36), keeping its nullability. A
+    VARBINARY column was left by a failed conversion, so only its values that are still 36 characters long are
+    converted before it is finished. Missing and already converted columns are skipped.
+
+    Args:
+        connection (Connection): Database connection.
+        table (str): Table name.
+        column (str): Column name.
+    """
+    column_type = get_column_type(connection=connection, table=table, column=column)
+    if column_type not in ('char', 'varchar', 'varbinary'):
+        return
+
+    null = 'NULL' if is_column_nullable(connection=connection, table=table, column=column) else 'NOT NULL'
+    if column_type != 'varbinary':
+        connection.execute(text(f'ALTER TABLE `{table}` MODIFY `{column}` VARBINARY(36) {null}'))
+
+    connection.execute(
+        text(f"UPDATE `{table}` SET `{column}` = UNHEX(REPLACE(`{column}`, '-', '')) WHERE LENGTH(`{column}`) = 36"))
+    connection.execute(text(f'ALTER TABLE `{table}` MODIFY `{column}` BINARY(16) {null}'))
+
+
+def migrate_binary_uuid_keys(connection: Connection) -> None:
+    """
+    Convert the UUID keys, and the columns that reference them, to BINARY(16), drop the duplicate indexes and
+    recreate the foreign keys. Every foreign key that references the converted tables is dropped first, as MySQL does
+    not change the type of a referenced column. The foreign keys of the models are recreated as the models define
+    them, such as with ON DELETE CASCADE, and any other foreign key as it was. Missing tables, already converted
+    columns and already dropped indexes are skipped, and partly converted columns are finished, so it can be run again
+    after a failure.
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    model_foreign_keys = get_model_foreign_keys()
+
+    # Foreign key columns by table and foreign key name
+    foreign_keys = {
+        key: list(rows)
+        for key, rows in groupby(get_referencing_foreign_keys(connection=connection,
+                                                              referenced_tables=list(REFERENCED_TABLES)),
+                                 key=lambda row: (row.table_name, row.name))
+    }
+    for table, name in foreign_keys:
+        connection.execute(text(f'ALTER TABLE `{table}` DROP FOREIGN KEY `{name}`'))
+
+    columns = {(table, 'id') for table in REFERENCED_TABLES} | set(model_foreign_keys)
+    columns |= {(row.table_name, row.column_name)
+                for rows in foreign_keys.values()
+                for row in rows
+                if row.referenced_column == 'id'}
+    for table, column in sorted(columns):
+        convert_column(connection=connection, table=table, column=column)
+
+    for table, index in DUPLICATE_INDEXES:
+        if index_exists(connection=connection, table=table, index=index):
+            connection.execute(text(f'DROP INDEX `{index}` ON `{table}`'))
+
+    for (table, column), (name, referenced_table, referenced_column, on_delete) in model_foreign_keys.items():
+        if get_column_type(connection=connection, table=table, column=column) is not None:
+            constraint = f'CONSTRAINT `{name}` ' if name is not None else ''
+            connection.execute(
+                text(f'ALTER TABLE `{table}` ADD {constraint}FOREIGN KEY (`{column}`) '
+                     f'REFERENCES `{referenced_table}` (`{referenced_column}`)' +
+                     (f' ON DELETE {on_delete}' if on_delete is not None else '')))
+
+    for (table, name), rows in foreign_keys.items():
+        if len(rows) == 1 and (table, rows[0].column_name) in model_foreign_keys:
+            continue
+
+        column_names = ', '.join(f'`{row.column_name}`' for row in rows)
+        referenced_column_names = ', '.join(f'`{row.referenced_column}`' for row in rows)
+        connection.execute(
+            text(f'ALTER TABLE `{table}` ADD CONSTRAINT `{name}` FOREIGN KEY ({column_names}) '
+                 f'REFERENCES `{rows[0].referenced_table}` ({referenced_column_names}) '
+                 f'ON DELETE {rows[0].delete_rule} ON UPDATE {rows[0].update_rule}'))
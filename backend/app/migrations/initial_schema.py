@@ -0,0 +1,20 @@
+"""
+Migration that creates the tables of a new database.
+"""
+from sqlalchemy import Connection
+
+from app.database import Base
+
+
+def create_initial_schema(connection: Connection) -> None:
+    """
+    Create the missing User and ApiKey tables with the current models. Existing tables are not changed, the next
+    migration steps bring the tables created by older versions up to date. The tables added later are created by
+    their own steps, after the keys they reference are converted to BINARY(16).
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    from app.users.models import ApiKey, User
+
+    Base.metadata.create_all(bind=connection, tables=[User.__table__, ApiKey.__table__], checkfirst=True)
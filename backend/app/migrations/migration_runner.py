@@ -0,0 +1,79 @@
+"""
+This module contains the versioned migration runner executed before the app starts.
+"""
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import Connection, func, insert, select, text
+from sqlalchemy_utils import create_database, database_exists
+
+from app.database import engine, url
+from app.settings import settings
+
+from .api_key_priority import add_api_key_priority
+from .api_key_priority_reset import reset_api_key_priority
+from .api_key_usage import create_api_key_usage_table
+from .api_key_user_creation_index import add_api_key_user_creation_index
+from .binary_uuid_keys import migrate_binary_uuid_keys
+from .initial_schema import create_initial_schema
+from .schema_version_model import SchemaVersion
+from .translation_jobs import create_translation_job_tables
+
+# Version, name and function of every migration step, in order. Steps must be idempotent because the first step
+# creates the User and ApiKey tables with the current models on new databases, so the following steps also run
+# against up to date tables. New tables are created by their own steps, added at the end.
+MIGRATIONS: tuple[tuple[int, str, Callable[[Connection], None]], ...] = (
+    (1, 'initial schema', create_initial_schema),
+    (2, 'binary uuid keys', migrate_binary_uuid_keys),
+    (3, 'api key user creation index', add_api_key_user_creation_index),
+    (4, 'api key priority', add_api_key_priority),
+    (5, 'translation jobs', create_translation_job_tables),
+    (6, 'api key usage', create_api_key_usage_table),
+    (7, 'api key priority reset', reset_api_key_priority),
+)
+
+# Name of the database lock held while the migrations run
+MIGRATIONS_LOCK = 'insight_lang_migrations'
+
+
+def run_migrations() -> None:
+    """
+    Apply the pending migration steps. A database lock is held while the steps run, so several replicas can start at
+    the same time, and each step is recorded in the SchemaVersion table when it finishes. If the database is up to
+    date, only the current version is read.
+
+    Raises:
+        RuntimeError: If the migrations lock is not acquired in MIGRATIONS_LOCK_TIMEOUT seconds.
+    """
+    if not database_exists(url=url):
+        print('Creating database ...')
+        create_database(url=url)
+
+    with engine.connect() as connection:
+        acquired = connection.scalar(text('SELECT GET_LOCK(:name, :timeout)'),
+                                     parameters={
+                                         'name': MIGRATIONS_LOCK,
+                                         'timeout': settings.MIGRATIONS_LOCK_TIMEOUT
+                                     })
+        if acquired != 1:
+            raise RuntimeError(f'Migrations lock not acquired in {settings.MIGRATIONS_LOCK_TIMEOUT} seconds.')
+
+        try:
+            SchemaVersion.__table__.create(bind=connection, checkfirst=True)
+            connection.commit()
+
+            current_version = connection.scalar(select(func.max(SchemaVersion.version))) or 0
+            for version, name, migration in MIGRATIONS:
+                if version <= current_version:
+                    continue
+
+                print(f'Applying migration {version} ({name}) ...')
+                migration(connection)
+                connection.execute(
+                    insert(SchemaVersion).values(version=version,
+                                                 name=name,
+                                                 applied_date=datetime.now(tz=timezone.utc)))
+                connection.commit()
+
+        finally:
+            connection.execute(text('SELECT RELEASE_LOCK(:name)'), parameters={'name': MIGRATIONS_LOCK})
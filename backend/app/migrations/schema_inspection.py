@@ -0,0 +1,91 @@
+"""
+This module contains the queries of the current schema used by the migration steps.
+"""
+from sqlalchemy import bindparam, Connection, Row, text
+
+
+def get_referencing_foreign_keys(connection: Connection, referenced_tables: list[str]) -> list[Row]:
+    """
+    Get the foreign keys that reference any of the tables, with one row per foreign key column.
+
+    Args:
+        connection (Connection): Database connection.
+        referenced_tables (list[str]): Names of the referenced tables.
+
+    Returns:
+        list[Row]: Name, table, column, referenced table, referenced column, delete rule and update rule of the
+        foreign key columns, ordered by foreign key and column position.
+    """
+    return list(
+        connection.execute(
+            text('SELECT rc.CONSTRAINT_NAME AS name, rc.TABLE_NAME AS table_name, kcu.COLUMN_NAME AS column_name, '
+                 'rc.REFERENCED_TABLE_NAME AS referenced_table, kcu.REFERENCED_COLUMN_NAME AS referenced_column, '
+                 'rc.DELETE_RULE AS delete_rule, rc.UPDATE_RULE AS update_rule '
+                 'FROM information_schema.REFERENTIAL_CONSTRAINTS rc '
+                 'JOIN information_schema.KEY_COLUMN_USAGE kcu ON kcu.CONSTRAINT_SCHEMA = rc.CONSTRAINT_SCHEMA '
+                 'AND kcu.TABLE_NAME = rc.TABLE_NAME AND kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME '
+                 'WHERE rc.CONSTRAINT_SCHEMA = DATABASE() AND rc.REFERENCED_TABLE_NAME IN :referenced_tables '
+                 'ORDER BY rc.TABLE_NAME, rc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION').bindparams(
+                     bindparam('referenced_tables', expanding=True)),
+            parameters={'referenced_tables': referenced_tables}))
+
+
+def get_column_type(connection: Connection, table: str, column: str) -> str | None:
+    """
+    Get the data type of a column.
+
+    Args:
+        connection (Connection): Database connection.
+        table (str): Table name.
+        column (str): Column name.
+
+    Returns:
+        str | None: Data type of the column, None if the column does not exist.
+    """
+    return connection.scalar(text('SELECT DATA_TYPE FROM information_schema.COLUMNS '
+                                  'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column'),
+                             parameters={
+                                 'table': table,
+                                 'column': column
+                             })
+
+
+def is_column_nullable(connection: Connection, table: str, column: str) -> bool:
+    """
+    Check if a column accepts NULL values.
+
+    Args:
+        connection (Connection): Database connection.
+        table (str): Table name.
+        column (str): Column name.
+
+    Returns:
+        bool: True if the column is nullable, False otherwise.
+    """
+    return connection.scalar(text('SELECT IS_NULLABLE FROM information_schema.COLUMNS '
+                                  'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column'),
+                             parameters={
+                                 'table': table,
+                                 'column': column
+                             }) == 'YES'
+
+
+def index_exists(connection: Connection, table: str, index: str) -> bool:
+    """
+    Check if an index exists.
+
+    Args:
+        connection (Connection): Database connection.
+        table (str): Table name.
+        index (str): Index name.
+
+    Returns:
+        bool: True if the index exists, False otherwise.
+    """
+    return connection.scalar(text('SELECT COUNT(*) FROM information_schema.STATISTICS '
+                                  'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :index'),
+                             parameters={
+                                 'table': table,
+                                 'index': index
+                             }) > 0
+
@@ -0,0 +1,52 @@
+"""
+SchemaVersion DB model.
+"""
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.ext.hybrid import hybrid_property
+
+from app.database import Base
+
+
+class SchemaVersion(Base):
+    """
+    Migration step applied to the database.
+    """
+    __tablename__ = 'SchemaVersion'
+
+    # Version reached after the step
+    __version = Column('version', Integer, primary_key=True, autoincrement=False)
+
+    # Name of the step
+    __name = Column('name', String(length=128), nullable=False)
+
+    # Date when the step was applied
+    __applied_date = Column('applied_date', DateTime, nullable=False)
+
+    def __init__(self, version: int, name: str) -> None:
+        """
+        Create a new applied migration step.
+
+        Args:
+            version (int): Version reached after the step.
+            name (str): Name of the step.
+        """
+        self.__version = version
+        self.__name = name
+        self.__applied_date = datetime.now(tz=timezone.utc)
+
+    @hybrid_property
+    def version(self) -> int:
+        """
+        Get the version reached after the step.
+
+        Returns:
+            int: Version reached after the step.
+        """
+        return self.__version
+
+    @version.setter
+    def version(self, value: Any) -> None:
+        raise AttributeError('SchemaVersion version is a read-only attribute.')
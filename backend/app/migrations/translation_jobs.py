@@ -0,0 +1,17 @@
+"""
+Migration that creates the tables of the asynchronous translation jobs.
+"""
+from sqlalchemy import Connection
+
+
+def create_translation_job_tables(connection: Connection) -> None:
+    """
+    Create the TranslationJob and TranslationJobChunk tables.
+
+    Args:
+        connection (Connection): Database connection.
+    """
+    from app.translate.models import TranslationJob, TranslationJobChunk
+
+    TranslationJob.__table__.create(bind=connection, checkfirst=True)
+    TranslationJobChunk.__table__.create(bind=connection, checkfirst=True)
@@ -4,7 +4,7 @@ Settings module for the app.
 from enum import StrEnum, unique
 
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 load_dotenv(override=True)
 
@@ -18,6 +18,25 @@ class Tags(StrEnum):
     EMOTIONS = 'Emotions'
 
 
+@unique
+class AIEngine(StrEnum):
+    LANGCHAIN = 'langchain'
+    OPENAI_HTTP = 'openai-http'
+
+
+@unique
+class Priority(StrEnum):
+    INTERACTIVE = 'interactive'
+    STANDARD = 'standard'
+    BULK = 'bulk'
+
+
+@unique
+class Environment(StrEnum):
+    DEVELOPMENT = 'development'
+    PRODUCTION = 'production'
+
+
 class Settings(BaseSettings):
     """
     Settings class for the app.
@@ -27,9 +46,33 @@ class Settings(BaseSettings):
     APP_VERSION: str
 
     # Backend Variables
+    ENVIRONMENT: Environment = Environment.DEVELOPMENT  # development reloads on changes, production runs workers
     BACKEND_PORT: int
     AI_MODEL: str
     OPENAI_API_KEY: str
+    AI_ENGINE: AIEngine = AIEngine.LANGCHAIN  # langchain or openai-http, the native OpenAI compatible HTTP client
+    AI_BASE_URL: str = 'https://api.openai.com/v1'  # any OpenAI compatible chat completions API
+    AI_TIMEOUT: float = 60  # seconds waiting for the model
+    AI_MAX_CONNECTIONS: int = 100  # open connections to the model provider per worker
+    AI_MAX_RETRIES: int = 2  # retries of the transient model provider failures
+    AI_MAX_CONCURRENT_CALLS: int | None = None  # model calls per worker, defaults to AI_MAX_CONNECTIONS
+    AI_MAX_QUEUED_CALLS: int = 256  # model calls waiting for a slot, the rest are rejected
+    AI_MAX_QUEUED_CALLS_PER_USER: int = 64  # model calls of a user waiting for a slot, the rest are rejected
+    AI_STANDARD_MAX_SHARE: float = 0.8  # share of the model call slots used by the standard and bulk API keys
+    AI_BULK_MAX_SHARE: float = 0.5  # share of the model call slots used by the bulk API keys
+    USAGE_FLUSH_INTERVAL: int = 60  # seconds
+    WARM_UP_TIMEOUT: float = 30  # seconds each warm-up can delay the startup of a worker
+    WARM_UP_RETRY_INTERVAL: float = 5  # seconds between retries of the failed warm-ups
+
+    ## Production Server Variables
+    WORKERS: int | None = None  # defaults to the number of CPUs
+    KEEP_ALIVE_TIMEOUT: int = 65  # seconds, longer than the idle timeout of the load balancer
+    BACKLOG: int = 2048  # pending connections waiting to be accepted
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 60  # seconds the in-flight requests have to finish after SIGTERM
+
+    ## Load Shedding Variables, 0 disables the limit
+    LOAD_SHEDDING_MAX_LOOP_LAG: float = 0.5  # seconds, the model routes are shed above it and the rest above twice it
+    LOAD_SHEDDING_MAX_IN_FLIGHT: int = 0  # in-flight requests per route group and worker
 
     # Security Variables
     SECRET_KEY: str
@@ -40,6 +83,14 @@ class Settings(BaseSettings):
     HASHING_MEMORY_COST: int
     HASHING_PARALLELISM: int
     HASHING_HASH_LENGTH: int
+    HASHING_WORKERS: int | None = None  # per server worker, defaults to the number of CPUs
+    HASHING_MAX_CONCURRENCY: int | None = None  # defaults to HASHING_WORKERS
+    HASHING_MAX_QUEUE: int = 64
+    API_KEY_LEGACY_HASHING: bool = True  # find the API keys hashed with argon2 before HMAC-SHA256, False expires them
+
+    ## Login Throttling Variables
+    LOGIN_EMAIL_RATE_LIMIT: int = 5  # attempts per minute, 0 disables the limit
+    LOGIN_IP_RATE_LIMIT: int = 20  # attempts per minute, 0 disables the limit
 
     ## Password Requirements
     PASSWORD_MIN_UPPERCASE_LETTERS: int
@@ -48,12 +99,54 @@ class Settings(BaseSettings):
     PASSWORD_MIN_SPECIAL_CHARACTERS: int
     PASSWORD_VALID_SPECIAL_CHARACTERS: str
 
+    ## API Key Rate Limits, 0 disables the limit
+    API_KEY_RATE_LIMIT: int = 0  # requests per second
+    API_KEY_MAX_CONCURRENT_REQUESTS: int = 0
+    API_KEY_DAILY_INPUT_TOKENS: int = 0
+    USER_RATE_LIMIT: int = 0  # requests per second
+    USER_MAX_CONCURRENT_REQUESTS: int = 0
+    USER_DAILY_INPUT_TOKENS: int = 0
+    RATE_LIMIT_REDIS_URL: str | None = None  # share the limits across workers, in-memory if not set
+
+    ## Idempotency Variables
+    IDEMPOTENCY_TTL: int = 86400  # seconds a completed response is replayed
+    IDEMPOTENCY_LOCK_TTL: float = 600  # seconds a request in progress keeps its key, longer than the slowest request
+    IDEMPOTENCY_WAIT_TIMEOUT: float = 60  # seconds a repeat waits for the original request
+    IDEMPOTENCY_MAX_KEYS: int = 10000  # stored responses per worker when they are kept in memory
+    IDEMPOTENCY_REDIS_URL: str | None = None  # share the keys across workers, in-memory if not set
+
+    ## Translation Job Variables
+    TRANSLATION_JOB_WORKERS: int = 4  # jobs processed at the same time per worker
+    TRANSLATION_JOB_CHUNK_SIZE: int = 4000  # characters translated per model call
+    TRANSLATION_JOB_MAX_TEXT_LENGTH: int = 1000000  # characters
+    TRANSLATION_JOB_MAX_PENDING_PER_USER: int = 10  # unfinished jobs per user, the rest are rejected
+    TRANSLATION_JOB_POLL_INTERVAL: float = 5  # seconds between checks for new and abandoned jobs
+    TRANSLATION_JOB_LEASE: float = 300  # seconds a job is owned by a worker without progress
+    TRANSLATION_JOB_MAX_ATTEMPTS: int = 5  # attempts without progress before a job fails
+    TRANSLATION_JOB_CALLBACK_TIMEOUT: float = 10  # seconds
+
     # Database Variables
     DB_USERNAME: str
     DB_PASSWORD: str
     DB_HOST: str
     DB_PORT: int
     DB_NAME: str
+    DB_ASYNC_DRIVER: str = 'aiomysql'
+    MIGRATIONS_LOCK_TIMEOUT: int = 60  # seconds waiting for another replica to finish the migrations
+    DB_REPLICA_HOSTS: str | None = None  # comma separated host[:port] of the read replicas
+    DB_READ_YOUR_WRITES_TTL: float = 5  # seconds the reads of a user go to the primary after the user writes
+    DB_READ_YOUR_WRITES_REDIS_URL: str | None = None  # share the writes across workers, in-memory if not set
+
+    # Database Pool Variables
+    DB_POOL_SIZE: int = 5  # connections kept open per worker
+    DB_MAX_OVERFLOW: int = 10  # connections opened above the pool size under load
+    DB_POOL_TIMEOUT: float = 30  # seconds waiting for a connection
+    DB_POOL_RECYCLE: int = 3600  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True  # ping every connection on checkout
+    DB_POOL_VALIDATION_IDLE_TIME: float = 0  # ping only connections idle for these seconds instead, 0 disables
+    DB_POOL_SLOW_CHECKOUT: float = 0.1  # seconds after which a checkout is logged as slow
+
+    model_config = SettingsConfigDict(env_ignore_empty=True)
 
 
 settings = Settings()  # Automatically loads settings from .env file
@@ -0,0 +1 @@
+from .translation_job_dal import TranslationJobDAL
@@ -0,0 +1,274 @@
+"""
+Translation Job Data Access Layer
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import ColumnElement, func, insert, or_, Row, select, text, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.translate.models import TranslationJob, TranslationJobChunk, TranslationJobStatus
+from app.users.models import User
+from app.utils.database import primary_stickiness, read_only
+
+
+class TranslationJobDAL():
+    __session: AsyncSession
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Create a new TranslationJobDAL instance.
+
+        Args:
+            session (AsyncSession): Async database session.
+        """
+        self.__session = session
+
+    @staticmethod
+    def __lease_until(seconds: float) -> ColumnElement[datetime]:
+        """
+        Get the date the given seconds from now, with the database clock, so the leases of all the workers use the
+        same clock.
+
+        Args:
+            seconds (float): Seconds from now.
+
+        Returns:
+            ColumnElement[datetime]: SQL expression of the date.
+        """
+        return func.timestampadd(text('MICROSECOND'), int(seconds * 1_000_000), func.utc_timestamp(6))
+
+    async def create_job(self, user: User, api_key_id: UUID | None, language: str, callback_url: str | None,
+                         chunks: list[tuple[str, str]]) -> TranslationJob:
+        """
+        Create a new queued translation job with its chunks, using a single multi-row insert for the chunks.
+
+        Args:
+            user (User): User who owns the job.
+            api_key_id (UUID | None): ID of the API key that created the job.
+            language (str): Language of the translation as BCP 47 standard.
+            callback_url (str | None): URL that receives the job when it finishes.
+            chunks (list[tuple[str, str]]): Chunks of the text and the whitespace after each one.
+
+        Returns:
+            TranslationJob: Created translation job.
+        """
+        job = TranslationJob(user_id=user.id,
+                             api_key_id=api_key_id,
+                             language=language,
+                             callback_url=callback_url,
+                             total_chunks=len(chunks))
+
+        self.__session.add(instance=job)
+        await self.__session.flush()
+        await self.__session.execute(
+            insert(TranslationJobChunk.__table__).values([{
+                'job_id': job.id,
+                'position': position,
+                'text': chunk,
+                'separator': separator,
+                'translated_text': None,
+            } for position, (chunk, separator) in enumerate(chunks)]))
+        await primary_stickiness.record_write(key=str(user.id))
+
+        return job
+
+    async def count_pending_jobs(self, user: User) -> int:
+        """
+        Count the unfinished translation jobs of a user.
+
+        Args:
+            user (User): User who owns the jobs.
+
+        Returns:
+            int: Number of unfinished jobs.
+        """
+        return await self.__session.scalar(
+            select(func.count()).select_from(TranslationJob).where(
+                TranslationJob.user_id == user.id,
+                TranslationJob.status.in_((TranslationJobStatus.QUEUED, TranslationJobStatus.RUNNING))))
+
+    @read_only
+    async def get_job_by_id(self, id: UUID) -> TranslationJob | None:
+        """
+        Get a translation job by ID.
+
+        Args:
+            id (UUID): Translation job ID.
+
+        Returns:
+            TranslationJob | None: Translation job if it exists, None otherwise.
+        """
+        return (await self.__session.scalars(select(TranslationJob).where(TranslationJob.id == id))).first()
+
+    @read_only
+    async def get_translated_text(self, job_id: UUID) -> str:
+        """
+        Get the translated text of a completed translation job, joining the translations of its chunks.
+
+        Args:
+            job_id (UUID): Translation job ID.
+
+        Returns:
+            str: Translated text.
+        """
+        table = TranslationJobChunk.__table__
+        rows = await self.__session.execute(
+            select(table.c.translated_text, table.c.separator).where(table.c.job_id == job_id).order_by(
+                table.c.position))
+
+        return ''.join(translated_text + separator for translated_text, separator in rows)
+
+    async def claim_job(self, lease: float) -> Row | None:
+        """
+        Claim the oldest pending translation job that no worker owns, or whose owner stopped renewing its lease, such
+        as after a restart. The claim counts as an attempt of the job.
+
+        Args:
+            lease (float): Seconds the job is owned by the worker without progress.
+
+        Returns:
+            Row | None: Columns of the claimed job, or None if there are no jobs to claim.
+        """
+        table = TranslationJob.__table__
+        job_id = (await self.__session.scalars(
+            select(table.c.id).where(
+                table.c.pending == true(),
+                or_(table.c.lease_expiration.is_(None),
+                    table.c.lease_expiration < func.utc_timestamp(6))).order_by(table.c.creation_date).limit(1)
+            .with_for_update(skip_locked=True))).first()
+        if job_id is None:
+            return None
+
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id).values(lease_expiration=self.__lease_until(seconds=lease),
+                                                             attempts=table.c.attempts + 1))
+
+        return (await self.__session.execute(select(table).where(table.c.id == job_id))).first()
+
+    async def get_pending_chunks(self, job_id: UUID) -> list[Row]:
+        """
+        Get the chunks of a translation job that are not translated yet.
+
+        Args:
+            job_id (UUID): Translation job ID.
+
+        Returns:
+            list[Row]: Position and text of the pending chunks, ordered by position.
+        """
+        table = TranslationJobChunk.__table__
+        return list(await self.__session.execute(
+            select(table.c.position, table.c.text).where(table.c.job_id == job_id,
+                                                         table.c.translated_text.is_(None)).order_by(
+                                                             table.c.position)))
+
+    async def renew_lease(self, job_id: UUID, lease: float) -> None:
+        """
+        Renew the lease of a translation job while it waits without progress, such as for a model call slot.
+
+        Args:
+            job_id (UUID): Translation job ID.
+            lease (float): Seconds the job is owned by the worker without progress.
+        """
+        table = TranslationJob.__table__
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id).values(lease_expiration=self.__lease_until(seconds=lease)))
+
+    async def start_job(self, job_id: UUID) -> None:
+        """
+        Mark a translation job as running.
+
+        Args:
+            job_id (UUID): Translation job ID.
+        """
+        table = TranslationJob.__table__
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id, table.c.status == TranslationJobStatus.QUEUED).values(
+                status=TranslationJobStatus.RUNNING, update_date=datetime.now(tz=timezone.utc)))
+
+    async def complete_chunk(self, job_id: UUID, position: int, translated_text: str, lease: float) -> None:
+        """
+        Store the translation of a chunk, which renews the lease of the job and resets its attempts.
+
+        Args:
+            job_id (UUID): Translation job ID.
+            position (int): Position of the chunk.
+            translated_text (str): Translation of the chunk.
+            lease (float): Seconds the job is owned by the worker without progress.
+        """
+        chunk_table = TranslationJobChunk.__table__
+        result = await self.__session.execute(
+            update(chunk_table).where(chunk_table.c.job_id == job_id, chunk_table.c.position == position,
+                                      chunk_table.c.translated_text.is_(None)).values(translated_text=translated_text))
+
+        # The chunk is only counted once if the lease expired and another worker also translated it
+        table = TranslationJob.__table__
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id).values(completed_chunks=table.c.completed_chunks +
+                                                             result.rowcount,
+                                                             attempts=0,
+                                                             error=None,
+                                                             lease_expiration=self.__lease_until(seconds=lease),
+                                                             update_date=datetime.now(tz=timezone.utc)))
+
+    async def finish_job(self, job_id: UUID, status: TranslationJobStatus, error: str | None = None) -> None:
+        """
+        Mark a translation job as completed or failed. The job stays pending if its callback is not delivered yet.
+
+        Args:
+            job_id (UUID): Translation job ID.
+            status (TranslationJobStatus): Final status of the job.
+            error (str | None, optional): Error of the job if it failed. Defaults to None.
+        """
+        table = TranslationJob.__table__
+        now = datetime.now(tz=timezone.utc)
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id).values(status=status,
+                                                             error=error[:255] if error is not None else table.c.error,
+                                                             pending=table.c.callback_url.is_not(None),
+                                                             attempts=0,
+                                                             lease_expiration=None,
+                                                             update_date=now,
+                                                             completion_date=now))
+
+    async def finish_callback(self, job_id: UUID) -> None:
+        """
+        Mark the callback of a translation job as delivered, or dropped after its last attempt.
+
+        Args:
+            job_id (UUID): Translation job ID.
+        """
+        table = TranslationJob.__table__
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id).values(pending=False, lease_expiration=None))
+
+    async def release_job(self, job_id: UUID, delay: float, error: str | None = None) -> None:
+        """
+        Release a translation job, so a worker claims it again after the delay.
+
+        Args:
+            job_id (UUID): Translation job ID.
+            delay (float): Seconds until the job can be claimed again.
+            error (str | None, optional): Error of the failed attempt. Defaults to None.
+        """
+        table = TranslationJob.__table__
+        await self.__session.execute(
+            update(table).where(table.c.id == job_id).values(
+                lease_expiration=self.__lease_until(seconds=delay),
+                error=error[:255] if error is not None else table.c.error,
+                update_date=datetime.now(tz=timezone.utc)))
+
+    async def release_jobs(self, job_ids: list[UUID]) -> None:
+        """
+        Release the translation jobs of a worker that is shutting down, so other workers resume them immediately.
+
+        Args:
+            job_ids (list[UUID]): Translation job IDs.
+        """
+        if not job_ids:
+            return
+
+        table = TranslationJob.__table__
+        await self.__session.execute(
+            update(table).where(table.c.id.in_(job_ids)).values(lease_expiration=None,
+                                                                 attempts=func.greatest(table.c.attempts - 1, 0)))
@@ -1,2 +1,4 @@
 from .language_detection import language_detection
+from .text_chunking import split_text
 from .translate_text import translate_text
+from .translation_job_runner import translation_job_runner, TranslationJobRunner
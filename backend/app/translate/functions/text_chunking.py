@@ -0,0 +1,92 @@
+"""
+This module contains the function to split a large text into the chunks translated by each model call.
+"""
+from re import compile, Pattern
+
+PARAGRAPH_SEPARATOR = compile(r'(\n\s*\n)')
+SENTENCE_SEPARATOR = compile(r'(?<=[.!?;。！？])(\s+)')
+
+
+def split_with_separators(text: str, separator: Pattern[str], last_separator: str = '') -> list[tuple[str, str]]:
+    """
+    Split the text by the separator pattern, keeping the whitespace after each part.
+
+    Args:
+        text (str): Text to split.
+        separator (Pattern[str]): Separator pattern with a single group.
+        last_separator (str, optional): Whitespace after the last part. Defaults to ''.
+
+    Returns:
+        list[tuple[str, str]]: Parts of the text and the whitespace after each one.
+    """
+    parts = separator.split(text)
+    return list(zip(parts[0::2], [*parts[1::2], last_separator]))
+
+
+def split_words(text: str, chunk_size: int, last_separator: str) -> list[tuple[str, str]]:
+    """
+    Split a sentence longer than a chunk at the last whitespace that fits in each chunk, or by characters if there is
+    none.
+
+    Args:
+        text (str): Sentence to split.
+        chunk_size (int): Maximum characters of a chunk.
+        last_separator (str): Whitespace after the sentence.
+
+    Returns:
+        list[tuple[str, str]]: Parts of the sentence and the whitespace after each one.
+    """
+    parts = []
+    start = 0
+    while len(text) - start > chunk_size:
+        end = text.rfind(' ', start + 1, start + chunk_size + 1)
+        if end == -1:
+            parts.append((text[start:start + chunk_size], ''))
+            start += chunk_size
+
+        else:
+            parts.append((text[start:end], ' '))
+            start = end + 1
+
+    parts.append((text[start:], last_separator))
+    return parts
+
+
+def split_text(text: str, chunk_size: int) -> list[tuple[str, str]]:
+    """
+    Split the text into chunks of at most chunk_size characters, by paragraphs, then by sentences and then by words,
+    so each chunk is translated with as much context as possible. Consecutive parts are merged while they fit in a
+    chunk.
+
+    Args:
+        text (str): Text to split.
+        chunk_size (int): Maximum characters of a chunk.
+
+    Returns:
+        list[tuple[str, str]]: Chunks of the text and the whitespace after each one, joining them gives the text.
+    """
+    parts: list[tuple[str, str]] = []
+    for paragraph, paragraph_separator in split_with_separators(text=text, separator=PARAGRAPH_SEPARATOR):
+        if len(paragraph) <= chunk_size:
+            parts.append((paragraph, paragraph_separator))
+            continue
+
+        for sentence, sentence_separator in split_with_separators(text=paragraph,
+                                                                  separator=SENTENCE_SEPARATOR,
+                                                                  last_separator=paragraph_separator):
+            parts.extend(split_words(text=sentence, chunk_size=chunk_size, last_separator=sentence_separator))
+
+    chunks: list[tuple[str, str]] = []
+    for part, separator in parts:
+        if chunks and not part.strip():
+            # Whitespace only parts are kept in the separator of the previous chunk
+            chunks[-1] = (chunks[-1][0], chunks[-1][1] + part + separator)
+
+        elif chunks and len(chunks[-1][0]) + len(chunks[-1][1]) + len(part) <= chunk_size:
+            chunk, chunk_separator = chunks[-1]
+            chunks[-1] = (chunk + chunk_separator + part, separator)
+
+        else:
+            chunks.append((part, separator))
+
+    return chunks
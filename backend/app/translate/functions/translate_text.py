@@ -1,14 +1,23 @@
 """
 This module contains the function to translate text to the specified language.
 """
-from langchain.prompts import ChatPromptTemplate
-from langchain.pydantic_v1 import SecretStr
-from langchain_openai import ChatOpenAI
+from app.utils.llm import invoke_chat_model
 
-from app.settings import settings
+TRANSLATE_TEXT_PROMPT = """
+    Translate the provided passage to {language}. The provided language follows the BCP 47 standard.
 
+    For example:
+    - If the passage is "I'm learning how to translate texts with LLM models." and the target language is "es-ES",
+    the output should be "Estoy aprendiendo a traducir textos con modelos LLM.".
+    - If the passage is "Estic aprenent a traduir textos amb models LLM." and the target language is "en-US",
+    the output should be "I'm learning to translate texts with LLM models.".
 
-def translate_text(text: str, language: str) -> str:
+    Passage:
+    {text}
+"""
+
+
+async def translate_text(text: str, language: str) -> str:
     """
     Translate the text to the specified language.
 
@@ -19,19 +28,6 @@ def translate_text(text: str, language: str) -> str:
     Returns:
         str: Translated text.
     """
-    client = ChatOpenAI(api_key=SecretStr(value=settings.OPENAI_API_KEY), model=settings.AI_MODEL)
-
-    prompt_template = ChatPromptTemplate.from_template(template="""
-        Translate the provided passage to {language}. The provided language follows the BCP 47 standard.
-
-        For example:
-        - If the passage is "I'm learning how to translate texts with LLM models." and the target language is "es-ES",
-        the output should be "Estoy aprendiendo a traducir textos con modelos LLM.".
-        - If the passage is "Estic aprenent a traduir textos amb models LLM." and the target language is "en-US",
-        the output should be "I'm learning to translate texts with LLM models.".
-
-        Passage:
-        {text}
-    """)
-    model_response = client.invoke(input=prompt_template.format_messages(language=language, text=text))
-    return model_response.content
+    prompt = TRANSLATE_TEXT_PROMPT.format(language=language, text=text)
+
+    return await invoke_chat_model(operation='translate', messages=[{'role': 'user', 'content': prompt}])
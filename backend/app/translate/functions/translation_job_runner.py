@@ -0,0 +1,333 @@
+"""
+This module contains the background runner of the translation jobs.
+"""
+from __future__ import annotations
+
+from asyncio import create_task, Event, gather, Semaphore, sleep, Task, timeout
+from contextlib import suppress
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, URL
+from uuid import UUID
+
+from app.database import async_session_maker
+from app.settings import Priority, settings
+from app.translate.models import ShowTranslationJob, TranslationJobStatus
+from app.utils.cryptography import current_api_key_id, current_api_key_priority, current_user_id
+from app.utils.database import current_reader, primary_stickiness
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.metrics import metrics
+from app.utils.network import resolve_public_address
+
+from .translate_text import translate_text
+
+if TYPE_CHECKING:
+    from sqlalchemy import Row
+
+logger = getLogger(__name__)
+
+metrics.describe(name='translation_jobs_in_progress', description='Translation jobs processed by the worker.')
+metrics.describe(name='translation_jobs_finished_total', description='Translation jobs completed or failed.')
+metrics.describe(name='translation_job_chunks_total', description='Translated chunks of the translation jobs.')
+metrics.describe(name='translation_job_callbacks_total', description='Callbacks of the finished translation jobs.')
+
+# Statuses of the jobs that are not translated yet
+ACTIVE_STATUSES = (TranslationJobStatus.QUEUED, TranslationJobStatus.RUNNING)
+
+
+class TranslationJobRunner():
+    """
+    Processes the translation jobs in the background, at most workers jobs at the same time per server worker. The jobs
+    are claimed from the database with a lease that every translated chunk renews, so when a worker stops, such as on
+    a restart, another worker resumes its jobs from their last translated chunk once the lease expires. The model calls
+    of the jobs are scheduled with the bulk priority, so they do not delay the interactive requests.
+    """
+    __workers: int
+    __wake_up: Event
+    __tasks: set[Task]
+    __claimed: set[UUID]
+    __client: AsyncClient
+
+    def __init__(self, workers: int) -> None:
+        """
+        Create a new TranslationJobRunner instance.
+
+        Args:
+            workers (int): Maximum number of jobs processed at the same time.
+        """
+        self.__workers = workers
+        self.__wake_up = Event()
+        self.__tasks = set()
+        self.__claimed = set()
+        self.__client = AsyncClient(timeout=settings.TRANSLATION_JOB_CALLBACK_TIMEOUT)
+
+    def notify(self) -> None:
+        """
+        Wake up the runner, so a new job is claimed without waiting for the next poll.
+        """
+        self.__wake_up.set()
+
+    @staticmethod
+    async def __claim() -> Row | None:
+        """
+        Claim a pending job.
+
+        Returns:
+            Row | None: Columns of the claimed job, or None if there are no jobs to claim.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        async with async_session_maker() as session, session.begin():
+            return await TranslationJobDAL(session=session).claim_job(lease=settings.TRANSLATION_JOB_LEASE)
+
+    @staticmethod
+    async def __finish(job: Row, status: TranslationJobStatus, error: str | None = None) -> None:
+        """
+        Mark the job as completed or failed.
+
+        Args:
+            job (Row): Columns of the job.
+            status (TranslationJobStatus): Final status of the job.
+            error (str | None, optional): Error of the job if it failed. Defaults to None.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        async with async_session_maker() as session, session.begin():
+            await TranslationJobDAL(session=session).finish_job(job_id=job.id, status=status, error=error)
+
+        # The callback reads the finished job, which may not be in the replicas yet
+        await primary_stickiness.record_write(key=str(job.user_id))
+        metrics.increment(name='translation_jobs_finished_total', labels={'status': status})
+
+    @staticmethod
+    async def __translate_chunk(job: Row, text: str) -> str:
+        """
+        Translate a chunk of the job, waiting while the model is busy.
+
+        Args:
+            job (Row): Columns of the job.
+            text (str): Text of the chunk.
+
+        Returns:
+            str: Translation of the chunk.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        # Whitespace only chunks, such as the leading blank lines of the text, are kept as they are
+        if not text.strip():
+            return text
+
+        while True:
+            try:
+                return await translate_text(text=text, language=job.language)
+
+            except ServiceUnavailableException as exception:
+                await sleep(exception.retry_after)
+
+                async with async_session_maker() as session, session.begin():
+                    await TranslationJobDAL(session=session).renew_lease(job_id=job.id,
+                                                                         lease=settings.TRANSLATION_JOB_LEASE)
+
+    async def __translate(self, job: Row) -> None:
+        """
+        Translate the chunks of the job that are not translated yet, storing each translation, and complete the job.
+
+        Args:
+            job (Row): Columns of the job.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        async with async_session_maker() as session, session.begin():
+            translation_job_dal = TranslationJobDAL(session=session)
+            await translation_job_dal.start_job(job_id=job.id)
+            chunks = await translation_job_dal.get_pending_chunks(job_id=job.id)
+
+        for position, text in chunks:
+            translated_text = await self.__translate_chunk(job=job, text=text)
+
+            async with async_session_maker() as session, session.begin():
+                await TranslationJobDAL(session=session).complete_chunk(job_id=job.id,
+                                                                        position=position,
+                                                                        translated_text=translated_text,
+                                                                        lease=settings.TRANSLATION_JOB_LEASE)
+            metrics.increment(name='translation_job_chunks_total')
+
+        await self.__finish(job=job, status=TranslationJobStatus.COMPLETED)
+
+    async def __deliver_callback(self, job: Row) -> None:
+        """
+        Send the finished job to its callback URL. The host is resolved and checked to be public first, and the request
+        is sent to the checked address, so the host cannot resolve to a local address between the check and the
+        request.
+
+        Args:
+            job (Row): Columns of the job.
+
+        Raises:
+            ValidationException: If the host of the callback URL is not public.
+            HTTPError: If the callback URL cannot be reached or does not answer with a 2xx status code.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        async with async_session_maker() as session:
+            translation_job_dal = TranslationJobDAL(session=session)
+            translation_job = await translation_job_dal.get_job_by_id(id=job.id)
+            translated_text = await translation_job_dal.get_translated_text(
+                job_id=job.id) if translation_job.status == TranslationJobStatus.COMPLETED else None
+
+        url = URL(job.callback_url)
+        address = await resolve_public_address(host=url.host, port=url.port or (443 if url.scheme == 'https' else 80))
+        response = await self.__client.post(
+            url=url.copy_with(host=address),
+            content=ShowTranslationJob(**dict(translation_job), text=translated_text).model_dump_json(),
+            headers={
+                'Content-Type': 'application/json',
+                'Host': url.netloc.decode('ascii')
+            },
+            extensions={'sni_hostname': url.host})
+        response.raise_for_status()
+
+        async with async_session_maker() as session, session.begin():
+            await TranslationJobDAL(session=session).finish_callback(job_id=job.id)
+        metrics.increment(name='translation_job_callbacks_total', labels={'result': 'delivered'})
+
+    @staticmethod
+    async def __release(job: Row, error: str | None = None) -> None:
+        """
+        Release the job after a failed attempt, so it is claimed again after an exponential backoff.
+
+        Args:
+            job (Row): Columns of the job.
+            error (str | None, optional): Error of the failed attempt. Defaults to None.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        try:
+            async with async_session_maker() as session, session.begin():
+                await TranslationJobDAL(session=session).release_job(
+                    job_id=job.id, delay=settings.TRANSLATION_JOB_POLL_INTERVAL * 2**min(job.attempts, 6), error=error)
+
+        except Exception:
+            logger.exception('Could not release the translation job %s, it is retried when its lease expires.', job.id)
+
+    async def __process(self, job: Row) -> None:
+        """
+        Translate the job, if it is not translated yet, and deliver its callback. A failed attempt releases the job,
+        and the job fails, or its callback is dropped, after TRANSLATION_JOB_MAX_ATTEMPTS attempts without progress.
+
+        Args:
+            job (Row): Columns of the job.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        # The model calls are metered to the API key of the job and scheduled with the bulk priority
+        current_api_key_id.set(str(job.api_key_id) if job.api_key_id is not None else None)
+        current_user_id.set(str(job.user_id))
+        current_api_key_priority.set(Priority.BULK)
+        current_reader.set(str(job.user_id))
+
+        if job.status in ACTIVE_STATUSES:
+            try:
+                if job.attempts > settings.TRANSLATION_JOB_MAX_ATTEMPTS:
+                    await self.__finish(job=job,
+                                        status=TranslationJobStatus.FAILED,
+                                        error=job.error or 'The translation failed too many times.')
+
+                else:
+                    await self.__translate(job=job)
+
+            except Exception as exception:
+                logger.exception('Translation job %s attempt %d failed.', job.id, job.attempts)
+                await self.__release(job=job, error=getattr(exception, 'message', None) or 'The translation failed.')
+                return
+
+        elif job.attempts > settings.TRANSLATION_JOB_MAX_ATTEMPTS:
+            logger.warning('Dropping the callback of the translation job %s after %d attempts.', job.id,
+                           job.attempts - 1)
+            async with async_session_maker() as session, session.begin():
+                await TranslationJobDAL(session=session).finish_callback(job_id=job.id)
+            metrics.increment(name='translation_job_callbacks_total', labels={'result': 'dropped'})
+            return
+
+        if job.callback_url is not None:
+            try:
+                await self.__deliver_callback(job=job)
+
+            except Exception:
+                logger.exception('Translation job %s callback attempt failed.', job.id)
+                metrics.increment(name='translation_job_callbacks_total', labels={'result': 'failed'})
+                await self.__release(job=job)
+
+    async def __run_job(self, job: Row) -> None:
+        """
+        Process the claimed job, keeping track of it so its lease is released on shutdown.
+
+        Args:
+            job (Row): Columns of the job.
+        """
+        self.__claimed.add(job.id)
+        metrics.set_gauge(name='translation_jobs_in_progress', value=len(self.__claimed))
+        try:
+            await self.__process(job=job)
+
+        except Exception:
+            logger.exception('Translation job %s could not be processed, it is retried when its lease expires.',
+                             job.id)
+
+        # A cancelled job is kept, so its lease is released on shutdown
+        self.__claimed.discard(job.id)
+        metrics.set_gauge(name='translation_jobs_in_progress', value=len(self.__claimed))
+
+    async def run(self) -> None:
+        """
+        Claim and process the pending jobs until cancelled, checking for new and abandoned jobs every
+        TRANSLATION_JOB_POLL_INTERVAL seconds or when notified.
+        """
+        slots = Semaphore(value=self.__workers)
+        while True:
+            await slots.acquire()
+            self.__wake_up.clear()
+            try:
+                job = await self.__claim()
+
+            except Exception:
+                logger.exception('Could not claim a translation job.')
+                job = None
+
+            if job is None:
+                slots.release()
+                with suppress(TimeoutError):
+                    async with timeout(delay=settings.TRANSLATION_JOB_POLL_INTERVAL):
+                        await self.__wake_up.wait()
+
+                continue
+
+            task = create_task(self.__run_job(job=job))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+            task.add_done_callback(lambda _: slots.release())
+
+    async def close(self) -> None:
+        """
+        Stop the jobs in progress and release their leases, so other workers resume them immediately, and close the
+        callback client.
+        """
+        from app.translate.dal import TranslationJobDAL
+
+        for task in self.__tasks:
+            task.cancel()
+        await gather(*self.__tasks, return_exceptions=True)
+
+        try:
+            async with async_session_maker() as session, session.begin():
+                await TranslationJobDAL(session=session).release_jobs(job_ids=list(self.__claimed))
+
+        except Exception:
+            logger.exception('Could not release %d translation jobs, they are resumed when their leases expire.',
+                             len(self.__claimed))
+
+        await self.__client.aclose()
+
+
+translation_job_runner = TranslationJobRunner(workers=settings.TRANSLATION_JOB_WORKERS)
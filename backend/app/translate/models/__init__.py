@@ -1,4 +1,9 @@
+from .create_translation_job_schema import CreateTranslationJob
 from .detect_language_schema import DetectLanguage
 from .detected_language_schema import DetectedLanguage
+from .show_translation_job_schema import ShowTranslationJob
 from .text_to_translate_schema import TextToTranslate
 from .translated_text_schema import TranslatedText
+from .translation_job_chunk_model import TranslationJobChunk
+from .translation_job_model import TranslationJob
+from .translation_job_status import TranslationJobStatus
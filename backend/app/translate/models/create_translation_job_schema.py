@@ -0,0 +1,47 @@
+"""
+Translation job creation schema.
+"""
+from pydantic import ConfigDict, Field, field_validator, HttpUrl
+
+from app.settings import settings
+from app.utils.network import check_public_host
+
+from .text_to_translate_schema import TextToTranslate
+
+
+class CreateTranslationJob(TextToTranslate):
+    """
+    Translation job creation schema.
+    """
+    text: str = Field(default=...,
+                      min_length=1,
+                      max_length=settings.TRANSLATION_JOB_MAX_TEXT_LENGTH,
+                      description='Text to translate.',
+                      examples=['Estoy aprendiendo a traducir textos con modelos LLM.'])
+
+    callback_url: HttpUrl | None = Field(default=None,
+                                         description='URL that receives the job with a POST request when it finishes, '
+                                         'its host must be public.',
+                                         examples=['https://example.com/translation-jobs'])
+
+    model_config = ConfigDict(extra='forbid')
+
+    @field_validator('callback_url')
+    def validate_callback_url(cls, callback_url: HttpUrl | None) -> HttpUrl | None:
+        """
+        Validate that the host of the callback URL is not a local name or a non public IP address, as the server sends
+        the callback. Host names are checked again when they are resolved to deliver the callback.
+
+        Args:
+            callback_url (HttpUrl | None): Callback URL field value.
+
+        Raises:
+            ValidationException: If the host of the callback URL is not public.
+
+        Returns:
+            HttpUrl | None: Callback URL field value.
+        """
+        if callback_url is not None:
+            check_public_host(host=callback_url.host or '')
+
+        return callback_url
@@ -0,0 +1,54 @@
+"""
+Translation job schema.
+"""
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, ConfigDict, Field
+from uuid import UUID
+
+from .translation_job_status import TranslationJobStatus
+
+
+class ShowTranslationJob(BaseModel):
+    """
+    Translation job schema.
+    """
+    id: UUID = Field(default=...,
+                     description='ID of the translation job.',
+                     examples=['0f8fad5b-d9cb-469f-a165-70867728950e'])
+
+    status: TranslationJobStatus = Field(default=...,
+                                         description='Status of the translation job.',
+                                         examples=[TranslationJobStatus.RUNNING])
+
+    language: str = Field(default=...,
+                          description='Language of the translation as BCP 47 standard.',
+                          examples=['en-US'])
+
+    total_chunks: int = Field(default=..., description='Number of chunks of the text.', examples=[12])
+
+    completed_chunks: int = Field(default=..., description='Number of translated chunks.', examples=[5])
+
+    progress: float = Field(default=..., description='Translated share of the text, from 0 to 1.', examples=[0.42])
+
+    text: str | None = Field(default=None,
+                             description='Translated text, only when the job is completed.',
+                             examples=['I am learning to translate texts with LLM models.'])
+
+    error: str | None = Field(default=None,
+                              description='Error of the last failed attempt.',
+                              examples=['The model is not available. Please try again later.'])
+
+    creation_date: datetime = Field(default=...,
+                                    description='Creation date of the translation job.',
+                                    examples=[datetime.now(tz=timezone.utc)])
+
+    update_date: datetime = Field(default=...,
+                                  description='Last update date of the translation job.',
+                                  examples=[datetime.now(tz=timezone.utc)])
+
+    completion_date: datetime | None = Field(default=None,
+                                             description='Completion date of the translation job.',
+                                             examples=[datetime.now(tz=timezone.utc)])
+
+    model_config = ConfigDict(extra='ignore')
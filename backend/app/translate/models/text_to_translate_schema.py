@@ -1,8 +1,6 @@
 """
 Text to translate schema.
 """
-from langcodes import standardize_tag
-from langcodes.tag_parser import LanguageTagError
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.utils.exceptions import ValidationException
@@ -37,6 +35,9 @@ class TextToTranslate(BaseModel):
         Returns:
             str: Language field value.
         """
+        from langcodes import standardize_tag
+        from langcodes.tag_parser import LanguageTagError
+
         try:
             return standardize_tag(tag=language)
 
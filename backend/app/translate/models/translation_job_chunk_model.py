@@ -0,0 +1,106 @@
+"""
+TranslationJobChunk DB model.
+"""
+from typing import Any
+
+from sqlalchemy import Column, ForeignKey, Integer, Text
+from sqlalchemy.ext.hybrid import hybrid_property
+from uuid import UUID
+
+from app.database import Base
+from app.utils.database import BinaryUUID
+
+
+class TranslationJobChunk(Base):
+    """
+    Chunk of the text of a translation job, translated by a single model call.
+    """
+    __tablename__ = 'TranslationJobChunk'
+
+    # Job of the chunk
+    __job_id = Column('job_id',
+                      BinaryUUID,
+                      ForeignKey('TranslationJob.id', ondelete='CASCADE', name='translation_job_chunk_job_fk'),
+                      primary_key=True)
+
+    # Position of the chunk in the text
+    __position = Column('position', Integer, primary_key=True, autoincrement=False)
+
+    # Text of the chunk
+    __text = Column('text', Text, nullable=False)
+
+    # Whitespace between the chunk and the next one, kept in the translation
+    __separator = Column('separator', Text, nullable=False)
+
+    # Translation of the chunk, None until it is translated
+    __translated_text = Column('translated_text', Text, nullable=True)
+
+    @hybrid_property
+    def job_id(self) -> UUID:
+        """
+        Get the ID of the job of the chunk.
+
+        Returns:
+            UUID: ID of the job of the chunk.
+        """
+        return self.__job_id
+
+    @job_id.setter
+    def job_id(self, value: Any) -> None:
+        raise AttributeError('TranslationJobChunk job id is a read-only attribute.')
+
+    @hybrid_property
+    def position(self) -> int:
+        """
+        Get the position of the chunk in the text.
+
+        Returns:
+            int: Position of the chunk.
+        """
+        return self.__position
+
+    @position.setter
+    def position(self, value: Any) -> None:
+        raise AttributeError('TranslationJobChunk position is a read-only attribute.')
+
+    @hybrid_property
+    def text(self) -> str:
+        """
+        Get the text of the chunk.
+
+        Returns:
+            str: Text of the chunk.
+        """
+        return self.__text
+
+    @text.setter
+    def text(self, value: Any) -> None:
+        raise AttributeError('TranslationJobChunk text is a read-only attribute.')
+
+    @hybrid_property
+    def separator(self) -> str:
+        """
+        Get the whitespace between the chunk and the next one.
+
+        Returns:
+            str: Whitespace after the chunk.
+        """
+        return self.__separator
+
+    @separator.setter
+    def separator(self, value: Any) -> None:
+        raise AttributeError('TranslationJobChunk separator is a read-only attribute.')
+
+    @hybrid_property
+    def translated_text(self) -> str | None:
+        """
+        Get the translation of the chunk.
+
+        Returns:
+            str | None: Translation of the chunk, None if it is not translated yet.
+        """
+        return self.__translated_text
+
+    @translated_text.setter
+    def translated_text(self, value: Any) -> None:
+        raise AttributeError('TranslationJobChunk translated text is a read-only attribute.')
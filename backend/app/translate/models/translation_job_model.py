@@ -0,0 +1,194 @@
+"""
+TranslationJob DB model.
+"""
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.ext.hybrid import hybrid_property
+from uuid import UUID, uuid4
+
+from app.database import Base
+from app.utils.database import BinaryUUID
+
+from .translation_job_status import TranslationJobStatus
+
+
+class TranslationJob(Base):
+    """
+    Translation of a large text, processed in chunks by the background workers.
+    """
+    __tablename__ = 'TranslationJob'
+
+    # ID of the row
+    __id = Column('id', BinaryUUID, primary_key=True)
+
+    # Owner of the job
+    __user_id = Column('user_id',
+                       BinaryUUID,
+                       ForeignKey('User.id', ondelete='CASCADE', name='translation_job_user_fk'),
+                       nullable=False)
+
+    # API key that created the job, its usage is metered to it
+    __api_key_id = Column('api_key_id',
+                          BinaryUUID,
+                          ForeignKey('ApiKey.id', ondelete='SET NULL', name='translation_job_api_key_fk'),
+                          nullable=True)
+
+    # Language of the translation as BCP 47 standard
+    __language = Column('language', String(length=35), nullable=False)
+
+    # Status of the job
+    __status = Column('status', String(length=16), nullable=False)
+
+    # URL that receives the job when it finishes
+    __callback_url = Column('callback_url', String(length=2083), nullable=True)
+
+    # Number of chunks of the text
+    __total_chunks = Column('total_chunks', Integer, nullable=False)
+
+    # Number of translated chunks
+    __completed_chunks = Column('completed_chunks', Integer, nullable=False, default=0)
+
+    # Error of the last failed attempt
+    __error = Column('error', String(length=255), nullable=True)
+
+    # Whether the job still has to be translated or its callback delivered
+    __pending = Column('pending', Boolean, nullable=False, default=True)
+
+    # Attempts since the last progress, the job fails after TRANSLATION_JOB_MAX_ATTEMPTS
+    __attempts = Column('attempts', Integer, nullable=False, default=0)
+
+    # Date until the job is owned by a worker, None if no worker owns it
+    __lease_expiration = Column('lease_expiration', DateTime, nullable=True)
+
+    # Job creation date
+    __creation_date = Column('creation_date', DateTime, nullable=False)
+
+    # Job last update date
+    __update_date = Column('update_date', DateTime, nullable=False)
+
+    # Job completion date
+    __completion_date = Column('completion_date', DateTime, nullable=True)
+
+    # Indexes
+    __pending_index = Index('translation_job_pending_index', __pending, __creation_date)
+    __user_status_index = Index('translation_job_user_status_index', __user_id, __status)
+
+    def __init__(self, user_id: UUID, api_key_id: UUID | None, language: str, callback_url: str | None,
+                 total_chunks: int) -> None:
+        """
+        Create a new queued translation job.
+
+        Args:
+            user_id (UUID): ID of the owner of the job.
+            api_key_id (UUID | None): ID of the API key that created the job.
+            language (str): Language of the translation as BCP 47 standard.
+            callback_url (str | None): URL that receives the job when it finishes.
+            total_chunks (int): Number of chunks of the text.
+        """
+        self.__id = uuid4()
+        self.__user_id = user_id
+        self.__api_key_id = api_key_id
+        self.__language = language
+        self.__status = TranslationJobStatus.QUEUED
+        self.__callback_url = callback_url
+        self.__total_chunks = total_chunks
+        self.__completed_chunks = 0
+        self.__error = None
+        self.__pending = True
+        self.__attempts = 0
+        self.__lease_expiration = None
+
+        self.__creation_date = datetime.now(tz=timezone.utc)
+        self.__update_date = self.__creation_date
+        self.__completion_date = None
+
+    def __iter__(self) -> dict:
+        """
+        Get the translation job as a dict.
+
+        Returns:
+            dict: Translation job as dict.
+        """
+        yield 'id', self.__id,
+        yield 'status', self.__status,
+        yield 'language', self.__language,
+        yield 'callback_url', self.__callback_url,
+        yield 'total_chunks', self.__total_chunks,
+        yield 'completed_chunks', self.__completed_chunks,
+        yield 'progress', self.__completed_chunks / self.__total_chunks if self.__total_chunks else 1,
+        yield 'error', self.__error,
+        yield 'creation_date', self.__creation_date,
+        yield 'update_date', self.__update_date,
+        yield 'completion_date', self.__completion_date
+
+    @hybrid_property
+    def id(self) -> UUID:
+        """
+        Get the ID of the translation job.
+
+        Returns:
+            UUID: ID of the translation job.
+        """
+        return self.__id
+
+    @id.setter
+    def id(self, value: Any) -> None:
+        raise AttributeError('TranslationJob id is a read-only attribute.')
+
+    @hybrid_property
+    def user_id(self) -> UUID:
+        """
+        Get the ID of the owner of the translation job.
+
+        Returns:
+            UUID: ID of the owner of the translation job.
+        """
+        return self.__user_id
+
+    @user_id.setter
+    def user_id(self, value: Any) -> None:
+        raise AttributeError('TranslationJob user id is a read-only attribute.')
+
+    @hybrid_property
+    def status(self) -> TranslationJobStatus:
+        """
+        Get the status of the translation job.
+
+        Returns:
+            TranslationJobStatus: Status of the translation job.
+        """
+        return self.__status
+
+    @status.setter
+    def status(self, value: Any) -> None:
+        raise AttributeError('TranslationJob status is a read-only attribute.')
+
+    @hybrid_property
+    def pending(self) -> bool:
+        """
+        Check if the translation job still has to be translated or its callback delivered.
+
+        Returns:
+            bool: True if the job is pending, False otherwise.
+        """
+        return self.__pending
+
+    @pending.setter
+    def pending(self, value: Any) -> None:
+        raise AttributeError('TranslationJob pending is a read-only attribute.')
+
+    @hybrid_property
+    def creation_date(self) -> datetime:
+        """
+        Get the creation date of the translation job.
+
+        Returns:
+            datetime: Creation date of the translation job.
+        """
+        return self.__creation_date
+
+    @creation_date.setter
+    def creation_date(self, value: Any) -> None:
+        raise AttributeError('TranslationJob creation date is a read-only attribute.')
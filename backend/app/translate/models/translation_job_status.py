@@ -0,0 +1,12 @@
+"""
+Translation job status.
+"""
+from enum import StrEnum, unique
+
+
+@unique
+class TranslationJobStatus(StrEnum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
@@ -5,11 +5,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Body, Depends, status
-
-from app.translate.functions import language_detection, translate_text
-from app.translate.models import DetectedLanguage, DetectLanguage, TextToTranslate, TranslatedText
-from app.utils.cryptography import check_valid_api_key
+from fastapi import APIRouter, Body, Depends, Path, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.database import get_session
+from app.settings import settings
+from app.translate.dal import TranslationJobDAL
+from app.translate.functions import language_detection, split_text, translate_text, translation_job_runner
+from app.translate.models import (CreateTranslationJob, DetectedLanguage, DetectLanguage, ShowTranslationJob,
+                                  TextToTranslate, TranslatedText, TranslationJobStatus)
+from app.utils.cryptography import check_valid_api_key, current_api_key_id
+from app.utils.exceptions import NotFoundException, TooManyRequestsException
 
 if TYPE_CHECKING:
     from app.users.models import User
@@ -37,7 +44,7 @@ async def translate_text_route(user: User = Depends(dependency=check_valid_api_k
     Returns:
         TranslatedText: Translated text.
     """
-    translated_text = translate_text(text=text_to_translate.text, language=text_to_translate.language)
+    translated_text = await translate_text(text=text_to_translate.text, language=text_to_translate.language)
 
     return TranslatedText(original_text=text_to_translate.text,
                           text=translated_text,
@@ -64,6 +71,95 @@ async def detect_language_route(user: User = Depends(dependency=check_valid_api_
     Returns:
         DetectedLanguage: Detected language. Language is in BCP 47 standard.
     """
-    detected_language = language_detection(text=detect_language.text)
+    detected_language = await language_detection(text=detect_language.text)
 
     return DetectedLanguage(text=detect_language.text, language=detected_language)
+
+
+@router.post(path='/jobs',
+             summary='Create a translation job.',
+             description='Create a job that translates a large text to the specified language in the background. The '
+             'language must be in BCP 47 standard. The job can be polled at the URL of the Location header, and it is '
+             'sent with a POST request to the callback URL, if given, when it finishes.',
+             status_code=status.HTTP_202_ACCEPTED,
+             response_model=ShowTranslationJob)
+async def create_translation_job_route(response: Response,
+                                       user: User = Depends(dependency=check_valid_api_key),
+                                       translation_job_data: CreateTranslationJob = Body(default=...),
+                                       session: AsyncSession = Depends(dependency=get_session)) -> ShowTranslationJob:
+    """
+    Create a job that translates the text to the specified language in the background. The language must be in BCP 47
+    standard.
+
+    Args:
+        response (Response): Response object.
+        user (User): User owner of the API key.
+        translation_job_data (CreateTranslationJob): Text to translate and callback URL.
+        session (AsyncSession): Session of the current request.
+
+    Raises:
+        InvalidCredentialsException: If the API key is invalid.
+        TooManyRequestsException: If the user has too many unfinished translation jobs.
+
+    Returns:
+        ShowTranslationJob: Created translation job.
+    """
+    translation_job_dal = TranslationJobDAL(session=session)
+
+    if await translation_job_dal.count_pending_jobs(user=user) >= settings.TRANSLATION_JOB_MAX_PENDING_PER_USER:
+        raise TooManyRequestsException(message='Too many unfinished translation jobs. Please try again later.',
+                                       retry_after=settings.TRANSLATION_JOB_POLL_INTERVAL)
+
+    translation_job = await translation_job_dal.create_job(
+        user=user,
+        api_key_id=UUID(current_api_key_id.get()),
+        language=translation_job_data.language,
+        callback_url=str(translation_job_data.callback_url) if translation_job_data.callback_url is not None else None,
+        chunks=split_text(text=translation_job_data.text, chunk_size=settings.TRANSLATION_JOB_CHUNK_SIZE))
+
+    # The job is committed before a worker is woken up to claim it
+    await session.commit()
+    translation_job_runner.notify()
+
+    response.headers['Location'] = f'/translate/jobs/{translation_job.id}'
+    return ShowTranslationJob(**dict(translation_job))
+
+
+@router.get(path='/jobs/{job_id}',
+            summary='Get a translation job.',
+            description='Get the status and progress of a translation job, and its translated text when it is '
+            'completed.',
+            status_code=status.HTTP_200_OK,
+            response_model=ShowTranslationJob)
+async def get_translation_job_route(user: User = Depends(dependency=check_valid_api_key),
+                                    job_id: UUID = Path(default=...,
+                                                        description='Translation job id to get.',
+                                                        examples=['0f8fad5b-d9cb-469f-a165-70867728950e']),
+                                    session: AsyncSession = Depends(dependency=get_session)) -> ShowTranslationJob:
+    """
+    Get the status and progress of a translation job, and its translated text when it is completed.
+
+    Args:
+        user (User): User owner of the API key.
+        job_id (UUID): Translation job id to get.
+        session (AsyncSession): Session of the current request.
+
+    Raises:
+        InvalidCredentialsException: If the API key is invalid.
+        NotFoundException: If the translation job with the given ID is not found.
+        NotFoundException: If the translation job does not belong to the user.
+
+    Returns:
+        ShowTranslationJob: Translation job.
+    """
+    translation_job_dal = TranslationJobDAL(session=session)
+
+    translation_job = await translation_job_dal.get_job_by_id(id=job_id)
+    if translation_job is None or translation_job.user_id != user.id:
+        raise NotFoundException(message=f'Translation job with id {job_id} not found.')
+
+    translated_text = None
+    if translation_job.status == TranslationJobStatus.COMPLETED:
+        translated_text = await translation_job_dal.get_translated_text(job_id=translation_job.id)
+
+    return ShowTranslationJob(**dict(translation_job), text=translated_text)
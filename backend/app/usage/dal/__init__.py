@@ -0,0 +1 @@
+from .usage_dal import UsageDAL
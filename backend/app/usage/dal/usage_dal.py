@@ -0,0 +1,77 @@
+"""
+Usage Data Access Layer
+"""
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.usage.models import ApiKeyUsage
+from app.users.models import ApiKey
+
+
+class UsageDAL():
+    __session: AsyncSession
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Create a new UsageDAL instance.
+
+        Args:
+            session (AsyncSession): Async database session.
+        """
+        self.__session = session
+
+    async def add_api_key_usage(self, rollups: list[dict[str, Any]]) -> int:
+        """
+        Add the usage rollups to the stored ones with a single multi-row upsert. The rollups of the API keys deleted
+        after their calls are dropped, and the other API keys are locked until the commit, so they are not deleted
+        before the upsert.
+
+        Args:
+            rollups (list[dict[str, Any]]): Rollups with the ApiKeyUsage table column names.
+
+        Returns:
+            int: Number of added rollups.
+        """
+        if not rollups:
+            return 0
+
+        api_key_ids = set(await self.__session.scalars(
+            select(ApiKey.id).where(ApiKey.id.in_({rollup['api_key_id']
+                                                   for rollup in rollups})).with_for_update(read=True)))
+        rollups = [rollup for rollup in rollups if UUID(str(rollup['api_key_id'])) in api_key_ids]
+        if not rollups:
+            return 0
+
+        table = ApiKeyUsage.__table__
+        statement = insert(table).values(rollups)
+        statement = statement.on_duplicate_key_update(
+            requests=table.c.requests + statement.inserted.requests,
+            prompt_tokens=table.c.prompt_tokens + statement.inserted.prompt_tokens,
+            completion_tokens=table.c.completion_tokens + statement.inserted.completion_tokens,
+            total_latency=table.c.total_latency + statement.inserted.total_latency,
+            max_latency=func.greatest(table.c.max_latency, statement.inserted.max_latency))
+
+        await self.__session.execute(statement)
+
+        return len(rollups)
+
+    async def get_api_key_usage(self, api_key_id: UUID, start: datetime, end: datetime) -> list[ApiKeyUsage]:
+        """
+        Get the hourly usage rollups of an API key.
+
+        Args:
+            api_key_id (UUID): API key ID.
+            start (datetime): Start of the period, inclusive.
+            end (datetime): End of the period, exclusive.
+
+        Returns:
+            list[ApiKeyUsage]: Usage rollups ordered by hour.
+        """
+        return list(await self.__session.scalars(
+            select(ApiKeyUsage).where(ApiKeyUsage.api_key_id == api_key_id, ApiKeyUsage.hour >= start,
+                                      ApiKeyUsage.hour < end).order_by(ApiKeyUsage.hour)))
@@ -0,0 +1 @@
+from .usage_aggregator import usage_aggregator, UsageAggregator
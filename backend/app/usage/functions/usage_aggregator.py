@@ -0,0 +1,108 @@
+"""
+This module contains the in-memory aggregator of the model usage per API key.
+"""
+from asyncio import sleep
+from datetime import datetime, timezone
+from logging import getLogger
+
+from sqlalchemy.exc import IntegrityError
+
+from app.database import async_session_maker
+from app.settings import settings
+
+logger = getLogger(__name__)
+
+# API key ID, hour, operation and model
+UsageKey = tuple[str, datetime, str, str]
+
+
+class UsageAggregator():
+    """
+    Aggregates the model calls in memory per API key, hour, operation and model, and periodically adds the rollups to
+    the database in bulk, so each call does not write to the database.
+    """
+    __rollups: dict[UsageKey, list[float]]
+
+    def __init__(self) -> None:
+        """
+        Create a new empty UsageAggregator instance.
+        """
+        self.__rollups = {}
+
+    def record(self, api_key_id: str, operation: str, model: str, prompt_tokens: int, completion_tokens: int,
+               latency: float) -> None:
+        """
+        Record a model call.
+
+        Args:
+            api_key_id (str): ID of the API key that made the call.
+            operation (str): Operation of the call.
+            model (str): Model used by the call.
+            prompt_tokens (int): Tokens sent to the model.
+            completion_tokens (int): Tokens generated by the model.
+            latency (float): Upstream latency in seconds.
+        """
+        hour = datetime.now(tz=timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        key = (api_key_id, hour, operation, model)
+
+        # Requests, prompt tokens, completion tokens, total latency and max latency
+        rollup = self.__rollups.setdefault(key, [0, 0, 0, 0.0, 0.0])
+        rollup[0] += 1
+        rollup[1] += prompt_tokens
+        rollup[2] += completion_tokens
+        rollup[3] += latency
+        rollup[4] = max(rollup[4], latency)
+
+    async def flush(self) -> None:
+        """
+        Add the pending rollups to the database. If the database write fails, the rollups are kept for the next flush,
+        unless they are rejected by the database, which would reject them again.
+        """
+        from app.usage.dal import UsageDAL
+
+        rollups, self.__rollups = self.__rollups, {}
+        if not rollups:
+            return
+
+        try:
+            async with async_session_maker() as session, session.begin():
+                added = await UsageDAL(session=session).add_api_key_usage(rollups=[{
+                    'api_key_id': api_key_id,
+                    'hour': hour,
+                    'operation': operation,
+                    'model': model,
+                    'requests': rollup[0],
+                    'prompt_tokens': rollup[1],
+                    'completion_tokens': rollup[2],
+                    'total_latency': rollup[3],
+                    'max_latency': rollup[4],
+                } for (api_key_id, hour, operation, model), rollup in rollups.items()])
+
+            if added < len(rollups):
+                logger.info('Dropped %d usage rollups of deleted API keys.', len(rollups) - added)
+
+        except IntegrityError:
+            logger.exception('Dropped %d usage rollups rejected by the database.', len(rollups))
+
+        except Exception:
+            logger.exception('Could not flush %d usage rollups, they will be retried.', len(rollups))
+
+            for key, rollup in rollups.items():
+                pending = self.__rollups.setdefault(key, [0, 0, 0, 0.0, 0.0])
+                for index in range(4):
+                    pending[index] += rollup[index]
+                pending[4] = max(pending[4], rollup[4])
+
+    async def run(self, interval: float = settings.USAGE_FLUSH_INTERVAL) -> None:
+        """
+        Flush the rollups periodically until cancelled.
+
+        Args:
+            interval (float, optional): Seconds between flushes. Defaults to USAGE_FLUSH_INTERVAL setting.
+        """
+        while True:
+            await sleep(interval)
+            await self.flush()
+
+
+usage_aggregator = UsageAggregator()
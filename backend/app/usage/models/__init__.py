@@ -0,0 +1,2 @@
+from .api_key_usage_model import ApiKeyUsage
+from .show_api_key_usage_schema import ShowApiKeyUsage
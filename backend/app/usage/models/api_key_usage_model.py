@@ -0,0 +1,94 @@
+"""
+ApiKeyUsage DB model.
+"""
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.ext.hybrid import hybrid_property
+from uuid import UUID
+
+from app.database import Base
+from app.utils.database import BinaryUUID
+
+
+class ApiKeyUsage(Base):
+    """
+    Usage of the model by an API key, aggregated per hour, operation and model.
+    """
+    __tablename__ = 'ApiKeyUsage'
+
+    # API key that made the calls
+    __api_key_id = Column('api_key_id',
+                          BinaryUUID,
+                          ForeignKey('ApiKey.id', ondelete='CASCADE', name='api_key_usage_api_key_fk'),
+                          primary_key=True)
+
+    # Start of the aggregated hour
+    __hour = Column('hour', DateTime, primary_key=True)
+
+    # Operation of the calls
+    __operation = Column('operation', String(length=32), primary_key=True)
+
+    # Model used by the calls
+    __model = Column('model', String(length=64), primary_key=True)
+
+    # Number of calls
+    __requests = Column('requests', Integer, nullable=False, default=0)
+
+    # Tokens sent to the model
+    __prompt_tokens = Column('prompt_tokens', Integer, nullable=False, default=0)
+
+    # Tokens generated by the model
+    __completion_tokens = Column('completion_tokens', Integer, nullable=False, default=0)
+
+    # Sum of the upstream latencies in seconds
+    __total_latency = Column('total_latency', Float, nullable=False, default=0)
+
+    # Maximum upstream latency in seconds
+    __max_latency = Column('max_latency', Float, nullable=False, default=0)
+
+    def __iter__(self) -> dict:
+        """
+        Get the API key usage as a dict.
+
+        Returns:
+            dict: API key usage as dict.
+        """
+        yield 'api_key_id', str(self.__api_key_id),
+        yield 'hour', self.__hour,
+        yield 'operation', self.__operation,
+        yield 'model', self.__model,
+        yield 'requests', self.__requests,
+        yield 'prompt_tokens', self.__prompt_tokens,
+        yield 'completion_tokens', self.__completion_tokens,
+        yield 'average_latency', self.__total_latency / self.__requests if self.__requests else 0,
+        yield 'max_latency', self.__max_latency
+
+    @hybrid_property
+    def api_key_id(self) -> UUID:
+        """
+        Get the ID of the API key.
+
+        Returns:
+            UUID: ID of the API key.
+        """
+        return self.__api_key_id
+
+    @api_key_id.setter
+    def api_key_id(self, value: Any) -> None:
+        raise AttributeError('ApiKeyUsage api key id is a read-only attribute.')
+
+    @hybrid_property
+    def hour(self) -> datetime:
+        """
+        Get the start of the aggregated hour.
+
+        Returns:
+            datetime: Start of the aggregated hour.
+        """
+        return self.__hour
+
+    @hour.setter
+    def hour(self, value: Any) -> None:
+        raise AttributeError('ApiKeyUsage hour is a read-only attribute.')
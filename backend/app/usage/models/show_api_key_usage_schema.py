@@ -0,0 +1,31 @@
+"""
+Schema for showing the usage of an API key.
+"""
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ShowApiKeyUsage(BaseModel):
+    """
+    Schema for showing the usage of an API key during an hour.
+    """
+    hour: datetime = Field(default=...,
+                           description='Start of the aggregated hour.',
+                           examples=[datetime.now(tz=timezone.utc).replace(minute=0, second=0, microsecond=0)])
+
+    operation: str = Field(default=..., description='Operation of the calls.', examples=['translate'])
+
+    model: str = Field(default=..., description='Model used by the calls.', examples=['gpt-3.5-turbo'])
+
+    requests: int = Field(default=..., description='Number of calls.', examples=[42])
+
+    prompt_tokens: int = Field(default=..., description='Tokens sent to the model.', examples=[5120])
+
+    completion_tokens: int = Field(default=..., description='Tokens generated by the model.', examples=[4096])
+
+    average_latency: float = Field(default=..., description='Average model latency in seconds.', examples=[0.82])
+
+    max_latency: float = Field(default=..., description='Maximum model latency in seconds.', examples=[2.4])
+
+    model_config = ConfigDict(extra='ignore', protected_namespaces=())
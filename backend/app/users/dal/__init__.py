@@ -1 +1,2 @@
+from .async_user_dal import AsyncUserDAL
 from .user_dal import UserDAL
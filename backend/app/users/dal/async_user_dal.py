@@ -0,0 +1,327 @@
+"""
+Async User Data Access Layer
+"""
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import and_, delete, insert, or_, Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from uuid import UUID, uuid4
+
+from app.settings import Priority
+from app.users.models import ApiKey, User
+from app.utils.database import primary_stickiness, read_only
+from app.utils.exceptions import ValidationException
+
+
+class AsyncUserDAL():
+    __session: AsyncSession
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Create a new AsyncUserDAL instance.
+
+        Args:
+            session (AsyncSession): Async database session.
+        """
+        self.__session = session
+
+    @read_only
+    async def get_user_by_id(self, id: UUID) -> User | None:
+        """
+        Get a user by ID.
+
+        Args:
+            id (UUID): User ID.
+
+        Returns:
+            User: User if it exists, None otherwise.
+        """
+        return (await self.__session.scalars(select(User).where(User.id == id))).first()
+
+    @read_only
+    async def get_user_by_email(self, email: str) -> User | None:
+        """
+        Get a user by email.
+
+        Args:
+            email (str): User email.
+
+        Returns:
+            User: User if it exists, None otherwise.
+        """
+        return (await self.__session.scalars(select(User).where(User.email == email))).first()
+
+    async def create_user(self, email: str, hashed_password: str) -> User:
+        """
+        Create a new user.
+
+        Args:
+            email (str): User email.
+            hashed_password (str): User hashed password.
+
+        Raises:
+            ValidationException: If the user with the new email already exists.
+
+        Returns:
+            User: Created user.
+        """
+        if await self.get_user_by_email(email=email):
+            raise ValidationException(message=f'User with email {email} already exists.')
+
+        user = User(email=email, hashed_password=hashed_password)
+
+        self.__session.add(instance=user)
+        await self.__session.flush()
+        await primary_stickiness.record_write(key=str(user.id))
+
+        return user
+
+    async def update_user(self, user: User, email: str | None = None, hashed_password: str | None = None) -> User:
+        """
+        Update a user.
+
+        Args:
+            user (User): User to update.
+            email (str | None, optional): New email. Defaults to None.
+            hashed_password (str | None, optional): New hashed password. Defaults to None.
+
+        Raises:
+            ValidationException: If the user with the new email already exists.
+
+        Returns:
+            User: Updated user.
+        """
+        if email is not None:
+            if await self.get_user_by_email(email=email) and email != user.email:
+                raise ValidationException(message='User with this email already exists.')
+
+        user_hash = hash(user)
+
+        if email is not None:
+            if email != user.email:
+                user.email = email
+
+        if hashed_password is not None:
+            user.update_password(hashed_password=hashed_password)
+
+        if user_hash != hash(user):
+            self.__session.add(instance=user)
+            await self.__session.flush()
+            await primary_stickiness.record_write(key=str(user.id))
+
+        return user
+
+    async def rehash_user_password(self, user: User, hashed_password: str) -> User:
+        """
+        Store the user password hashed with the current hashing parameters.
+
+        Args:
+            user (User): User whose password is rehashed.
+            hashed_password (str): Password hashed with the current hashing parameters.
+
+        Returns:
+            User: Updated user.
+        """
+        user.rehash_password(hashed_password=hashed_password)
+
+        self.__session.add(instance=user)
+        await self.__session.flush()
+
+        return user
+
+    async def delete_user(self, user: User) -> None:
+        """
+        Delete a user. Its API keys are deleted by the database without loading them.
+
+        Args:
+            user (User): User to delete.
+        """
+        await self.__session.delete(instance=user)
+        await self.__session.flush()
+
+    @read_only
+    async def get_api_key_by_id(self, id: UUID) -> ApiKey | None:
+        """
+        Get an API key by ID.
+
+        Args:
+            id (UUID): API key ID.
+
+        Returns:
+            User: API key if it exists, None otherwise.
+        """
+        return (await self.__session.scalars(select(ApiKey).where(ApiKey.id == id))).first()
+
+    @read_only
+    async def get_api_keys_page(self,
+                                user: User,
+                                limit: int,
+                                after: tuple[datetime, UUID] | None = None,
+                                columns: list[str] | None = None) -> list[Row]:
+        """
+        Get a page of the API keys of a user ordered by creation date and ID, selecting only the given columns
+        instead of loading the ApiKey entities.
+
+        Args:
+            user (User): User who owns the API keys.
+            limit (int): Maximum number of API keys.
+            after (tuple[datetime, UUID] | None, optional): Creation date and ID of the last API key of the previous
+            page. Defaults to None, the first page.
+            columns (list[str] | None, optional): ApiKey table columns to select, creation_date and id are always
+            selected. Defaults to None, all the columns.
+
+        Returns:
+            list[Row]: Selected columns of the API keys.
+        """
+        table = ApiKey.__table__
+        selected_columns = [table.c[column] for column in columns] if columns is not None else list(table.c)
+        for column in (table.c.creation_date, table.c.id):
+            if column not in selected_columns:
+                selected_columns.append(column)
+
+        statement = select(*selected_columns).where(table.c.user_id == user.id)
+        if after is not None:
+            creation_date, id = after
+            statement = statement.where(
+                or_(table.c.creation_date > creation_date,
+                    and_(table.c.creation_date == creation_date, table.c.id > id)))
+
+        statement = statement.order_by(table.c.creation_date, table.c.id).limit(limit)
+
+        return list(await self.__session.execute(statement))
+
+    async def has_legacy_api_keys(self) -> bool:
+        """
+        Check if any API key is still hashed with argon2, as the API keys created before the HMAC-SHA256 hashing.
+
+        Returns:
+            bool: True if an argon2 hashed API key exists, False otherwise.
+        """
+        table = ApiKey.__table__
+        return await self.__session.scalar(
+            select(table.c.id).where(table.c.secret_key.startswith('$argon2')).limit(1)) is not None
+
+    @read_only
+    async def get_api_key_by_secret_key(self, secret_key: str) -> ApiKey | None:
+        """
+        Get an API key by secret key, with its owner loaded in the same query.
+
+        Args:
+            secret_key (str): API key secret key.
+
+        Returns:
+            ApiKey: API key if it exists, None otherwise.
+        """
+        return (await self.__session.scalars(
+            select(ApiKey).where(ApiKey.secret_key == secret_key).options(joinedload(ApiKey._ApiKey__user)))).first()
+
+    async def create_api_key(self, user: User, name: str, secret_key: str, hashed_secret_key: str) -> ApiKey:
+        """
+        Create a new API key with the standard priority.
+
+        Args:
+            user (User): User who owns the API key.
+            name (str): API key name.
+            secret_key (str): API key secret key.
+            hashed_secret_key (str): API key hashed secret key.
+
+        Returns:
+            ApiKey: Created API key.
+        """
+        api_key = ApiKey(user=user, name=name, secret_key=secret_key, hashed_secret_key=hashed_secret_key)
+
+        self.__session.add(instance=api_key)
+        await self.__session.flush()
+        await primary_stickiness.record_write(key=str(user.id))
+
+        return api_key
+
+    async def create_api_keys(self, user: User, names: list[str], secret_keys: list[str],
+                              hashed_secret_keys: list[str]) -> list[dict[str, Any]]:
+        """
+        Create several API keys with the standard priority with a single multi-row insert.
+
+        Args:
+            user (User): User who owns the API keys.
+            names (list[str]): API key names.
+            secret_keys (list[str]): API key secret keys, only used to build the public keys.
+            hashed_secret_keys (list[str]): API key hashed secret keys.
+
+        Returns:
+            list[dict[str, Any]]: Created API keys with the ApiKey table column names, in the same order.
+        """
+        creation_date = datetime.now(tz=timezone.utc)
+        rows = [{
+            'id': uuid4(),
+            'name': name,
+            'secret_key': hashed_secret_key,
+            'public_key': ApiKey.build_public_key(secret_key=secret_key),
+            'user_id': user.id,
+            'priority': Priority.STANDARD,
+            'creation_date': creation_date,
+            'last_utilization_date': None,
+        } for name, secret_key, hashed_secret_key in zip(names, secret_keys, hashed_secret_keys)]
+
+        await self.__session.execute(insert(ApiKey.__table__).values(rows))
+        await primary_stickiness.record_write(key=str(user.id))
+
+        return rows
+
+    async def update_api_key(self, api_key: ApiKey, name: str | None = None) -> ApiKey:
+        """
+        Update an API key.
+
+        Args:
+            api_key (ApiKey): API key to update.
+            name (str | None, optional): New name. Defaults to None.
+
+        Returns:
+            ApiKey: Updated API key.
+        """
+        api_key_hash = hash(api_key)
+
+        if name is not None:
+            if name != api_key.name:
+                api_key.name = name
+
+        if api_key_hash != hash(api_key):
+            self.__session.add(instance=api_key)
+            await self.__session.flush()
+            await primary_stickiness.record_write(key=str(api_key.user_id))
+
+        return api_key
+
+    async def delete_api_key(self, api_key: ApiKey) -> None:
+        """
+        Delete an API key.
+
+        Args:
+            api_key (ApiKey): API key to delete.
+        """
+        await self.__session.delete(instance=api_key)
+        await self.__session.flush()
+        await primary_stickiness.record_write(key=str(api_key.user_id))
+
+    async def delete_api_keys(self, user: User, ids: list[UUID]) -> list[UUID]:
+        """
+        Delete several API keys of a user with a single statement. The IDs that do not exist or belong to another
+        user are ignored.
+
+        Args:
+            user (User): User who owns the API keys.
+            ids (list[UUID]): API key IDs.
+
+        Returns:
+            list[UUID]: IDs of the deleted API keys.
+        """
+        table = ApiKey.__table__
+        condition = and_(table.c.user_id == user.id, table.c.id.in_(ids))
+
+        deleted_ids = list(await self.__session.scalars(select(table.c.id).where(condition).with_for_update()))
+        if deleted_ids:
+            await self.__session.execute(delete(table).where(condition))
+            await primary_stickiness.record_write(key=str(user.id))
+
+        return deleted_ids
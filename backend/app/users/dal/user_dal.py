@@ -1,9 +1,13 @@
 """
 User Data Access Layer
 """
-from sqlalchemy.orm import Session
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import joinedload, Session
 from uuid import UUID
 
+from app.settings import Priority
 from app.users.models import ApiKey, User
 from app.utils.exceptions import ValidationException
 
@@ -30,7 +34,7 @@ class UserDAL():
         Returns:
             User: User if it exists, None otherwise.
         """
-        return self.__session.query(User).filter(User.id == str(id)).first()
+        return self.__session.query(User).filter(User.id == id).first()
 
     def get_user_by_email(self, email: str) -> User | None:
         """
@@ -44,13 +48,13 @@ class UserDAL():
         """
         return self.__session.query(User).filter(User.email == email).first()
 
-    def create_user(self, email: str, password: str) -> User:
+    def create_user(self, email: str, hashed_password: str) -> User:
         """
         Create a new user.
 
         Args:
             email (str): User email.
-            password (str): User password.
+            hashed_password (str): User hashed password.
 
         Raises:
             ValidationException: If the user with the new email already exists.
@@ -61,21 +65,47 @@ class UserDAL():
         if self.get_user_by_email(email=email):
             raise ValidationException(message=f'User with email {email} already exists.')
 
-        user = User(email=email, password=password)
+        user = User(email=email, hashed_password=hashed_password)
 
         self.__session.add(instance=user)
         self.__session.commit()
 
         return user
 
-    def update_user(self, user: User, email: str | None = None, password: str | None = None) -> User:
+    def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """
+        Get which of the emails already belong to a user, with a single query.
+
+        Args:
+            emails (list[str]): Emails to check.
+
+        Returns:
+            set[str]: Emails that already belong to a user.
+        """
+        if not emails:
+            return set()
+
+        return set(self.__session.scalars(select(User.__table__.c.email).where(User.__table__.c.email.in_(emails))))
+
+    def create_users(self, users: list[dict[str, Any]]) -> None:
+        """
+        Create several users with a single multi-row insert. The users are not committed, so the caller can commit
+        several batches at once.
+
+        Args:
+            users (list[dict[str, Any]]): Users with the User table column names.
+        """
+        if users:
+            self.__session.execute(insert(User.__table__), users)
+
+    def update_user(self, user: User, email: str | None = None, hashed_password: str | None = None) -> User:
         """
         Update a user.
 
         Args:
             user (User): User to update.
             email (str | None, optional): New email. Defaults to None.
-            password (str | None, optional): New password. Defaults to None.
+            hashed_password (str | None, optional): New hashed password. Defaults to None.
 
         Raises:
             ValidationException: If the user with the new email already exists.
@@ -93,8 +123,8 @@ class UserDAL():
             if email != user.email:
                 user.email = email
 
-        if password is not None:
-            user.update_password(new_password=password)
+        if hashed_password is not None:
+            user.update_password(hashed_password=hashed_password)
 
         if user_hash != hash(user):
             self.__session.add(instance=user)
@@ -102,9 +132,27 @@ class UserDAL():
 
         return user
 
+    def rehash_user_password(self, user: User, hashed_password: str) -> User:
+        """
+        Store the user password hashed with the current hashing parameters.
+
+        Args:
+            user (User): User whose password is rehashed.
+            hashed_password (str): Password hashed with the current hashing parameters.
+
+        Returns:
+            User: Updated user.
+        """
+        user.rehash_password(hashed_password=hashed_password)
+
+        self.__session.add(instance=user)
+        self.__session.commit()
+
+        return user
+
     def delete_user(self, user: User) -> None:
         """
-        Delete a user.
+        Delete a user. Its API keys are deleted by the database without loading them.
 
         Args:
             user (User): User to delete.
@@ -122,11 +170,11 @@ class UserDAL():
         Returns:
             User: API key if it exists, None otherwise.
         """
-        return self.__session.query(ApiKey).filter(ApiKey.id == str(id)).first()
+        return self.__session.query(ApiKey).filter(ApiKey.id == id).first()
 
     def get_api_key_by_secret_key(self, secret_key: str) -> ApiKey | None:
         """
-        Get an API key by secret key.
+        Get an API key by secret key, with its owner loaded in the same query.
 
         Args:
             secret_key (str): API key secret key.
@@ -134,9 +182,15 @@ class UserDAL():
         Returns:
             ApiKey: API key if it exists, None otherwise.
         """
-        return self.__session.query(ApiKey).filter(ApiKey.secret_key == secret_key).first()
+        return self.__session.query(ApiKey).filter(ApiKey.secret_key == secret_key).options(
+            joinedload(ApiKey._ApiKey__user)).first()
 
-    def create_api_key(self, user: User, name: str, secret_key: str) -> ApiKey:
+    def create_api_key(self,
+                       user: User,
+                       name: str,
+                       secret_key: str,
+                       hashed_secret_key: str,
+                       priority: Priority = Priority.STANDARD) -> ApiKey:
         """
         Create a new API key.
 
@@ -144,24 +198,31 @@ class UserDAL():
             user (User): User who owns the API key.
             name (str): API key name.
             secret_key (str): API key secret key.
+            hashed_secret_key (str): API key hashed secret key.
+            priority (Priority, optional): API key scheduling priority. Defaults to Priority.STANDARD.
 
         Returns:
             ApiKey: Created API key.
         """
-        api_key = ApiKey(user=user, name=name, secret_key=secret_key)
+        api_key = ApiKey(user=user,
+                         name=name,
+                         secret_key=secret_key,
+                         hashed_secret_key=hashed_secret_key,
+                         priority=priority)
 
         self.__session.add(instance=api_key)
         self.__session.commit()
 
         return api_key
 
-    def update_api_key(self, api_key: ApiKey, name: str | None = None) -> ApiKey:
+    def update_api_key(self, api_key: ApiKey, name: str | None = None, priority: Priority | None = None) -> ApiKey:
         """
         Update an API key.
 
         Args:
             api_key (ApiKey): API key to update.
             name (str | None, optional): New name. Defaults to None.
+            priority (Priority | None, optional): New scheduling priority. Defaults to None.
 
         Returns:
             ApiKey: Updated API key.
@@ -172,6 +233,10 @@ class UserDAL():
             if name != api_key.name:
                 api_key.name = name
 
+        if priority is not None:
+            if priority != api_key.priority:
+                api_key.priority = priority
+
         if api_key_hash != hash(api_key):
             self.__session.add(instance=api_key)
             self.__session.commit()
@@ -0,0 +1,3 @@
+from .api_key_cursor import decode_api_key_cursor, encode_api_key_cursor
+from .user_provisioning import (load_checkpoint, provision_users, ProvisioningReport, read_user_records,
+                                save_checkpoint, validate_user_records)
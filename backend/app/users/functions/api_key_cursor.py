@@ -0,0 +1,45 @@
+"""
+This module contains the encoding of the keyset pagination cursors of the API keys.
+"""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+
+from uuid import UUID
+
+from app.utils.exceptions import ValidationException
+
+
+def encode_api_key_cursor(creation_date: datetime, id: UUID) -> str:
+    """
+    Encode the position of an API key as an opaque cursor.
+
+    Args:
+        creation_date (datetime): Creation date of the API key.
+        id (UUID): ID of the API key.
+
+    Returns:
+        str: URL safe cursor.
+    """
+    return urlsafe_b64encode(f'{creation_date.isoformat()}|{id}'.encode()).decode().rstrip('=')
+
+
+def decode_api_key_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor made by encode_api_key_cursor.
+
+    Args:
+        cursor (str): URL safe cursor.
+
+    Raises:
+        ValidationException: If the cursor is not valid.
+
+    Returns:
+        tuple[datetime, UUID]: Creation date and ID of the API key.
+    """
+    try:
+        creation_date, _, id = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode().partition('|')
+        return datetime.fromisoformat(creation_date), UUID(hex=id)
+
+    except (BinasciiError, UnicodeDecodeError, ValueError):
+        raise ValidationException(message='Invalid pagination cursor.')
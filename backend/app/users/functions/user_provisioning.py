@@ -0,0 +1,226 @@
+"""
+This module contains the bulk provisioning of users from CSV or JSONL files.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from csv import DictReader
+from datetime import datetime, timezone
+from itertools import islice
+from json import dumps, JSONDecodeError, loads
+from logging import getLogger
+from multiprocessing import get_context
+from os import cpu_count, replace
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from uuid import uuid4
+
+from app.database import session_maker
+from app.users.dal import UserDAL
+from app.users.models import CreateUser
+from app.utils.cryptography import password_hashing
+from app.utils.exceptions import ValidationException
+
+logger = getLogger(__name__)
+
+
+class ProvisioningReport(BaseModel):
+    """
+    Progress of a bulk provisioning, also stored as its checkpoint.
+    """
+    processed: int = Field(default=0, ge=0, description='Number of committed input records.', examples=[20000])
+
+    created: int = Field(default=0, ge=0, description='Number of created users.', examples=[19950])
+
+    duplicated: int = Field(default=0,
+                            ge=0,
+                            description='Number of records whose email already exists.',
+                            examples=[40])
+
+    invalid: int = Field(default=0, ge=0, description='Number of records that are not valid.', examples=[10])
+
+    model_config = ConfigDict(extra='forbid')
+
+
+def read_user_records(path: Path) -> Iterator[dict[str, Any] | None]:
+    """
+    Stream the user records of a CSV file with a header row, or of a JSONL file with a JSON object per line. The
+    format is chosen by the file extension.
+
+    Args:
+        path (Path): Path of the CSV or JSONL file.
+
+    Raises:
+        ValueError: If the file extension is not .csv, .jsonl or .ndjson.
+
+    Yields:
+        dict[str, Any] | None: User record, None if the line is not a JSON object.
+    """
+    suffix = path.suffix.lower()
+    if suffix not in ('.csv', '.jsonl', '.ndjson'):
+        raise ValueError(f'Unsupported file extension {suffix}, use .csv, .jsonl or .ndjson.')
+
+    with path.open(encoding='utf-8', newline='') as file:
+        if suffix == '.csv':
+            yield from DictReader(file)
+            return
+
+        for line in file:
+            if not line.strip():
+                continue
+
+            try:
+                record = loads(line)
+
+            except JSONDecodeError:
+                record = None
+
+            yield record if isinstance(record, dict) else None
+
+
+def load_checkpoint(checkpoint: Path) -> ProvisioningReport:
+    """
+    Load the progress of a previous provisioning of the same file.
+
+    Args:
+        checkpoint (Path): Path of the checkpoint file.
+
+    Returns:
+        ProvisioningReport: Progress of the previous provisioning, empty if there is no checkpoint.
+    """
+    if not checkpoint.exists():
+        return ProvisioningReport()
+
+    return ProvisioningReport.model_validate_json(checkpoint.read_text(encoding='utf-8'))
+
+
+def save_checkpoint(checkpoint: Path, report: ProvisioningReport) -> None:
+    """
+    Atomically store the progress of the provisioning.
+
+    Args:
+        checkpoint (Path): Path of the checkpoint file.
+        report (ProvisioningReport): Committed progress.
+    """
+    temporary_checkpoint = checkpoint.with_name(f'{checkpoint.name}.tmp')
+    temporary_checkpoint.write_text(dumps(report.model_dump()), encoding='utf-8')
+    replace(temporary_checkpoint, checkpoint)
+
+
+def validate_user_records(records: list[dict[str, Any] | None], first_record: int,
+                          report: ProvisioningReport) -> dict[str, str]:
+    """
+    Validate a batch of records with the CreateUser rules. When the password verification is missing, the password
+    is used. The emails are stripped and lowercased, as the email column ignores the case, so case variants of the
+    same email are counted as duplicated instead of failing the insert.
+
+    Args:
+        records (list[dict[str, Any] | None]): Batch of user records.
+        first_record (int): Position of the first record of the batch in the input, starting at 1.
+        report (ProvisioningReport): Report where the invalid and duplicated records are counted.
+
+    Returns:
+        dict[str, str]: Passwords of the valid records by lowercased email. Emails repeated in the batch keep the first
+        record.
+    """
+    users: dict[str, str] = {}
+    for position, record in enumerate(records, start=first_record):
+        try:
+            if record is None:
+                raise ValidationException(message='Record is not a JSON object.')
+
+            record.setdefault('password_verification', record.get('password'))
+            user = CreateUser(**record)
+
+        except (ValidationError, ValidationException) as exception:
+            logger.warning('Record %d is not valid: %s', position, exception)
+            report.invalid += 1
+            continue
+
+        email = user.email.strip().lower()
+        if email in users:
+            report.duplicated += 1
+            continue
+
+        users[email] = user.password
+
+    return users
+
+
+def provision_users(path: Path,
+                    checkpoint: Path,
+                    batch_size: int = 1000,
+                    commit_every: int = 5,
+                    workers: int | None = None) -> ProvisioningReport:
+    """
+    Create the users of a CSV or JSONL file. Each batch is validated, checked for existing emails with a single query,
+    hashed across a process pool and added with a single multi-row insert. The transaction is committed every few
+    batches and the progress is stored in the checkpoint, so a failed provisioning resumes after the last commit.
+    Existing emails, in any case, are skipped, so provisioning the same file again does not create duplicates.
+
+    Args:
+        path (Path): Path of the CSV or JSONL file.
+        checkpoint (Path): Path of the checkpoint file.
+        batch_size (int, optional): Number of records of each batch. Defaults to 1000.
+        commit_every (int, optional): Number of batches of each transaction. Defaults to 5.
+        workers (int | None, optional): Number of hashing processes. Defaults to the number of CPUs.
+
+    Returns:
+        ProvisioningReport: Progress of the provisioning.
+    """
+    workers = workers or cpu_count() or 1
+    report = load_checkpoint(checkpoint=checkpoint)
+    committed_report = report.model_copy()
+    if report.processed:
+        logger.info('Resuming after record %d.', report.processed)
+
+    records = islice(read_user_records(path=path), report.processed, None)
+    pending_batches = 0
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as executor:
+        session = session_maker()
+        try:
+            user_dal = UserDAL(session=session)
+
+            while batch := list(islice(records, batch_size)):
+                users = validate_user_records(records=batch, first_record=report.processed + 1, report=report)
+
+                existing_emails = {email.lower() for email in user_dal.get_existing_emails(emails=list(users))}
+                report.duplicated += len(existing_emails)
+                users = {email: password for email, password in users.items() if email not in existing_emails}
+
+                hashed_passwords = executor.map(password_hashing,
+                                                users.values(),
+                                                chunksize=max(1, len(users) // (workers * 4)))
+
+                now = datetime.now(tz=timezone.utc)
+                user_dal.create_users(users=[{
+                    'id': uuid4(),
+                    'email': email,
+                    'password': hashed_password,
+                    'creation_date': now,
+                    'update_date': now,
+                } for email, hashed_password in zip(users, hashed_passwords)])
+
+                report.created += len(users)
+                report.processed += len(batch)
+                pending_batches += 1
+
+                if pending_batches >= commit_every:
+                    session.commit()
+                    save_checkpoint(checkpoint=checkpoint, report=report)
+                    committed_report, pending_batches = report.model_copy(), 0
+                    logger.info('Committed %d records, %d users created.', report.processed, report.created)
+
+            session.commit()
+            save_checkpoint(checkpoint=checkpoint, report=report)
+
+        except BaseException:
+            session.rollback()
+            logger.error('Provisioning stopped, it can be resumed after record %d.', committed_report.processed)
+            raise
+
+        finally:
+            session_maker.remove()
+
+    return report
@@ -1,2 +1,3 @@
-from .api_keys import ApiKey, CreateApiKey, ShowApiKey, UpdateApiKey
+from .api_keys import (ApiKey, CreateApiKey, CreateApiKeys, DeleteApiKeys, ShowApiKey, ShowApiKeyPage,
+                       ShowDeletedApiKey, ShowPartialApiKey, UpdateApiKey)
 from .users import CreateUser, ShowUser, UpdateUser, User
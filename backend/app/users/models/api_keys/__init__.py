@@ -1,4 +1,9 @@
 from .api_key_model import ApiKey
 from .create_api_key_schema import CreateApiKey
+from .create_api_keys_schema import CreateApiKeys
+from .delete_api_keys_schema import DeleteApiKeys
+from .show_api_key_page_schema import ShowApiKeyPage
 from .show_api_key_schema import ShowApiKey
+from .show_deleted_api_key_schema import ShowDeletedApiKey
+from .show_partial_api_key_schema import ShowPartialApiKey
 from .update_api_key_schema import UpdateApiKey
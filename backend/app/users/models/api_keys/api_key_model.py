@@ -13,7 +13,8 @@ from sqlalchemy.orm import relationship
 from uuid import UUID, uuid4
 
 from app.database import Base
-from app.utils.cryptography import api_key_hashing
+from app.settings import Priority
+from app.utils.database import BinaryUUID
 
 if TYPE_CHECKING:
     from app.users.models import User
@@ -23,20 +24,26 @@ class ApiKey(Base):
     __tablename__ = 'ApiKey'
 
     # ID of the row
-    __id = Column('id', String(length=36), primary_key=True)
+    __id = Column('id', BinaryUUID, primary_key=True)
 
     # Name of the API key
     __name = Column('name', String(length=64), nullable=False)
 
     # Secret key
-    __secret_key = Column('secret_key', String(length=256), nullable=False, index=True)
+    __secret_key = Column('secret_key', String(length=256), nullable=False)
 
     # Public key
     __public_key = Column('public_key', String(length=13), nullable=False)
 
     # Owner of the API key
-    __user_id = Column('user_id', String(length=36), ForeignKey('User.id'), nullable=False)
-    __user = relationship('User', back_populates='_User__api_keys', lazy='joined')
+    __user_id = Column('user_id',
+                       BinaryUUID,
+                       ForeignKey('User.id', ondelete='CASCADE', name='api_key_user_fk'),
+                       nullable=False)
+    __user = relationship('User', back_populates='_User__api_keys', lazy='raise_on_sql')
+
+    # Scheduling priority of the model calls made with the API key
+    __priority = Column('priority', String(length=16), nullable=False, server_default=Priority.STANDARD.value)
 
     # API key creation date
     __creation_date = Column('creation_date', DateTime, nullable=False)
@@ -46,26 +53,48 @@ class ApiKey(Base):
 
     # Indexes
     __secret_key_index = Index('api_key_secret_key_index', __secret_key)
-    __user_index = Index('api_key_user_index', __user_id)
-
-    def __init__(self, name: str, secret_key: str, user: User) -> None:
+    __user_creation_index = Index('api_key_user_creation_index', __user_id, __creation_date, __id)
+
+    def __init__(self,
+                 name: str,
+                 secret_key: str,
+                 hashed_secret_key: str,
+                 user: User,
+                 priority: Priority = Priority.STANDARD) -> None:
         """
         Create a new API key.
 
         Args:
             name (str): Name of the API key.
-            secret_key (str): Secret key of the API key.
+            secret_key (str): Secret key of the API key, only used to build the public key.
+            hashed_secret_key (str): Hashed secret key of the API key.
             user (User): Owner of the API key.
+            priority (Priority, optional): Scheduling priority of the model calls. Defaults to Priority.STANDARD.
         """
         self.__id = uuid4()
         self.__name = name
-        self.__secret_key = api_key_hashing(api_key=secret_key)
-        self.__public_key = f'{secret_key[:5]}...{secret_key[-5:]}'
+        self.__secret_key = hashed_secret_key
+        self.__public_key = self.build_public_key(secret_key=secret_key)
+        self.__user_id = user.id
         self.__user = user
+        self.__priority = priority
 
         self.__creation_date = datetime.now(tz=timezone.utc)
         self.__last_utilization_date = None
 
+    @staticmethod
+    def build_public_key(secret_key: str) -> str:
+        """
+        Build the public key shown to the user from the secret key.
+
+        Args:
+            secret_key (str): Secret key of the API key.
+
+        Returns:
+            str: First and last 5 characters of the secret key.
+        """
+        return f'{secret_key[:5]}...{secret_key[-5:]}'
+
     @override
     def __eq__(self, other: Any) -> bool:
         """
@@ -101,7 +130,8 @@ class ApiKey(Base):
         yield 'name', self.__name,
         yield 'secret_key', self.__secret_key,
         yield 'public_key', self.__public_key,
-        yield 'user', str(self.__user.id),
+        yield 'user', str(self.__user_id),
+        yield 'priority', self.__priority,
         yield 'creation_date', self.__creation_date,
         yield 'last_utilization_date', self.__last_utilization_date
 
@@ -111,6 +141,15 @@ class ApiKey(Base):
         """
         self.__last_utilization_date = datetime.now(tz=timezone.utc)
 
+    def update_hashed_secret_key(self, hashed_secret_key: str) -> None:
+        """
+        Update the hashed secret key of the api key, when the secret key is rehashed with a new hashing function.
+
+        Args:
+            hashed_secret_key (str): New hashed secret key of the api key.
+        """
+        self.__secret_key = hashed_secret_key
+
     @hybrid_property
     def id(self) -> UUID:
         """
@@ -173,6 +212,20 @@ class ApiKey(Base):
     def public_key(self, value: Any) -> None:
         raise AttributeError('ApiKey public key is a read-only attribute.')
 
+    @hybrid_property
+    def user_id(self) -> UUID:
+        """
+        Get the ID of the owner of the api key, without loading the owner.
+
+        Returns:
+            UUID: ID of the owner of the api key.
+        """
+        return self.__user_id
+
+    @user_id.setter
+    def user_id(self, value: Any) -> None:
+        raise AttributeError('ApiKey user id is a read-only attribute.')
+
     @hybrid_property
     def user(self) -> User:
         """
@@ -187,6 +240,26 @@ class ApiKey(Base):
     def user(self, value: Any) -> None:
         raise AttributeError('ApiKey user is a read-only attribute.')
 
+    @hybrid_property
+    def priority(self) -> Priority:
+        """
+        Get the scheduling priority of the model calls made with the api key.
+
+        Returns:
+            Priority: Scheduling priority of the api key.
+        """
+        return self.__priority
+
+    @priority.setter
+    def priority(self, value: Priority) -> None:
+        """
+        Set the scheduling priority of the model calls made with the api key.
+
+        Args:
+            value (Priority): New scheduling priority of the api key.
+        """
+        self.__priority = value
+
     @hybrid_property
     def creation_date(self) -> datetime:
         """
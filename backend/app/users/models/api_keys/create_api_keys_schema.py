@@ -0,0 +1,23 @@
+"""
+Schema for creating several API keys.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+
+from .create_api_key_schema import CreateApiKey
+
+
+class CreateApiKeys(BaseModel):
+    """
+    Schema for creating several API keys in a single request.
+    """
+    api_keys: list[CreateApiKey] = Field(default=...,
+                                         min_length=1,
+                                         max_length=100,
+                                         description='API keys to create.',
+                                         examples=[[{
+                                             'name': 'Worker 1'
+                                         }, {
+                                             'name': 'Worker 2'
+                                         }]])
+
+    model_config = ConfigDict(extra='forbid')
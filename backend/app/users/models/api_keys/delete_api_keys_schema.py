@@ -0,0 +1,18 @@
+"""
+Schema for deleting several API keys.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+from uuid import UUID
+
+
+class DeleteApiKeys(BaseModel):
+    """
+    Schema for deleting several API keys in a single request.
+    """
+    ids: list[UUID] = Field(default=...,
+                            min_length=1,
+                            max_length=1000,
+                            description='IDs of the API keys to delete.',
+                            examples=[['a3186a65-fd74-40ab-88c4-e1a91145f0fc', '3fa164e4-220d-4b10-99ba-738e38ab9077']])
+
+    model_config = ConfigDict(extra='forbid')
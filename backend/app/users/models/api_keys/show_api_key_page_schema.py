@@ -0,0 +1,20 @@
+"""
+Schema for showing a page of API keys.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+
+from .show_partial_api_key_schema import ShowPartialApiKey
+
+
+class ShowApiKeyPage(BaseModel):
+    """
+    Schema for showing a page of API keys ordered by creation date.
+    """
+    items: list[ShowPartialApiKey] = Field(default=..., description='API keys of the page.')
+
+    next_cursor: str | None = Field(
+        default=None,
+        description='Cursor of the next page, None if this is the last page.',
+        examples=['MjAyNC0wNS0xMlQxMDozMDowMHxhMzE4NmE2NS1mZDc0LTQwYWItODhjNC1lMWE5MTE0NWYwZmM'])
+
+    model_config = ConfigDict(extra='ignore')
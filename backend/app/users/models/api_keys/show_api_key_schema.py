@@ -6,6 +6,8 @@ from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel, ConfigDict, Field
 from uuid import UUID
 
+from app.settings import Priority
+
 
 class ShowApiKey(BaseModel):
     """
@@ -19,6 +21,10 @@ class ShowApiKey(BaseModel):
                             description='Secret key of the new API key.',
                             examples=['8873344efbff3fa9a8ca3dd0b742797b0018ce3cb1d6c23b0c424060f68f6e30'])
 
+    priority: Priority = Field(default=...,
+                               description='Scheduling priority of the model calls made with the API key.',
+                               examples=[Priority.STANDARD])
+
     creation_date: datetime = Field(default=...,
                                     description='Creation date of the API key.',
                                     examples=[datetime.now(tz=timezone.utc)])
@@ -0,0 +1,18 @@
+"""
+Schema for showing the result of deleting an API key.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+from uuid import UUID
+
+
+class ShowDeletedApiKey(BaseModel):
+    """
+    Schema for showing if an API key of a bulk delete was deleted.
+    """
+    id: UUID = Field(default=..., description='ID of the API key.', examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc'])
+
+    deleted: bool = Field(default=...,
+                          description='True if the API key was deleted, False if it was not found.',
+                          examples=[True])
+
+    model_config = ConfigDict(extra='ignore')
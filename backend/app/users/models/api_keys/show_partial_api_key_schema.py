@@ -0,0 +1,38 @@
+"""
+Schema for showing the requested fields of an API key.
+"""
+from datetime import datetime, timedelta, timezone
+
+from pydantic import BaseModel, ConfigDict, Field
+from uuid import UUID
+
+from app.settings import Priority
+
+
+class ShowPartialApiKey(BaseModel):
+    """
+    Schema for showing the requested fields of an API key. The fields that were not requested are omitted.
+    """
+    id: UUID | None = Field(default=None,
+                            description='ID of the API key.',
+                            examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc'])
+
+    name: str | None = Field(default=None, description='Name of the API key.', examples=['Development'])
+
+    secret_key: str | None = Field(default=None,
+                                   description='Public part of the secret key.',
+                                   examples=['8873...f6e30'])
+
+    priority: Priority | None = Field(default=None,
+                                      description='Scheduling priority of the model calls made with the API key.',
+                                      examples=[Priority.STANDARD])
+
+    creation_date: datetime | None = Field(default=None,
+                                           description='Creation date of the API key.',
+                                           examples=[datetime.now(tz=timezone.utc)])
+
+    last_utilization_date: datetime | None = Field(default=None,
+                                                   description='Last utilization date of the API key.',
+                                                   examples=[datetime.now(tz=timezone.utc) + timedelta(hours=2)])
+
+    model_config = ConfigDict(extra='ignore')
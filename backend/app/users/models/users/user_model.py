@@ -5,21 +5,22 @@ from datetime import datetime, timezone
 from typing import Any
 from typing_extensions import override
 
-from sqlalchemy import Column, DateTime, Index, String
+from sqlalchemy import Column, DateTime, inspect, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from uuid import UUID, uuid4
 
 from app.database import Base
 from app.users.models.api_keys import ApiKey
-from app.utils.cryptography import password_checking, password_hashing
+from app.utils.cryptography import password_checking_async, password_needs_rehash
+from app.utils.database import BinaryUUID
 
 
 class User(Base):
     __tablename__ = 'User'
 
     # ID of the row
-    __id = Column('id', String(length=36), primary_key=True)
+    __id = Column('id', BinaryUUID, primary_key=True)
 
     # Email of the user
     __email = Column('email', String(length=320), nullable=False, unique=True, index=True)
@@ -33,23 +34,25 @@ class User(Base):
     # User last update date
     __update_date = Column('update_date', DateTime, nullable=False)
 
-    # User API keys
-    __api_keys = relationship('ApiKey', back_populates='_ApiKey__user', lazy='joined', cascade='all, delete-orphan')
+    # User API keys, only loaded by the DAL methods that need them. They are deleted by the database with the user
+    __api_keys = relationship('ApiKey',
+                              back_populates='_ApiKey__user',
+                              lazy='raise_on_sql',
+                              cascade='all, delete-orphan',
+                              passive_deletes=True)
 
-    # Indexes
-    email_index = Index('user_email_index', __email)
-
-    def __init__(self, email: str, password: str) -> None:
+    def __init__(self, email: str, hashed_password: str) -> None:
         """
         Create a new user.
 
         Args:
             email (str): Email of the user.
-            password (str): Unhashed password of the user.
+            hashed_password (str): Hashed password of the user.
         """
         self.__id = uuid4()
         self.__email = email
-        self.update_password(new_password=password)
+        self.__api_keys = []
+        self.update_password(hashed_password=hashed_password)
 
         self.__creation_date = datetime.now(tz=timezone.utc)
         self.__update_date = datetime.now(tz=timezone.utc)
@@ -81,6 +84,7 @@ class User(Base):
         """
         Get user as a dict for private use.
         Private use means that the dict will contain sensitive information.
+        The API keys are only included if they are loaded.
 
         Returns:
             dict: Product as dict.
@@ -90,7 +94,8 @@ class User(Base):
         yield 'password', self.__password,  # Hashed password!
         yield 'creation_date', self.__creation_date,
         yield 'update_date', self.__update_date,
-        yield 'api_keys', [str(api_key.id) for api_key in self.__api_keys]
+        if '_User__api_keys' not in inspect(self).unloaded:
+            yield 'api_keys', [str(api_key.id) for api_key in self.__api_keys]
 
     def __update_update_date(self) -> None:
         """
@@ -98,9 +103,9 @@ class User(Base):
         """
         self.__update_date = datetime.now(tz=timezone.utc)
 
-    def check_password(self, password: str) -> bool:
+    async def check_password(self, password: str) -> bool:
         """
-        Check if the password is correct.
+        Check if the password is correct. The check runs in the hashing process pool.
 
         Args:
             password (str): Unhashed password to check.
@@ -108,18 +113,37 @@ class User(Base):
         Returns:
             bool: True if the password is correct, False otherwise.
         """
-        return password_checking(password=password, hashed_password=self.__password)
+        return await password_checking_async(password=password, hashed_password=self.__password)
 
-    def update_password(self, new_password: str) -> None:
+    def update_password(self, hashed_password: str) -> None:
         """
         Update the password of the user.
 
         Args:
-            password (str): New password of the user.
+            hashed_password (str): New hashed password of the user.
         """
-        self.__password = password_hashing(password=new_password)
+        self.__password = hashed_password
         self.__update_update_date()
 
+    def password_needs_rehash(self) -> bool:
+        """
+        Check if the password was hashed with outdated hashing parameters.
+
+        Returns:
+            bool: True if the password must be hashed again, False otherwise.
+        """
+        return password_needs_rehash(hashed_password=self.__password)
+
+    def rehash_password(self, hashed_password: str) -> None:
+        """
+        Replace the password hash with one made with the current hashing parameters. The update date is not changed
+        because the password itself is the same.
+
+        Args:
+            hashed_password (str): Password hashed with the current hashing parameters.
+        """
+        self.__password = hashed_password
+
     @hybrid_property
     def id(self) -> UUID:
         """
@@ -1,18 +1,36 @@
 """
 User routes.
 """
-from fastapi import APIRouter, Body, Depends, Path, status
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Body, Depends, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.database import session_maker
-from app.users.dal import UserDAL
-from app.users.models import CreateApiKey, CreateUser, ShowApiKey, ShowUser, UpdateApiKey, UpdateUser, User
-from app.utils.cryptography import check_user_logged_in, check_user_not_logged_in, generate_secret_key
+from app.database import get_session
+from app.usage.dal import UsageDAL
+from app.usage.models import ShowApiKeyUsage
+from app.users.dal import AsyncUserDAL
+from app.users.functions import decode_api_key_cursor, encode_api_key_cursor
+from app.users.models import (CreateApiKey, CreateApiKeys, CreateUser, DeleteApiKeys, ShowApiKey, ShowApiKeyPage,
+                              ShowDeletedApiKey, ShowUser, UpdateApiKey, UpdateUser, User)
+from app.utils.cryptography import (api_key_hashing, api_keys_hashing, check_user_logged_in, check_user_not_logged_in,
+                                    generate_secret_key, password_hashing_async)
 from app.utils.exceptions import NotFoundException, ValidationException
 from app.utils.models import ErrorSchema, MessageSchema
 
 router = APIRouter()
 
+# API key fields that can be requested and their ApiKey table columns
+API_KEY_FIELDS = {
+    'id': 'id',
+    'name': 'name',
+    'secret_key': 'public_key',
+    'priority': 'priority',
+    'creation_date': 'creation_date',
+    'last_utilization_date': 'last_utilization_date',
+}
+
 
 @router.get(
     path='',
@@ -83,28 +101,43 @@ async def get_user(user: User = Depends(dependency=check_user_logged_in)) -> Sho
                     }
                 }
             }
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message': 'The server is busy. Please try again later.',
+                        'error': 'Too Many Requests'
+                    }
+                }
+            }
         }
     })
 async def create_user(not_logged_user: User = Depends(dependency=check_user_not_logged_in),
-                      user_data: CreateUser = Body(default=..., description='New user data')) -> ShowUser:
+                      user_data: CreateUser = Body(default=..., description='New user data'),
+                      session: AsyncSession = Depends(dependency=get_session)) -> ShowUser:
     """
     Create new user account.
 
     Args:
         user_data (CreateUser): New user data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         UserCannotBeLoggedInException: If user is already logged in.
+        TooManyRequestsException: If the hashing queue is full.
 
     Returns:
         ShowUser: New user.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    hashed_password = await password_hashing_async(password=user_data.password)
+
+    user_dal = AsyncUserDAL(session=session)
 
-        new_user = user_dal.create_user(email=user_data.email, password=user_data.password)
+    new_user = await user_dal.create_user(email=user_data.email, hashed_password=hashed_password)
 
-        return ShowUser(**dict(new_user))
+    return ShowUser(**dict(new_user))
 
 
 @router.put(path='',
@@ -138,13 +171,15 @@ async def create_user(not_logged_user: User = Depends(dependency=check_user_not_
                 }
             })
 async def update_user(user_to_update: User = Depends(dependency=check_user_logged_in),
-                      user_data: UpdateUser = Body(default=..., description='Updated user data')) -> ShowUser:
+                      user_data: UpdateUser = Body(default=..., description='Updated user data'),
+                      session: AsyncSession = Depends(dependency=get_session)) -> ShowUser:
     """
     Update actual user account.
 
     Args:
         user_to_update (User): Current logged in user.
         user_data (UpdateUser): Updated user data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
@@ -153,16 +188,20 @@ async def update_user(user_to_update: User = Depends(dependency=check_user_logge
     Returns:
         ShowUser: Updated user.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    hashed_password = None
+    if user_data.password is not None:
+        if not await user_to_update.check_password(password=user_data.old_password):
+            raise ValidationException(message='User old password is incorrect.')
 
-        if user_data.password is not None:
-            if not user_to_update.check_password(password=user_data.old_password):
-                raise ValidationException(message='User old password is incorrect.')
+        hashed_password = await password_hashing_async(password=user_data.password)
 
-        updated_user = user_dal.update_user(user=user_to_update, email=user_data.email, password=user_data.password)
+    user_dal = AsyncUserDAL(session=session)
 
-        return ShowUser(**dict(updated_user))
+    updated_user = await user_dal.update_user(user=user_to_update,
+                                              email=user_data.email,
+                                              hashed_password=hashed_password)
+
+    return ShowUser(**dict(updated_user))
 
 
 @router.delete(
@@ -205,12 +244,14 @@ async def update_user(user_to_update: User = Depends(dependency=check_user_logge
             }
         }
     })
-async def delete_user(user: User = Depends(dependency=check_user_logged_in)) -> MessageSchema:
+async def delete_user(user: User = Depends(dependency=check_user_logged_in),
+                      session: AsyncSession = Depends(dependency=get_session)) -> MessageSchema:
     """
     Delete current user account.
 
     Args:
         user (User): Current logged in user.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
@@ -218,35 +259,38 @@ async def delete_user(user: User = Depends(dependency=check_user_logged_in)) ->
     Returns:
         MessageSchema: Message about the operation.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    user_dal = AsyncUserDAL(session=session)
 
-        user_dal.delete_user(user=user)
+    await user_dal.delete_user(user=user)
 
     return MessageSchema(message=f'User with id {user.id} has been deleted.')
 
 
 @router.get(
     path='/api-keys',
-    summary='Get all API keys for the current user.',
-    description='Get all API keys for the current user.',
+    summary='Get the API keys of the current user.',
+    description='Get a page of the API keys of the current user ordered by creation date. Use the next_cursor of the '
+    'response to get the next page, and fields to only get some of the API key fields.',
+    response_model=ShowApiKeyPage,
+    response_model_exclude_unset=True,
     responses={
         status.HTTP_200_OK: {
-            'model': list[ShowApiKey],
+            'model': ShowApiKeyPage,
             'content': {
                 'application/json': {
-                    'example': [
-                        {
-                            'id': 'a3186a65-fd74-40ab-88c4-e1a91145f0fc',
-                            'name': 'Development',
-                            'secret_key': '8873344efbff3fa9a8ca3dd0b742797b0018ce3cb1d6c23b0c424060f68f6e30'
-                        },
-                        {
-                            'id': '3fa164e4-220d-4b10-99ba-738e38ab9077',
-                            'name': 'Production',
-                            'secret_key': '0fe5a1da2d7ba1df82ae33e95e30e75e81bd66ea65dad9d02abe8c8d90f0310f'
-                        },
-                    ]
+                    'example': {
+                        'items': [
+                            {
+                                'id': 'a3186a65-fd74-40ab-88c4-e1a91145f0fc',
+                                'name': 'Development'
+                            },
+                            {
+                                'id': '3fa164e4-220d-4b10-99ba-738e38ab9077',
+                                'name': 'Production'
+                            },
+                        ],
+                        'next_cursor': 'MjAyNC0wNS0xMlQxMDozMDowMHwzZmExNjRlNC0yMjBkLTRiMTAtOTliYS03MzhlMzhhYjkwNzc'
+                    }
                 }
             }
         },
@@ -275,29 +319,54 @@ async def delete_user(user: User = Depends(dependency=check_user_logged_in)) ->
             }
         }
     })
-async def get_api_keys(user: User = Depends(dependency=check_user_logged_in)) -> list[ShowApiKey]:
+async def get_api_keys(
+    user: User = Depends(dependency=check_user_logged_in),
+    cursor: str | None = Query(default=None, description='Cursor of the page, defaults to the first page.'),
+    limit: int = Query(default=50, ge=1, le=500, description='Maximum number of API keys of the page.'),
+    fields: str | None = Query(default=None,
+                               description=f'Comma separated API key fields, defaults to all. Valid fields are '
+                               f'{", ".join(API_KEY_FIELDS)}.',
+                               examples=['id,name']),
+    session: AsyncSession = Depends(dependency=get_session)
+) -> ShowApiKeyPage:
     """
-    Get all API keys for the current user.
+    Get a page of the API keys of the current user ordered by creation date.
 
     Args:
         user (User): Current logged in user.
+        cursor (str | None, optional): Cursor of the page. Defaults to the first page.
+        limit (int, optional): Maximum number of API keys of the page. Defaults to 50.
+        fields (str | None, optional): Comma separated API key fields. Defaults to all the fields.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
+        ValidationException: If the cursor or the fields are not valid.
 
     Returns:
-        list[ShowApiKey]: All API keys of the user.
+        ShowApiKeyPage: API keys of the page and cursor of the next page.
     """
-    with session_maker() as session:
-        session.add(instance=user)
+    requested_fields = list(API_KEY_FIELDS) if fields is None else [field.strip() for field in fields.split(',')]
+    invalid_fields = [field for field in requested_fields if field not in API_KEY_FIELDS]
+    if invalid_fields:
+        raise ValidationException(message=f'Invalid API key fields: {", ".join(invalid_fields)}.')
+
+    user_dal = AsyncUserDAL(session=session)
+
+    # One extra row tells if there is a next page
+    rows = await user_dal.get_api_keys_page(user=user,
+                                            limit=limit + 1,
+                                            after=decode_api_key_cursor(cursor=cursor) if cursor else None,
+                                            columns=[API_KEY_FIELDS[field] for field in requested_fields])
 
-        return_value = []
-        for api_key in user.api_keys:
-            show_api_key = ShowApiKey(**dict(api_key))
-            show_api_key.secret_key = api_key.public_key
-            return_value.append(show_api_key)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_api_key_cursor(creation_date=rows[-1].creation_date, id=rows[-1].id)
 
-        return return_value
+    items = [{field: row._mapping[API_KEY_FIELDS[field]] for field in requested_fields} for row in rows]
+
+    return ShowApiKeyPage(items=items, next_cursor=next_cursor)
 
 
 @router.get(
@@ -347,13 +416,15 @@ async def get_api_keys(user: User = Depends(dependency=check_user_logged_in)) ->
 async def get_api_key(user: User = Depends(dependency=check_user_logged_in),
                       api_key_id: UUID = Path(default=...,
                                               description='API key id to get.',
-                                              examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc'])) -> ShowApiKey:
+                                              examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc']),
+                      session: AsyncSession = Depends(dependency=get_session)) -> ShowApiKey:
     """
     Get an API key for the current user.
 
     Args:
         user (User): Current logged in user.
         api_key_id (UUID): API key id to get.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
@@ -363,20 +434,114 @@ async def get_api_key(user: User = Depends(dependency=check_user_logged_in),
     Returns:
         ShowApiKey: API key information.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    user_dal = AsyncUserDAL(session=session)
 
-        api_key = user_dal.get_api_key_by_id(id=api_key_id)
-        if api_key is None:
-            raise NotFoundException(message=f'API key with id {api_key_id} not found')
+    api_key = await user_dal.get_api_key_by_id(id=api_key_id)
+    if api_key is None:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
 
-        if api_key.user.id != user.id:
-            raise NotFoundException(message=f'API key with id {api_key_id} not found')
+    if api_key.user_id != user.id:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
 
-        return_value = ShowApiKey(**dict(api_key))
-        return_value.secret_key = api_key.public_key
+    return_value = ShowApiKey(**dict(api_key))
+    return_value.secret_key = api_key.public_key
 
-        return return_value
+    return return_value
+
+
+@router.get(
+    path='/api-key/{api_key_id}/usage',
+    summary='Get the hourly usage of an API key for the current user.',
+    description='Get the hourly model usage of an API key for the current user. The usage is updated periodically.',
+    responses={
+        status.HTTP_200_OK: {
+            'model': list[ShowApiKeyUsage],
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message': 'Invalid credentials. Please try again.',
+                        'error': 'Unauthorized'
+                    }
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message': 'API key with id a3186a65-fd74-40ab-88c4-e1a91145f0fc not found.',
+                        'error': 'Not Found'
+                    }
+                }
+            }
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message':
+                            'The server could not understand the request. Please check if it is correctly formatted.',
+                        'error':
+                            'Validation Error'
+                    }
+                }
+            }
+        }
+    })
+async def get_api_key_usage(
+    user: User = Depends(dependency=check_user_logged_in),
+    api_key_id: UUID = Path(default=...,
+                            description='API key id to get the usage of.',
+                            examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc']),
+    start: datetime | None = Query(default=None, description='Start of the period, defaults to 24 hours ago.'),
+    end: datetime | None = Query(default=None, description='End of the period, defaults to now.'),
+    session: AsyncSession = Depends(dependency=get_session)
+) -> list[ShowApiKeyUsage]:
+    """
+    Get the hourly usage of an API key for the current user.
+
+    Args:
+        user (User): Current logged in user.
+        api_key_id (UUID): API key id to get the usage of.
+        start (datetime | None, optional): Start of the period. Defaults to 24 hours ago.
+        end (datetime | None, optional): End of the period. Defaults to now.
+        session (AsyncSession): Session of the current request.
+
+    Raises:
+        InvalidCredentialsException: If user is not logged in.
+        NotFoundException: If API key with the given ID is not found.
+        NotFoundException: If API key does not belong to the current user.
+
+    Returns:
+        list[ShowApiKeyUsage]: Hourly usage of the API key.
+    """
+    end = end or datetime.now(tz=timezone.utc)
+    start = start or end - timedelta(days=1)
+
+    # The hours are stored as naive UTC and the driver drops the offsets, so the bounds are converted to naive UTC,
+    # and the bounds without an offset are taken as UTC
+    start, end = (value.astimezone(tz=timezone.utc).replace(tzinfo=None) if value.tzinfo is not None else value
+                  for value in (start, end))
+
+    user_dal = AsyncUserDAL(session=session)
+
+    api_key = await user_dal.get_api_key_by_id(id=api_key_id)
+    if api_key is None:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
+
+    if api_key.user_id != user.id:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
+
+    usage_dal = UsageDAL(session=session)
+
+    usages = await usage_dal.get_api_key_usage(api_key_id=api_key_id, start=start, end=end)
+
+    return [ShowApiKeyUsage(**dict(usage)) for usage in usages]
 
 
 @router.post(
@@ -413,13 +578,15 @@ async def get_api_key(user: User = Depends(dependency=check_user_logged_in),
         }
     })
 async def create_api_key(user: User = Depends(dependency=check_user_logged_in),
-                         api_key_data: CreateApiKey = Body(default=..., description='API key data')) -> ShowApiKey:
+                         api_key_data: CreateApiKey = Body(default=..., description='API key data'),
+                         session: AsyncSession = Depends(dependency=get_session)) -> ShowApiKey:
     """
     Create an API key for the current user.
 
     Args:
         user (User): User who owns the API key.
         api_key_data (CreateApiKey): API key data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
@@ -427,16 +594,20 @@ async def create_api_key(user: User = Depends(dependency=check_user_logged_in),
     Returns:
         ShowApiKey: Created API key.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    secret_key = generate_secret_key()
+    hashed_secret_key = api_key_hashing(api_key=secret_key)
+
+    user_dal = AsyncUserDAL(session=session)
 
-        secret_key = generate_secret_key()
-        api_key = user_dal.create_api_key(user=user, name=api_key_data.name, secret_key=secret_key)
+    api_key = await user_dal.create_api_key(user=user,
+                                            name=api_key_data.name,
+                                            secret_key=secret_key,
+                                            hashed_secret_key=hashed_secret_key)
 
-        return_value = ShowApiKey(**dict(api_key))
-        return_value.secret_key = secret_key
+    return_value = ShowApiKey(**dict(api_key))
+    return_value.secret_key = secret_key
 
-        return return_value
+    return return_value
 
 
 @router.put(
@@ -487,7 +658,8 @@ async def update_api_key(user: User = Depends(dependency=check_user_logged_in),
                          api_key_id: UUID = Path(default=...,
                                                  description='API key id to update.',
                                                  examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc']),
-                         api_key_data: UpdateApiKey = Body(default=..., description='API key data')) -> ShowApiKey:
+                         api_key_data: UpdateApiKey = Body(default=..., description='API key data'),
+                         session: AsyncSession = Depends(dependency=get_session)) -> ShowApiKey:
     """
     Update an API key for the current user.
 
@@ -495,6 +667,7 @@ async def update_api_key(user: User = Depends(dependency=check_user_logged_in),
         user (User): Current logged in user.
         api_key_id (UUID): API key id to update.
         api_key_data (UpdateApiKey): Updated API key data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
@@ -504,22 +677,21 @@ async def update_api_key(user: User = Depends(dependency=check_user_logged_in),
     Returns:
         ShowApiKey: Updated API key.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    user_dal = AsyncUserDAL(session=session)
 
-        api_key = user_dal.get_api_key_by_id(id=api_key_id)
-        if api_key is None:
-            raise NotFoundException(message=f'API key with id {api_key_id} not found')
+    api_key = await user_dal.get_api_key_by_id(id=api_key_id)
+    if api_key is None:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
 
-        if api_key.user.id != user.id:
-            raise NotFoundException(message=f'API key with id {api_key_id} not found')
+    if api_key.user_id != user.id:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
 
-        api_key = user_dal.update_api_key(api_key=api_key, name=api_key_data.name)
+    api_key = await user_dal.update_api_key(api_key=api_key, name=api_key_data.name)
 
-        return_value = ShowApiKey(**dict(api_key))
-        return_value.secret_key = api_key.public_key
+    return_value = ShowApiKey(**dict(api_key))
+    return_value.secret_key = api_key.public_key
 
-        return return_value
+    return return_value
 
 
 @router.delete(
@@ -576,12 +748,15 @@ async def update_api_key(user: User = Depends(dependency=check_user_logged_in),
 async def delete_api_key(user: User = Depends(dependency=check_user_logged_in),
                          api_key_id: UUID = Path(default=...,
                                                  description='API key id to delete.',
-                                                 examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc'])) -> MessageSchema:
+                                                 examples=['a3186a65-fd74-40ab-88c4-e1a91145f0fc']),
+                         session: AsyncSession = Depends(dependency=get_session)) -> MessageSchema:
     """
     Delete an API key for the current user.
 
     Args:
         user (User): Current logged in user.
+        api_key_id (UUID): API key id to delete.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If user is not logged in.
@@ -591,16 +766,137 @@ async def delete_api_key(user: User = Depends(dependency=check_user_logged_in),
     Returns:
         MessageSchema: Message about the operation.
     """
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    user_dal = AsyncUserDAL(session=session)
+
+    api_key = await user_dal.get_api_key_by_id(id=api_key_id)
+    if api_key is None:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
+
+    if api_key.user_id != user.id:
+        raise NotFoundException(message=f'API key with id {api_key_id} not found')
+
+    await user_dal.delete_api_key(api_key=api_key)
+
+    return MessageSchema(message=f'API key with id {api_key_id} has been deleted.')
 
-        api_key = user_dal.get_api_key_by_id(id=api_key_id)
-        if api_key is None:
-            raise NotFoundException(message=f'API key with id {api_key_id} not found')
 
-        if api_key.user.id != user.id:
-            raise NotFoundException(message=f'API key with id {api_key_id} not found')
+@router.post(
+    path='/api-keys',
+    summary='Create several API keys for the current user.',
+    description='Create several API keys for the current user in a single transaction. The API keys are returned in '
+    'the same order as they were requested.',
+    responses={
+        status.HTTP_201_CREATED: {
+            'model': list[ShowApiKey],
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message': 'Invalid credentials. Please try again.',
+                        'error': 'Unauthorized'
+                    }
+                }
+            }
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message':
+                            'The server could not understand the request. Please check if it is correctly formatted.',
+                        'error':
+                            'Validation Error'
+                    }
+                }
+            }
+        }
+    })
+async def create_api_keys(user: User = Depends(dependency=check_user_logged_in),
+                          api_keys_data: CreateApiKeys = Body(default=..., description='API keys data'),
+                          session: AsyncSession = Depends(dependency=get_session)) -> list[ShowApiKey]:
+    """
+    Create several API keys for the current user.
+
+    Args:
+        user (User): User who owns the API keys.
+        api_keys_data (CreateApiKeys): API keys data.
+        session (AsyncSession): Session of the current request.
+
+    Raises:
+        InvalidCredentialsException: If user is not logged in.
+
+    Returns:
+        list[ShowApiKey]: Created API keys, in the same order as they were requested.
+    """
+    secret_keys = [generate_secret_key() for _ in api_keys_data.api_keys]
+    hashed_secret_keys = api_keys_hashing(api_keys=secret_keys)
+
+    user_dal = AsyncUserDAL(session=session)
+
+    api_keys = await user_dal.create_api_keys(user=user,
+                                              names=[api_key_data.name for api_key_data in api_keys_data.api_keys],
+                                              secret_keys=secret_keys,
+                                              hashed_secret_keys=hashed_secret_keys)
+
+    return [ShowApiKey(**api_key | {'secret_key': secret_key}) for api_key, secret_key in zip(api_keys, secret_keys)]
+
+
+@router.post(
+    path='/api-keys/delete',
+    summary='Delete several API keys for the current user.',
+    description='Delete several API keys for the current user in a single transaction. The results are returned in '
+    'the same order as they were requested, API keys that are not found are not deleted.',
+    responses={
+        status.HTTP_200_OK: {
+            'model': list[ShowDeletedApiKey],
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message': 'Invalid credentials. Please try again.',
+                        'error': 'Unauthorized'
+                    }
+                }
+            }
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            'model': ErrorSchema,
+            'content': {
+                'application/json': {
+                    'example': {
+                        'message':
+                            'The server could not understand the request. Please check if it is correctly formatted.',
+                        'error':
+                            'Validation Error'
+                    }
+                }
+            }
+        }
+    })
+async def delete_api_keys(user: User = Depends(dependency=check_user_logged_in),
+                          api_keys_data: DeleteApiKeys = Body(default=..., description='API keys to delete'),
+                          session: AsyncSession = Depends(dependency=get_session)) -> list[ShowDeletedApiKey]:
+    """
+    Delete several API keys for the current user.
+
+    Args:
+        user (User): Current logged in user.
+        api_keys_data (DeleteApiKeys): API keys to delete.
+        session (AsyncSession): Session of the current request.
+
+    Raises:
+        InvalidCredentialsException: If user is not logged in.
+
+    Returns:
+        list[ShowDeletedApiKey]: Result of each API key, in the same order as they were requested.
+    """
+    user_dal = AsyncUserDAL(session=session)
 
-        user_dal.delete_api_key(api_key=api_key)
+    deleted_ids = set(await user_dal.delete_api_keys(user=user, ids=api_keys_data.ids))
 
-        return MessageSchema(message=f'API key with id {api_key_id} has been deleted.')
+    return [ShowDeletedApiKey(id=id, deleted=id in deleted_ids) for id in api_keys_data.ids]
@@ -1,5 +1,9 @@
-from .api_key import check_valid_api_key, generate_secret_key
-from .api_key.api_key_hashing import api_key_hashing
+from .api_key import (check_valid_api_key, current_api_key_id, current_api_key_priority, current_user_id,
+                      generate_secret_key, legacy_api_key_lookup, LegacyApiKeyLookup)
+from .api_key.api_key_hashing import (api_key_hashing, api_keys_hashing, legacy_api_key_hashing,
+                                     legacy_api_key_hashing_async)
+from .hashing_executor import hashing_executor
 from .jwt import check_token, create_token
-from .password import password_checking, password_hashing, password_security_requirements
+from .password import (calibrate_hashing_parameters, HashingParameters, password_checking, password_checking_async,
+                       password_hashing, password_hashing_async, password_needs_rehash, password_security_requirements)
 from .user import check_user_logged_in, check_user_not_logged_in, get_current_user
@@ -1,2 +1,3 @@
-from .api_key_checking import check_valid_api_key
+from .api_key_checking import check_valid_api_key, current_api_key_id, current_api_key_priority, current_user_id
 from .api_key_generation import generate_secret_key
+from .legacy_api_key_lookup import legacy_api_key_lookup, LegacyApiKeyLookup
@@ -3,66 +3,126 @@ API key functionalities module.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextvars import ContextVar
+from typing import AsyncIterator, TYPE_CHECKING
 
-from fastapi import Depends
+from fastapi import Depends, Request, Response
 from fastapi.security import APIKeyHeader
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import session_maker
+from app.database import get_session
+from app.settings import Priority
+from app.utils.database import current_reader
 from app.utils.exceptions import InvalidCredentialsException
+from app.utils.rate_limiting import api_key_rate_limiter, estimate_tokens
 
-from .api_key_hashing import api_key_hashing
+from .api_key_hashing import api_key_hashing, legacy_api_key_hashing_async
+from .legacy_api_key_lookup import legacy_api_key_lookup
 
 if TYPE_CHECKING:
-    from app.users.models import User
+    from app.users.models import ApiKey, User
 
 api_key_schema = APIKeyHeader(name='X-API-Key')
 
+# ID of the API key of the current request, used to meter its usage
+current_api_key_id: ContextVar[str | None] = ContextVar('current_api_key_id', default=None)
 
-def get_current_user(api_key: str) -> User:
+# Owner and priority of the API key of the current request, used to schedule its model calls
+current_user_id: ContextVar[str | None] = ContextVar('current_user_id', default=None)
+current_api_key_priority: ContextVar[Priority | None] = ContextVar('current_api_key_priority', default=None)
+
+
+async def get_current_api_key(api_key: str, session: AsyncSession) -> ApiKey:
     """
-    Get the current user from the token.
+    Get the current API key from its secret key and update its last utilization date.
 
     Args:
         api_key (str): API key data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
-        InvalidCredentialsException: If the token is invalid.
-        InvalidCredentialsException: If the user is not found.
+        InvalidCredentialsException: If the API key is not found.
 
     Returns:
-        User: The user that is logged in.
+        ApiKey: The API key, with its owner loaded.
     """
-    from app.users.dal import UserDAL
+    from app.users.dal import AsyncUserDAL
+
+    hashed_api_key = api_key_hashing(api_key=api_key)
 
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    user_dal = AsyncUserDAL(session=session)
 
-        result = user_dal.get_api_key_by_secret_key(secret_key=api_key_hashing(api_key=api_key))
-        if result is None:
-            raise InvalidCredentialsException(message='This API key does not exist.')
+    result = await user_dal.get_api_key_by_secret_key(secret_key=hashed_api_key)
+    if result is None and legacy_api_key_lookup.enabled:
+        # The API keys created before the HMAC-SHA256 hashing are found by their argon2 hash and rehashed
+        legacy_hashed_api_key = await legacy_api_key_hashing_async(api_key=api_key)
+        result = await user_dal.get_api_key_by_secret_key(secret_key=legacy_hashed_api_key)
+        if result is not None:
+            result.update_hashed_secret_key(hashed_secret_key=hashed_api_key)
 
-        result.update_last_utilization_date()
-        session.add(instance=result)
-        session.commit()
+    if result is None:
+        raise InvalidCredentialsException(message='This API key does not exist.')
 
-        return result.user
+    result.update_last_utilization_date()
+    await session.flush()
 
+    return result
 
-def check_valid_api_key(api_key: str = Depends(dependency=api_key_schema)) -> User:
+
+async def get_current_user(api_key: str, session: AsyncSession) -> User:
     """
-    Check if the a valid api key is provided and return the user.
+    Get the current user from the API key.
 
     Args:
+        api_key (str): API key data.
+        session (AsyncSession): Session of the current request.
+
+    Raises:
+        InvalidCredentialsException: If the API key is not found.
+
+    Returns:
+        User: The user that owns the API key.
+    """
+    return (await get_current_api_key(api_key=api_key, session=session)).user
+
+
+async def check_valid_api_key(request: Request,
+                              response: Response,
+                              api_key: str = Depends(dependency=api_key_schema),
+                              session: AsyncSession = Depends(dependency=get_session)) -> AsyncIterator[User]:
+    """
+    Check if the a valid api key is provided and return the user. The API key and user rate limits are enforced while
+    the request runs, and the rate limit headers are added to the response.
+
+    Args:
+        request (Request): Request object.
+        response (Response): Response object.
         api_key (str, optional): User api key, if it exists.
+        session (AsyncSession, optional): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If api key is missing.
+        TooManyRequestsException: If a rate limit of the API key or its owner is exceeded.
 
-    Returns:
+    Yields:
         User: The user that owns the api key.
     """
     if api_key is None:
         raise InvalidCredentialsException(message='API key is missing.')
 
-    return get_current_user(api_key=api_key)
+    current_api_key = await get_current_api_key(api_key=api_key, session=session)
+
+    # The model call does not use the database, so the connection is returned to the pool before it starts
+    await session.commit()
+    request.state.api_key_id = str(current_api_key.id)
+    current_api_key_id.set(str(current_api_key.id))
+    current_user_id.set(str(current_api_key.user_id))
+    current_reader.set(str(current_api_key.user_id))
+    current_api_key_priority.set(Priority(current_api_key.priority))
+
+    async with api_key_rate_limiter.limit(api_key_id=str(current_api_key.id),
+                                          user_id=str(current_api_key.user_id),
+                                          input_tokens=estimate_tokens(content=await request.body())) as headers:
+        response.headers.update(headers)
+
+        yield current_api_key.user
@@ -1,25 +1,63 @@
 """
 This module contains functions to hash and check api keys.
 """
-from argon2 import PasswordHasher, Type
+from hashlib import sha256
+from hmac import new as hmac_new
 
 from app.settings import settings
+from app.utils.cryptography.hashing_executor import hashing_executor
+from app.utils.cryptography.password_hasher import get_password_hasher
 
 
 def api_key_hashing(api_key: str) -> str:
     """
-    Hash the api key of the user.
+    Hash the api key of the user with HMAC-SHA256 keyed with the secret key. The api keys are random, so a keyed hash
+    is as safe as argon2 for them, and it does not depend on the password hashing parameters, which can be retuned.
 
     Args:
-        api keys (str): Api key of the user.
+        api_key (str): Api key of the user.
 
     Returns:
         str: Hashed api key of the user with hex encoding.
     """
-    return PasswordHasher(
-        time_cost=settings.HASHING_TIME_COST,
-        memory_cost=settings.HASHING_MEMORY_COST,
-        parallelism=settings.HASHING_PARALLELISM,
-        hash_len=settings.HASHING_HASH_LENGTH,
-        type=Type.ID,
-    ).hash(password=bytes(api_key, 'utf-8'), salt=bytes(settings.SECRET_KEY, 'utf-8'))
+    return hmac_new(key=bytes(settings.SECRET_KEY, 'utf-8'), msg=bytes(api_key, 'utf-8'), digestmod=sha256).hexdigest()
+
+
+def api_keys_hashing(api_keys: list[str]) -> list[str]:
+    """
+    Hash several api keys in a single call.
+
+    Args:
+        api_keys (list[str]): Api keys of the user.
+
+    Returns:
+        list[str]: Hashed api keys of the user with hex encoding, in the same order.
+    """
+    return [api_key_hashing(api_key=api_key) for api_key in api_keys]
+
+
+def legacy_api_key_hashing(api_key: str) -> str:
+    """
+    Hash the api key of the user with argon2 and the password hashing parameters, as the api keys created before the
+    HMAC-SHA256 hashing were hashed.
+
+    Args:
+        api_key (str): Api key of the user.
+
+    Returns:
+        str: Argon2 encoded hash of the api key.
+    """
+    return get_password_hasher().hash(password=bytes(api_key, 'utf-8'), salt=bytes(settings.SECRET_KEY, 'utf-8'))
+
+
+async def legacy_api_key_hashing_async(api_key: str) -> str:
+    """
+    Hash the api key of the user with argon2 in the hashing process pool.
+
+    Args:
+        api_key (str): Api key of the user.
+
+    Returns:
+        str: Argon2 encoded hash of the api key.
+    """
+    return await hashing_executor.run(legacy_api_key_hashing, api_key)
@@ -0,0 +1,46 @@
+"""
+This module contains the lookup of the API keys created before the HMAC-SHA256 hashing.
+"""
+from app.database import async_session_maker
+from app.settings import settings
+
+
+class LegacyApiKeyLookup():
+    """
+    Decides if the API keys that are not found by their HMAC-SHA256 hash are looked up by their argon2 hash. The argon2
+    hash runs in the shared hashing pool, so it is only paid while argon2 hashed API keys exist, which is checked on
+    startup, and never if API_KEY_LEGACY_HASHING is disabled.
+    """
+    __enabled: bool
+
+    def __init__(self) -> None:
+        """
+        Create a new LegacyApiKeyLookup instance, enabled until the check runs if API_KEY_LEGACY_HASHING is enabled.
+        """
+        self.__enabled = settings.API_KEY_LEGACY_HASHING
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Check if the API keys are looked up by their argon2 hash.
+
+        Returns:
+            bool: True if the argon2 lookup is enabled, False otherwise.
+        """
+        return self.__enabled
+
+    async def check(self) -> None:
+        """
+        Enable the argon2 lookup only if API_KEY_LEGACY_HASHING is enabled and an argon2 hashed API key exists.
+        """
+        from app.users.dal import AsyncUserDAL
+
+        if not settings.API_KEY_LEGACY_HASHING:
+            self.__enabled = False
+            return
+
+        async with async_session_maker() as session:
+            self.__enabled = await AsyncUserDAL(session=session).has_legacy_api_keys()
+
+
+legacy_api_key_lookup = LegacyApiKeyLookup()
@@ -0,0 +1,185 @@
+"""
+This module contains the process pool used to run the argon2 hashing functions outside the event loop.
+"""
+from asyncio import gather, get_running_loop, Semaphore
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from os import cpu_count
+from time import perf_counter
+from typing import Any, Callable
+
+from app.settings import settings
+from app.utils.exceptions import TooManyRequestsException
+from app.utils.metrics import metrics
+
+metrics.describe(name='hashing_queue_depth', description='Hashing operations waiting for a hashing slot.')
+metrics.describe(name='hashing_in_flight', description='Hashing operations running in the process pool.')
+metrics.describe(name='hashing_rejections_total', description='Hashing operations rejected because the queue was full.')
+metrics.describe(name='hashing_duration_seconds', description='Time spent running a hashing operation.')
+
+
+class HashingExecutor():
+    """
+    Bounded process pool that runs the memory-hard argon2 functions without blocking the event loop. At most
+    max_concurrency operations run at the same time and at most max_queue operations wait for a slot, the rest are
+    rejected immediately.
+    """
+    __max_workers: int | None
+    __max_concurrency: int
+    __max_queue: int
+    __executor: ProcessPoolExecutor | None
+    __semaphore: Semaphore
+    __queued: int
+    __in_flight: int
+    __average_time: float
+
+    def __init__(self, max_workers: int | None = None, max_concurrency: int | None = None, max_queue: int = 64) -> None:
+        """
+        Create a new HashingExecutor instance. The process pool is started on first use.
+
+        Args:
+            max_workers (int | None, optional): Maximum number of hashing processes. Defaults to the number of CPUs.
+            max_concurrency (int | None, optional): Maximum number of running hashing operations. Defaults to the
+            number of hashing processes.
+            max_queue (int, optional): Maximum number of hashing operations waiting for a slot. Defaults to 64.
+        """
+        self.__max_workers = max_workers
+        self.__max_concurrency = max_concurrency or max_workers or cpu_count() or 1
+        self.__max_queue = max_queue
+        self.__executor = None
+        self.__semaphore = Semaphore(value=self.__max_concurrency)
+        self.__queued = 0
+        self.__in_flight = 0
+        self.__average_time = 0.5
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool, starting it if it is not running.
+
+        Returns:
+            ProcessPoolExecutor: Process pool.
+        """
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.__max_workers, mp_context=get_context('spawn'))
+
+        return self.__executor
+
+    def __publish_metrics(self) -> None:
+        """
+        Publish the queue depth and the running operations.
+        """
+        metrics.set_gauge(name='hashing_queue_depth', value=self.__queued)
+        metrics.set_gauge(name='hashing_in_flight', value=self.__in_flight)
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Get the maximum number of running hashing operations.
+
+        Returns:
+            int: Maximum number of running hashing operations.
+        """
+        return self.__max_concurrency
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of hashing operations waiting for a slot.
+
+        Returns:
+            int: Number of waiting hashing operations.
+        """
+        return self.__queued
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Check if the queue is full, so new hashing operations would be rejected.
+
+        Returns:
+            bool: True if the queue is full, False otherwise.
+        """
+        return self.__queued >= self.__max_queue
+
+    @property
+    def retry_after(self) -> float:
+        """
+        Get the estimated seconds until the queued hashing operations finish.
+
+        Returns:
+            float: Estimated seconds until the queue is empty.
+        """
+        return self.__average_time * (self.__queued / self.__max_concurrency + 1)
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run the function in the process pool and wait for its result.
+
+        Args:
+            function (Callable[..., Any]): Module level function to run.
+            *args (Any): Positional arguments of the function.
+
+        Raises:
+            TooManyRequestsException: If the hashing queue is full.
+            BrokenProcessPool: If a hashing process died, the pool is restarted on the next call.
+
+        Returns:
+            Any: Result of the function.
+        """
+        if self.saturated:
+            metrics.increment(name='hashing_rejections_total')
+            raise TooManyRequestsException(message='The server is busy. Please try again later.',
+                                           retry_after=self.retry_after)
+
+        self.__queued += 1
+        self.__publish_metrics()
+        try:
+            await self.__semaphore.acquire()
+
+        finally:
+            self.__queued -= 1
+
+        self.__in_flight += 1
+        self.__publish_metrics()
+        start = perf_counter()
+        try:
+            return await get_running_loop().run_in_executor(self.__get_executor(), function, *args)
+
+        except BrokenProcessPool:
+            self.shutdown()
+            raise
+
+        finally:
+            elapsed_time = perf_counter() - start
+            self.__average_time = 0.9 * self.__average_time + 0.1 * elapsed_time
+            metrics.observe(name='hashing_duration_seconds', value=elapsed_time)
+
+            self.__in_flight -= 1
+            self.__semaphore.release()
+            self.__publish_metrics()
+
+    async def warm_up(self, function: Callable[..., Any], *args: Any) -> None:
+        """
+        Start the hashing processes running the function once per process, so the first requests do not pay for the
+        process start, the argon2 import and its first memory allocation.
+
+        Args:
+            function (Callable[..., Any]): Module level function to run.
+            *args (Any): Positional arguments of the function.
+        """
+        processes = min(self.__max_workers or cpu_count() or 1, self.__max_concurrency + self.__max_queue)
+        await gather(*(self.run(function, *args) for _ in range(processes)))
+
+    def shutdown(self) -> None:
+        """
+        Stop the process pool, if it is running.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+
+hashing_executor = HashingExecutor(max_workers=settings.HASHING_WORKERS,
+                                   max_concurrency=settings.HASHING_MAX_CONCURRENCY,
+                                   max_queue=settings.HASHING_MAX_QUEUE)
@@ -4,8 +4,6 @@ This module contains functions to create and validate JWT tokens.
 from datetime import datetime, timedelta, timezone
 from enum import StrEnum, unique
 
-from jose import jwt
-from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
 from uuid import UUID
 
 from app.settings import settings
@@ -47,6 +45,8 @@ def create_token(user_id: UUID) -> TokenSchema:
     Returns:
         TokenSchema: JWT token.
     """
+    from jose import jwt
+
     # yapf: disable
     expiration_datetime = (datetime.now(tz=timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRATION_DELTA)).timestamp()
     # yapf: enable
@@ -80,6 +80,9 @@ def check_token(token: str) -> TokenDataSchema:
     Returns:
         TokenDataSchema: Token data.
     """
+    from jose import jwt
+    from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+
     try:
         token_decoded = jwt.decode(token=token,
                                    key=settings.SECRET_KEY,
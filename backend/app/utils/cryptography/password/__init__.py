@@ -1,2 +1,4 @@
-from .password_hashing import password_checking, password_hashing
+from .password_calibration import calibrate_hashing_parameters, HashingParameters
+from .password_hashing import (password_checking, password_checking_async, password_hashing, password_hashing_async,
+                               password_needs_rehash)
 from .password_security import password_security_requirements
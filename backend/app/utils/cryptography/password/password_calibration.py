@@ -0,0 +1,126 @@
+"""
+This module contains the functions to benchmark argon2 and recommend the hashing parameters for the host.
+"""
+from os import urandom
+from statistics import median
+from time import perf_counter
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class HashingParameters(BaseModel):
+    """
+    Argon2 hashing parameters recommended by the calibration.
+    """
+    time_cost: int = Field(default=..., ge=1, description='Number of iterations.', examples=[3])
+
+    memory_cost: int = Field(default=..., ge=8, description='Memory usage in kibibytes.', examples=[47104])
+
+    parallelism: int = Field(default=..., ge=1, description='Number of parallel threads.', examples=[1])
+
+    hash_length: int = Field(default=..., ge=4, description='Length of the hash in bytes.', examples=[32])
+
+    hashing_time: float = Field(default=..., description='Measured hashing time in seconds.', examples=[0.48])
+
+    model_config = ConfigDict(extra='forbid')
+
+
+def measure_hashing_time(time_cost: int,
+                         memory_cost: int,
+                         parallelism: int,
+                         hash_length: int,
+                         samples: int = 3) -> float:
+    """
+    Measure the time to hash a password with the given argon2 parameters.
+
+    Args:
+        time_cost (int): Number of iterations.
+        memory_cost (int): Memory usage in kibibytes.
+        parallelism (int): Number of parallel threads.
+        hash_length (int): Length of the hash in bytes.
+        samples (int, optional): Number of measured hashes. Defaults to 3.
+
+    Returns:
+        float: Median hashing time in seconds.
+    """
+    from argon2 import Type
+    from argon2.low_level import hash_secret_raw
+
+    timings = []
+    for _ in range(samples):
+        start = perf_counter()
+        hash_secret_raw(secret=urandom(16),
+                        salt=urandom(16),
+                        time_cost=time_cost,
+                        memory_cost=memory_cost,
+                        parallelism=parallelism,
+                        hash_len=hash_length,
+                        type=Type.ID)
+        timings.append(perf_counter() - start)
+
+    return median(timings)
+
+
+def calibrate_hashing_parameters(target_time: float,
+                                 max_memory_cost: int,
+                                 parallelism: int = 1,
+                                 hash_length: int = 32,
+                                 samples: int = 3) -> HashingParameters:
+    """
+    Find the argon2 parameters that use as much memory as allowed and then as many iterations as the target hashing
+    time allows, following the RFC 9106 recommendation of maximizing memory first.
+
+    Args:
+        target_time (float): Maximum hashing time in seconds.
+        max_memory_cost (int): Maximum memory usage of a single hash in kibibytes.
+        parallelism (int, optional): Number of parallel threads. Defaults to 1.
+        hash_length (int, optional): Length of the hash in bytes. Defaults to 32.
+        samples (int, optional): Number of measured hashes per candidate. Defaults to 3.
+
+    Raises:
+        ValueError: If the target time or the memory budget are not positive.
+
+    Returns:
+        HashingParameters: Recommended hashing parameters.
+    """
+    if target_time <= 0:
+        raise ValueError('Target hashing time must be positive.')
+
+    if max_memory_cost < 8 * parallelism:
+        raise ValueError(f'Memory budget must be at least {8 * parallelism} KiB for parallelism {parallelism}.')
+
+    # Reduce the memory until a single iteration fits in the target time
+    memory_cost = max_memory_cost
+    hashing_time = measure_hashing_time(time_cost=1,
+                                        memory_cost=memory_cost,
+                                        parallelism=parallelism,
+                                        hash_length=hash_length,
+                                        samples=samples)
+    while hashing_time > target_time and memory_cost // 2 >= 8 * parallelism:
+        memory_cost //= 2
+        hashing_time = measure_hashing_time(time_cost=1,
+                                            memory_cost=memory_cost,
+                                            parallelism=parallelism,
+                                            hash_length=hash_length,
+                                            samples=samples)
+
+    # Hashing time grows linearly with the iterations, estimate them and correct the estimation with measurements
+    time_cost = max(1, int(target_time / hashing_time))
+    measured_time = measure_hashing_time(time_cost=time_cost,
+                                         memory_cost=memory_cost,
+                                         parallelism=parallelism,
+                                         hash_length=hash_length,
+                                         samples=samples)
+    while measured_time > target_time and time_cost > 1:
+        time_cost -= 1
+        measured_time = measure_hashing_time(time_cost=time_cost,
+                                             memory_cost=memory_cost,
+                                             parallelism=parallelism,
+                                             hash_length=hash_length,
+                                             samples=samples)
+
+    return HashingParameters(time_cost=time_cost,
+                             memory_cost=memory_cost,
+                             parallelism=parallelism,
+                             hash_length=hash_length,
+                             hashing_time=measured_time)
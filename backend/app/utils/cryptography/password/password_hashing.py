@@ -1,10 +1,9 @@
 """
 This module contains functions to hash and check passwords.
 """
-from argon2 import PasswordHasher, Type
-from argon2.exceptions import VerifyMismatchError
-
 from app.settings import settings
+from app.utils.cryptography.hashing_executor import hashing_executor
+from app.utils.cryptography.password_hasher import get_password_hasher
 
 
 def password_hashing(password: str) -> str:
@@ -17,13 +16,7 @@ def password_hashing(password: str) -> str:
     Returns:
         str: Hashed password of the user with hex encoding.
     """
-    return PasswordHasher(
-        time_cost=settings.HASHING_TIME_COST,
-        memory_cost=settings.HASHING_MEMORY_COST,
-        parallelism=settings.HASHING_PARALLELISM,
-        hash_len=settings.HASHING_HASH_LENGTH,
-        type=Type.ID,
-    ).hash(password=bytes(password, 'utf-8'), salt=bytes(settings.SECRET_KEY, 'utf-8'))
+    return get_password_hasher().hash(password=bytes(password, 'utf-8'), salt=bytes(settings.SECRET_KEY, 'utf-8'))
 
 
 def password_checking(password: str, hashed_password: str) -> bool:
@@ -37,14 +30,64 @@ def password_checking(password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password is correct, False otherwise.
     """
+    from argon2.exceptions import VerifyMismatchError
+
     try:
-        return PasswordHasher(
-            time_cost=settings.HASHING_TIME_COST,
-            memory_cost=settings.HASHING_MEMORY_COST,
-            parallelism=settings.HASHING_PARALLELISM,
-            hash_len=settings.HASHING_HASH_LENGTH,
-            type=Type.ID,
-        ).verify(hash=bytes(hashed_password, 'utf-8'), password=bytes(password, 'utf-8'))
+        return get_password_hasher().verify(hash=bytes(hashed_password, 'utf-8'), password=bytes(password, 'utf-8'))
 
     except VerifyMismatchError:
         return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check if the hashed password was made with hashing parameters different from the current ones. The salt length is
+    not compared because the passwords are salted with the secret key instead of a random salt.
+
+    Args:
+        hashed_password (str): Hashed password to check.
+
+    Returns:
+        bool: True if the password must be hashed again with the current parameters, False otherwise.
+    """
+    from argon2 import extract_parameters
+    from argon2.exceptions import InvalidHashError
+
+    try:
+        parameters = extract_parameters(hash=hashed_password)
+
+    except InvalidHashError:
+        return True
+
+    current_parameters = get_password_hasher()
+    return (parameters.type, parameters.time_cost, parameters.memory_cost, parameters.parallelism,
+            parameters.hash_len) != (current_parameters.type, current_parameters.time_cost,
+                                     current_parameters.memory_cost, current_parameters.parallelism,
+                                     current_parameters.hash_len)
+
+
+async def password_hashing_async(password: str) -> str:
+    """
+    Hash the password of the user in the hashing process pool.
+
+    Args:
+        password (str): Password of the user.
+
+    Returns:
+        str: Hashed password of the user with hex encoding.
+    """
+    return await hashing_executor.run(password_hashing, password)
+
+
+async def password_checking_async(password: str, hashed_password: str) -> bool:
+    """
+    Check if the password and the hashed password are the same in the hashing process pool.
+
+    Args:
+        password (str): Password to check.
+        hashed_password (str): Hashed password to compare.
+
+    Returns:
+        bool: True if password is correct, False otherwise.
+    """
+    return await hashing_executor.run(password_checking, password, hashed_password)
@@ -0,0 +1,29 @@
+"""
+This module contains the argon2 password hasher shared by the password and api key hashing functions.
+"""
+from functools import cache
+from typing import TYPE_CHECKING
+
+from app.settings import settings
+
+if TYPE_CHECKING:
+    from argon2 import PasswordHasher
+
+
+@cache
+def get_password_hasher() -> 'PasswordHasher':
+    """
+    Get the argon2 password hasher built from the hashing settings. It is built once per process and reused.
+
+    Returns:
+        PasswordHasher: Argon2 password hasher.
+    """
+    from argon2 import PasswordHasher, Type
+
+    return PasswordHasher(
+        time_cost=settings.HASHING_TIME_COST,
+        memory_cost=settings.HASHING_MEMORY_COST,
+        parallelism=settings.HASHING_PARALLELISM,
+        hash_len=settings.HASHING_HASH_LENGTH,
+        type=Type.ID,
+    )
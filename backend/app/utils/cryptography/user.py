@@ -7,9 +7,11 @@ from typing import TYPE_CHECKING
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import session_maker
+from app.database import get_session
 from app.utils.cryptography import check_token
+from app.utils.database import current_reader
 from app.utils.exceptions import InvalidCredentialsException, UserCannotBeLoggedInException
 
 if TYPE_CHECKING:
@@ -19,12 +21,13 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/auth/docs/login', auto_error=Tru
 not_logged_oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/auth/docs/login', auto_error=False)
 
 
-def get_current_user(token: str) -> User:
+async def get_current_user(token: str, session: AsyncSession) -> User:
     """
     Get the current user from the token.
 
     Args:
         token (str): Token data.
+        session (AsyncSession): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If the token is invalid.
@@ -33,26 +36,28 @@ def get_current_user(token: str) -> User:
     Returns:
         User: The user that is logged in.
     """
-    from app.users.dal import UserDAL
+    from app.users.dal import AsyncUserDAL
 
     data = check_token(token=token)
+    current_reader.set(str(data.sub))
 
-    with session_maker() as session:
-        user_dal = UserDAL(session=session)
+    user_dal = AsyncUserDAL(session=session)
 
-        user = user_dal.get_user_by_id(id=data.sub)
-        if user is None:
-            raise InvalidCredentialsException(message=f'User with ID {data.sub} not found.')
+    user = await user_dal.get_user_by_id(id=data.sub)
+    if user is None:
+        raise InvalidCredentialsException(message=f'User with ID {data.sub} not found.')
 
-        return user
+    return user
 
 
-def check_user_logged_in(token: str = Depends(dependency=oauth2_scheme)) -> User:
+async def check_user_logged_in(token: str = Depends(dependency=oauth2_scheme),
+                               session: AsyncSession = Depends(dependency=get_session)) -> User:
     """
     Checks if the user is logged in and returns it.
 
     Args:
         token (str, optional): User access token, if it exists.
+        session (AsyncSession, optional): Session of the current request.
 
     Raises:
         InvalidCredentialsException: If the user is not logged in.
@@ -63,7 +68,7 @@ def check_user_logged_in(token: str = Depends(dependency=oauth2_scheme)) -> User
     if token is None:
         raise InvalidCredentialsException(message='User is not logged in.')
 
-    return get_current_user(token=token)
+    return await get_current_user(token=token, session=session)
 
 
 def check_user_not_logged_in(token: str = Depends(dependency=not_logged_oauth2_scheme)) -> None:
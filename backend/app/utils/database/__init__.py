@@ -0,0 +1,8 @@
+from .binary_uuid import BinaryUUID
+from .idle_validation import validate_idle_connections
+from .in_memory_primary_stickiness_store import InMemoryPrimaryStickinessStore
+from .instrumented_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from .primary_stickiness import primary_stickiness, PrimaryStickiness
+from .primary_stickiness_store import PrimaryStickinessStore
+from .redis_primary_stickiness_store import RedisPrimaryStickinessStore
+from .routing_session import current_reader, read_only, reading_from_replica, RoutingSession
@@ -0,0 +1,53 @@
+"""
+This module contains the UUID column type stored as 16 raw bytes.
+"""
+from typing import Any
+
+from sqlalchemy import BINARY
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+from uuid import UUID
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID stored as BINARY(16) instead of its 36 characters text form, so the primary keys, the foreign keys and their
+    indexes take less than half of the space. Accepts UUID and str values and always returns UUID values.
+    """
+    impl = BINARY(length=16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        """
+        Convert the value to the 16 bytes of the UUID.
+
+        Args:
+            value (Any): UUID or str value.
+            dialect (Dialect): Database dialect.
+
+        Returns:
+            bytes | None: Bytes of the UUID, None if the value is None.
+        """
+        if value is None:
+            return None
+
+        if not isinstance(value, UUID):
+            value = UUID(hex=str(value))
+
+        return value.bytes
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> UUID | None:
+        """
+        Convert the 16 bytes to an UUID.
+
+        Args:
+            value (bytes | None): Stored bytes.
+            dialect (Dialect): Database dialect.
+
+        Returns:
+            UUID | None: UUID, None if the value is None.
+        """
+        if value is None:
+            return None
+
+        return UUID(bytes=bytes(value))
@@ -0,0 +1,35 @@
+"""
+This module contains the idle time based validation of pooled connections, a cheaper alternative to pre-ping.
+"""
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import DisconnectionError
+
+
+def validate_idle_connections(engine: Engine, idle_time: float) -> None:
+    """
+    Ping the pooled connections only when they have been idle for idle_time seconds, instead of on every checkout like
+    pool_pre_ping. If the ping fails, the pool discards the connection and checks out another one.
+
+    Args:
+        engine (Engine): Engine whose pool is validated, use AsyncEngine.sync_engine for async engines.
+        idle_time (float): Seconds a connection can be idle before it is validated.
+    """
+
+    @event.listens_for(engine, 'checkin')
+    def record_checkin_time(dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info['checkin_time'] = monotonic()
+
+    @event.listens_for(engine, 'checkout')
+    def validate_connection(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        checkin_time = connection_record.info.get('checkin_time')
+        if checkin_time is None or monotonic() - checkin_time < idle_time:
+            return
+
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+
+        except Exception as exception:
+            raise DisconnectionError('Idle database connection is no longer valid.') from exception
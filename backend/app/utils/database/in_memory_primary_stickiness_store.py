@@ -0,0 +1,59 @@
+"""
+This module contains the in-memory primary stickiness store.
+"""
+from collections import OrderedDict
+from time import monotonic
+
+from .primary_stickiness_store import PrimaryStickinessStore
+
+
+class InMemoryPrimaryStickinessStore(PrimaryStickinessStore):
+    """
+    Primary stickiness store local to the worker process, so a write is only seen by the reads of the same worker. At
+    most max_keys keys are kept, the least recently marked are removed first.
+    """
+    __max_keys: int
+    __expirations: OrderedDict[str, float]
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        """
+        Create a new InMemoryPrimaryStickinessStore instance.
+
+        Args:
+            max_keys (int, optional): Maximum number of marked keys. Defaults to 100_000.
+        """
+        self.__max_keys = max_keys
+        self.__expirations = OrderedDict()
+
+    async def mark(self, key: str, ttl: float) -> None:
+        """
+        Mark the key as sticky to the primary.
+
+        Args:
+            key (str): Key that wrote, usually the user ID.
+            ttl (float): Seconds the key is kept.
+        """
+        self.__expirations[key] = monotonic() + ttl
+        self.__expirations.move_to_end(key)
+        while len(self.__expirations) > self.__max_keys:
+            self.__expirations.popitem(last=False)
+
+    async def is_marked(self, key: str) -> bool:
+        """
+        Check if the key is marked.
+
+        Args:
+            key (str): Key that reads, usually the user ID.
+
+        Returns:
+            bool: True if the key was marked in the last ttl seconds, False otherwise.
+        """
+        expiration = self.__expirations.get(key)
+        if expiration is None:
+            return False
+
+        if monotonic() >= expiration:
+            del self.__expirations[key]
+            return False
+
+        return True
@@ -0,0 +1,96 @@
+"""
+This module contains the connection pools that publish their usage metrics.
+"""
+from logging import getLogger
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from app.settings import settings
+from app.utils.metrics import metrics
+
+logger = getLogger(__name__)
+
+metrics.describe(name='db_pool_checkout_seconds',
+                 description='Time waiting for a database connection from the pool.',
+                 buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30))
+metrics.describe(name='db_pool_checked_out', description='Database connections in use.')
+metrics.describe(name='db_pool_overflow', description='Database connections open above the pool size.')
+metrics.describe(name='db_pool_slow_checkouts_total',
+                 description='Database connection checkouts slower than DB_POOL_SLOW_CHECKOUT.')
+metrics.describe(name='db_pool_timeouts_total', description='Database connection checkouts that timed out.')
+
+
+class PoolInstrumentationMixin():
+    """
+    Times the connection checkouts and publishes the checked out and overflow connections of a queue pool, labelled
+    with the pool logging name. Slow checkouts are logged, so the pool can be sized against the number of workers.
+    """
+
+    def __labels(self) -> dict[str, str]:
+        """
+        Get the metric labels of the pool.
+
+        Returns:
+            dict[str, str]: Metric labels.
+        """
+        return {'pool': self.logging_name or 'default'}
+
+    def __publish_metrics(self) -> None:
+        """
+        Publish the checked out and overflow connections.
+        """
+        metrics.set_gauge(name='db_pool_checked_out', value=self.checkedout(), labels=self.__labels())
+        metrics.set_gauge(name='db_pool_overflow', value=max(0, self.overflow()), labels=self.__labels())
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection from the pool, timing the wait.
+
+        Raises:
+            TimeoutError: If no connection is available in DB_POOL_TIMEOUT seconds.
+
+        Returns:
+            PoolProxiedConnection: Checked out connection.
+        """
+        start = perf_counter()
+        try:
+            connection = super().connect()
+
+        except TimeoutError:
+            metrics.increment(name='db_pool_timeouts_total', labels=self.__labels())
+            raise
+
+        elapsed_time = perf_counter() - start
+        metrics.observe(name='db_pool_checkout_seconds', value=elapsed_time, labels=self.__labels())
+        if elapsed_time > settings.DB_POOL_SLOW_CHECKOUT:
+            metrics.increment(name='db_pool_slow_checkouts_total', labels=self.__labels())
+            logger.warning('Slow %s database connection checkout: %.3fs with %d connections in use.',
+                           self.logging_name or 'default', elapsed_time, self.checkedout())
+
+        self.__publish_metrics()
+        return connection
+
+    def _do_return_conn(self, record: Any) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            record (Any): Pool entry of the connection.
+        """
+        super()._do_return_conn(record)
+        self.__publish_metrics()
+
+
+class InstrumentedQueuePool(PoolInstrumentationMixin, QueuePool):
+    """
+    Queue pool of the sync engine that publishes its usage metrics.
+    """
+
+
+class InstrumentedAsyncQueuePool(PoolInstrumentationMixin, AsyncAdaptedQueuePool):
+    """
+    Queue pool of the async engines that publishes its usage metrics.
+    """
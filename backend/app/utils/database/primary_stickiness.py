@@ -0,0 +1,56 @@
+"""
+This module contains the registry of the users whose reads must go to the primary database after a write.
+"""
+from app.settings import settings
+
+from .in_memory_primary_stickiness_store import InMemoryPrimaryStickinessStore
+from .primary_stickiness_store import PrimaryStickinessStore
+from .redis_primary_stickiness_store import RedisPrimaryStickinessStore
+
+
+class PrimaryStickiness():
+    """
+    Remembers for ttl seconds the keys that wrote to the primary database, so their reads are not sent to a replica
+    that may not have the write yet. With several workers the store must be shared, otherwise the next request of
+    the user can be served by a worker that did not see the write.
+    """
+    __store: PrimaryStickinessStore
+    __ttl: float
+
+    def __init__(self, store: PrimaryStickinessStore, ttl: float) -> None:
+        """
+        Create a new PrimaryStickiness instance.
+
+        Args:
+            store (PrimaryStickinessStore): Store of the keys that wrote.
+            ttl (float): Seconds the reads stick to the primary after a write.
+        """
+        self.__store = store
+        self.__ttl = ttl
+
+    async def record_write(self, key: str) -> None:
+        """
+        Record a write of the key. Nothing is recorded without replicas, as every read already goes to the primary.
+
+        Args:
+            key (str): Key that wrote, usually the user ID.
+        """
+        if settings.DB_REPLICA_HOSTS:
+            await self.__store.mark(key=key, ttl=self.__ttl)
+
+    async def is_sticky(self, key: str) -> bool:
+        """
+        Check if the reads of the key must go to the primary.
+
+        Args:
+            key (str): Key that reads, usually the user ID.
+
+        Returns:
+            bool: True if the key wrote in the last ttl seconds, False otherwise.
+        """
+        return await self.__store.is_marked(key=key)
+
+
+primary_stickiness = PrimaryStickiness(store=RedisPrimaryStickinessStore(
+    url=settings.DB_READ_YOUR_WRITES_REDIS_URL) if settings.DB_READ_YOUR_WRITES_REDIS_URL
+    else InMemoryPrimaryStickinessStore(), ttl=settings.DB_READ_YOUR_WRITES_TTL)
@@ -0,0 +1,32 @@
+"""
+This module contains the interface of the primary stickiness stores.
+"""
+from abc import ABC, abstractmethod
+
+
+class PrimaryStickinessStore(ABC):
+    """
+    Store of the keys that wrote to the primary database. Shared stores keep the keys across several workers.
+    """
+
+    @abstractmethod
+    async def mark(self, key: str, ttl: float) -> None:
+        """
+        Mark the key as sticky to the primary.
+
+        Args:
+            key (str): Key that wrote, usually the user ID.
+            ttl (float): Seconds the key is kept.
+        """
+
+    @abstractmethod
+    async def is_marked(self, key: str) -> bool:
+        """
+        Check if the key is marked.
+
+        Args:
+            key (str): Key that reads, usually the user ID.
+
+        Returns:
+            bool: True if the key was marked in the last ttl seconds, False otherwise.
+        """
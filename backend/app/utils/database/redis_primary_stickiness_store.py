@@ -0,0 +1,58 @@
+"""
+This module contains the Redis primary stickiness store, shared by all the workers.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .primary_stickiness_store import PrimaryStickinessStore
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class RedisPrimaryStickinessStore(PrimaryStickinessStore):
+    """
+    Primary stickiness store kept in Redis, so a write sends to the primary the reads of every worker and replica.
+    Redis evicts the expired keys.
+    """
+    __client: Redis
+    __prefix: str
+
+    def __init__(self, url: str, prefix: str = 'primary-stickiness') -> None:
+        """
+        Create a new RedisPrimaryStickinessStore instance.
+
+        Args:
+            url (str): Redis URL.
+            prefix (str, optional): Prefix of the Redis keys. Defaults to 'primary-stickiness'.
+
+        Raises:
+            ImportError: If the redis package is not installed.
+        """
+        from redis.asyncio import Redis
+
+        self.__client = Redis.from_url(url=url)
+        self.__prefix = prefix
+
+    async def mark(self, key: str, ttl: float) -> None:
+        """
+        Mark the key as sticky to the primary.
+
+        Args:
+            key (str): Key that wrote, usually the user ID.
+            ttl (float): Seconds the key is kept.
+        """
+        await self.__client.set(name=f'{self.__prefix}:{key}', value=1, px=max(1, int(ttl * 1000)))
+
+    async def is_marked(self, key: str) -> bool:
+        """
+        Check if the key is marked.
+
+        Args:
+            key (str): Key that reads, usually the user ID.
+
+        Returns:
+            bool: True if the key was marked in the last ttl seconds, False otherwise.
+        """
+        return bool(await self.__client.exists(f'{self.__prefix}:{key}'))
@@ -0,0 +1,99 @@
+"""
+This module contains the session that sends the read-only DAL methods to the database replicas.
+"""
+from contextvars import ContextVar
+from functools import wraps
+from random import choice
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from app.settings import settings
+
+from .primary_stickiness import primary_stickiness
+
+T = TypeVar('T')
+
+# True while a read-only DAL method runs
+reading_from_replica: ContextVar[bool] = ContextVar('reading_from_replica', default=False)
+
+# ID of the user of the current request, whose reads stick to the primary after a write
+current_reader: ContextVar[str | None] = ContextVar('current_reader', default=None)
+
+
+class RoutingSession(Session):
+    """
+    Session that runs the queries of the read-only DAL methods on a random replica and everything else, including
+    every query after the session flushed a write, on the primary.
+    """
+    __replicas: list[Engine]
+    __has_written: bool
+
+    def __init__(self, replicas: list[Engine] | None = None, **kwargs: Any) -> None:
+        """
+        Create a new RoutingSession instance.
+
+        Args:
+            replicas (list[Engine] | None, optional): Replica engines. Defaults to None, everything runs on the
+            primary.
+            **kwargs (Any): Session arguments, the bind is the primary engine.
+        """
+        super().__init__(**kwargs)
+        self.__replicas = replicas or []
+        self.__has_written = False
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        """
+        Get the engine of the statement.
+
+        Args:
+            mapper (Any, optional): Mapper of the statement. Defaults to None.
+            clause (Any, optional): Statement. Defaults to None.
+            **kwargs (Any): Other get_bind arguments.
+
+        Returns:
+            Engine: Replica engine for the reads of the read-only DAL methods, primary engine otherwise.
+        """
+        if self._flushing:
+            self.__has_written = True
+
+        if self.__replicas and reading_from_replica.get() and not self.__has_written:
+            return choice(self.__replicas)
+
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def read_only(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Mark an async DAL method as read-only, so its queries can run on a replica. The method runs on the primary if the
+    user of the current request wrote recently, and it is retried on the primary if the replica returns None, because
+    the row may not have been replicated yet.
+
+    Args:
+        method (Callable[..., Awaitable[T]]): Read-only DAL method.
+
+    Returns:
+        Callable[..., Awaitable[T]]: Method routed to the replicas.
+    """
+
+    @wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        reader = current_reader.get()
+        if not settings.DB_REPLICA_HOSTS or (reader is not None and await primary_stickiness.is_sticky(key=reader)):
+            return await method(*args, **kwargs)
+
+        token = reading_from_replica.set(True)
+        try:
+            result = await method(*args, **kwargs)
+
+        finally:
+            reading_from_replica.reset(token)
+
+        if result is None:
+            result = await method(*args, **kwargs)
+
+        return result
+
+    return wrapper
+
@@ -0,0 +1,2 @@
+from .deadline_middleware import DeadlineMiddleware
+from .request_deadline import enforce_deadline, get_remaining_time, request_deadline
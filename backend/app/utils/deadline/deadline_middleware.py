@@ -0,0 +1,116 @@
+"""
+This module contains the middleware that sets the request deadline and cancels the requests of disconnected clients.
+"""
+from asyncio import CancelledError, create_task, get_running_loop, Queue
+from math import isfinite
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import metrics
+
+from .request_deadline import request_deadline
+
+metrics.describe(name='requests_cancelled_total', description='Requests cancelled because the client disconnected.')
+
+# Seconds the client waits for the response
+DEADLINE_HEADER = b'x-request-timeout'
+
+
+class DeadlineMiddleware():
+    """
+    Sets the deadline of the request from its X-Request-Timeout header, in seconds, which the model calls enforce, and
+    cancels the request when the client disconnects before the response is sent, so the model calls of abandoned
+    requests do not keep using tokens. It only wraps the paths with the given prefixes.
+    """
+    __app: ASGIApp
+    __path_prefixes: tuple[str, ...]
+
+    def __init__(self, app: ASGIApp, path_prefixes: tuple[str, ...]) -> None:
+        """
+        Create a new DeadlineMiddleware instance.
+
+        Args:
+            app (ASGIApp): Wrapped ASGI app.
+            path_prefixes (tuple[str, ...]): Prefixes of the paths of the cancellable requests.
+        """
+        self.__app = app
+        self.__path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle the request with its deadline, cancelling it if the client disconnects.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        if scope['type'] != 'http' or not scope['path'].startswith(self.__path_prefixes):
+            await self.__app(scope, receive, send)
+            return
+
+        timeout_header = dict(scope['headers']).get(DEADLINE_HEADER)
+        timeout = None
+        if timeout_header is not None:
+            try:
+                timeout = float(timeout_header)
+                if not isfinite(timeout) or timeout <= 0:
+                    raise ValueError
+
+            except ValueError:
+                response = JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                        content={
+                                            'message': 'X-Request-Timeout must be a positive number of seconds.',
+                                            'error': 'Validation Error'
+                                        })
+                await response(scope, receive, send)
+                return
+
+        response_sent = False
+        client_disconnected = False
+        messages: Queue[Message] = Queue()
+
+        async def watch_connection() -> None:
+            # Only reader of the connection, so the disconnect is noticed even if the app never reads the body
+            nonlocal client_disconnected
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message['type'] == 'http.disconnect':
+                    break
+
+            if not response_sent:
+                client_disconnected = True
+                metrics.increment(name='requests_cancelled_total', labels={'reason': 'client_disconnect'})
+                request_task.cancel()
+
+        async def receive_request() -> Message:
+            message = await messages.get()
+            if message['type'] == 'http.disconnect':
+                messages.put_nowait(message)
+
+            return message
+
+        async def send_response(message: Message) -> None:
+            nonlocal response_sent
+            if message['type'] == 'http.response.body' and not message.get('more_body', False):
+                response_sent = True
+
+            await send(message)
+
+        token = request_deadline.set(get_running_loop().time() + timeout if timeout is not None else None)
+        request_task = create_task(self.__app(scope, receive_request, send_response))
+        connection_watcher = create_task(watch_connection())
+        try:
+            await request_task
+
+        except CancelledError:
+            # The client is gone, there is nobody to send the response to
+            if not client_disconnected:
+                raise
+
+        finally:
+            request_deadline.reset(token)
+            connection_watcher.cancel()
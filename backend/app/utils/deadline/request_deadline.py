@@ -0,0 +1,56 @@
+"""
+This module contains the deadline of the current request and its enforcement on the model calls.
+"""
+from asyncio import CancelledError, get_running_loop, timeout_at
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator
+
+from app.utils.exceptions import DeadlineExceededException
+from app.utils.metrics import metrics
+
+metrics.describe(name='model_calls_cancelled_total', description='Model calls cancelled before the model answered.')
+
+# Event loop time after which the current request is abandoned, None if the request has no deadline
+request_deadline: ContextVar[float | None] = ContextVar('request_deadline', default=None)
+
+
+def get_remaining_time() -> float | None:
+    """
+    Get the seconds left until the deadline of the current request.
+
+    Returns:
+        float | None: Seconds until the deadline, negative if it already passed, or None if there is no deadline.
+    """
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+
+    return deadline - get_running_loop().time()
+
+
+@asynccontextmanager
+async def enforce_deadline() -> AsyncIterator[None]:
+    """
+    Cancel the model call when the deadline of the current request passes, which also closes its connection to the
+    provider, so the provider stops generating the tokens.
+
+    Raises:
+        DeadlineExceededException: If the deadline passes before the model call finishes.
+        CancelledError: If the request is cancelled, such as when the client disconnects.
+    """
+    deadline_timeout = timeout_at(when=request_deadline.get())
+    try:
+        async with deadline_timeout:
+            yield
+
+    except TimeoutError:
+        if not deadline_timeout.expired():
+            raise
+
+        metrics.increment(name='model_calls_cancelled_total', labels={'reason': 'deadline'})
+        raise DeadlineExceededException(message='The request deadline passed before the model answered.')
+
+    except CancelledError:
+        metrics.increment(name='model_calls_cancelled_total', labels={'reason': 'cancelled'})
+        raise
@@ -1,4 +1,8 @@
+from .deadline_exceeded_exception import DeadlineExceededException
 from .invalid_credentials_exception import InvalidCredentialsException
+from .model_unavailable_exception import ModelUnavailableException
 from .not_found_exception import NotFoundException
+from .service_unavailable_exception import ServiceUnavailableException
+from .too_many_requests_exception import TooManyRequestsException
 from .user_cannot_be_logged_in_exception import UserCannotBeLoggedInException
 from .validation_exception import ValidationException
@@ -0,0 +1,19 @@
+"""
+This module contains the custom exception class for the deadline exceeded exception.
+"""
+
+
+class DeadlineExceededException(RuntimeError):
+    """
+    Exception raised when the deadline of the request passes before the model answers.
+    """
+
+    def __init__(self, message: str = 'The request deadline was exceeded.') -> None:
+        """
+        Initialize the exception with the message.
+
+        Args:
+            message (str, optional): The message to be displayed. Defaults to 'The request deadline was exceeded.'.
+        """
+        self.message = message
+        super().__init__(self.message)
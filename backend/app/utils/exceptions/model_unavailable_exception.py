@@ -0,0 +1,20 @@
+"""
+This module contains the custom exception class for the model unavailable exception.
+"""
+
+
+class ModelUnavailableException(RuntimeError):
+    """
+    Exception raised when the model provider fails or cannot be reached.
+    """
+
+    def __init__(self, message: str = 'The model is not available. Please try again later.') -> None:
+        """
+        Initialize the exception with the message.
+
+        Args:
+            message (str, optional): The message to be displayed. Defaults to 'The model is not available. Please try
+            again later.'.
+        """
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,24 @@
+"""
+This module contains the custom exception class for the service unavailable exception.
+"""
+
+
+class ServiceUnavailableException(RuntimeError):
+    """
+    Exception raised when the service cannot handle requests, such as while it is starting.
+    """
+
+    def __init__(self,
+                 message: str = 'The service is not available. Please try again later.',
+                 retry_after: float = 1) -> None:
+        """
+        Initialize the exception with the message.
+
+        Args:
+            message (str, optional): The message to be displayed. Defaults to 'The service is not available. Please
+            try again later.'.
+            retry_after (float, optional): Seconds after which the request can be retried. Defaults to 1.
+        """
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(self.message)
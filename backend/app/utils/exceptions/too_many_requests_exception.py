@@ -0,0 +1,28 @@
+"""
+This module contains the custom exception class for the too many requests exception.
+"""
+
+
+class TooManyRequestsException(RuntimeError):
+    """
+    Exception raised when a request is rejected because a rate limit or a capacity limit was reached.
+    """
+
+    def __init__(self,
+                 message: str = 'Too many requests. Please try again later.',
+                 retry_after: float = 1,
+                 headers: dict[str, str] | None = None) -> None:
+        """
+        Initialize the exception with the message.
+
+        Args:
+            message (str, optional): The message to be displayed. Defaults to 'Too many requests. Please try again
+            later.'.
+            retry_after (float, optional): Seconds after which the request can be retried. Defaults to 1.
+            headers (dict[str, str] | None, optional): Extra response headers, such as rate limit headers. Defaults to
+            None.
+        """
+        self.message = message
+        self.retry_after = retry_after
+        self.headers = headers or {}
+        super().__init__(self.message)
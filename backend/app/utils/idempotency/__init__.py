@@ -0,0 +1,4 @@
+from .idempotency_middleware import IdempotencyMiddleware
+from .idempotency_store import IdempotencyRecord, IdempotencyStore, StoredResponse
+from .in_memory_idempotency_store import InMemoryIdempotencyStore
+from .redis_idempotency_store import RedisIdempotencyStore
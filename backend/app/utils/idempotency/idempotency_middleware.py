@@ -0,0 +1,201 @@
+"""
+This module contains the middleware that deduplicates the repeats of a request with the same idempotency key.
+"""
+from hashlib import sha256
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.settings import settings
+from app.utils.metrics import metrics
+
+from .idempotency_store import IdempotencyStore, StoredResponse
+
+metrics.describe(name='idempotency_replays_total', description='Repeated requests answered with a stored response.')
+metrics.describe(name='idempotency_conflicts_total', description='Repeated requests rejected with an idempotency key.')
+
+IDEMPOTENCY_HEADER = b'idempotency-key'
+API_KEY_HEADER = b'x-api-key'
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+class IdempotencyMiddleware():
+    """
+    Runs the POST requests with an Idempotency-Key header once per API key and idempotency key. A repeat of a completed
+    request replays its stored response, with the Idempotent-Replayed header, and a repeat of a request in progress
+    waits for it, up to IDEMPOTENCY_WAIT_TIMEOUT seconds. The key of a request in progress expires after
+    IDEMPOTENCY_LOCK_TTL seconds, longer than the slowest model call, so only the key of a crashed worker is freed. The
+    responses with a 5xx or 429 status code are not stored, so their repeats run again. Reusing a key with a different
+    request is rejected.
+    """
+    __app: ASGIApp
+    __store: IdempotencyStore
+    __path_prefixes: tuple[str, ...]
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore, path_prefixes: tuple[str, ...]) -> None:
+        """
+        Create a new IdempotencyMiddleware instance.
+
+        Args:
+            app (ASGIApp): Wrapped ASGI app.
+            store (IdempotencyStore): Store of the idempotency keys.
+            path_prefixes (tuple[str, ...]): Prefixes of the paths of the deduplicated requests.
+        """
+        self.__app = app
+        self.__store = store
+        self.__path_prefixes = path_prefixes
+
+    @staticmethod
+    async def __reject(scope: Scope, receive: Receive, send: Send, status_code: int, message: str) -> None:
+        """
+        Reject the request.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+            status_code (int): Status code of the rejection.
+            message (str): Message of the rejection.
+        """
+        metrics.increment(name='idempotency_conflicts_total', labels={'status_code': str(status_code)})
+        response = JSONResponse(status_code=status_code,
+                                content={
+                                    'message': message,
+                                    'error': 'Conflict' if status_code == status.HTTP_409_CONFLICT else
+                                    'Validation Error'
+                                })
+        await response(scope, receive, send)
+
+    @staticmethod
+    async def __replay(send: Send, response: StoredResponse) -> None:
+        """
+        Send the stored response of the original request.
+
+        Args:
+            send (Send): ASGI send channel.
+            response (StoredResponse): Stored response.
+        """
+        metrics.increment(name='idempotency_replays_total')
+        headers = [(name.encode('latin-1'), value.encode('latin-1')) for name, value in response.headers]
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': [*headers, (b'idempotent-replayed', b'true')],
+        })
+        await send({'type': 'http.response.body', 'body': response.body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle the request, or replay the response of its original request.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        if scope['type'] != 'http' or scope['method'] != 'POST' or not scope['path'].startswith(self.__path_prefixes):
+            await self.__app(scope, receive, send)
+            return
+
+        headers = dict(scope['headers'])
+        idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.__app(scope, receive, send)
+            return
+
+        if not 0 < len(idempotency_key) <= MAX_IDEMPOTENCY_KEY_LENGTH:
+            await self.__reject(scope=scope,
+                                receive=receive,
+                                send=send,
+                                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                message=f'Idempotency-Key must have between 1 and {MAX_IDEMPOTENCY_KEY_LENGTH} '
+                                'characters.')
+            return
+
+        body = b''
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+            body += message.get('body', b'')
+            if not message.get('more_body', False):
+                break
+
+        # The API key is hashed, so the secret keys are not kept in the store
+        key = f'{sha256(headers.get(API_KEY_HEADER, b"")).hexdigest()}:{sha256(idempotency_key).hexdigest()}'
+        fingerprint = sha256(b'\n'.join((scope['method'].encode(), scope['path'].encode(), scope['query_string'],
+                                         body))).hexdigest()
+
+        while (record := await self.__store.begin(key=key,
+                                                  fingerprint=fingerprint,
+                                                  ttl=settings.IDEMPOTENCY_LOCK_TTL)) is not None:
+            if record.fingerprint != fingerprint:
+                await self.__reject(scope=scope,
+                                    receive=receive,
+                                    send=send,
+                                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                    message='Idempotency-Key was already used with a different request.')
+                return
+
+            if record.response is None:
+                record = await self.__store.wait(key=key, timeout=settings.IDEMPOTENCY_WAIT_TIMEOUT)
+
+                # The original request failed, so this one runs it again
+                if record is None:
+                    continue
+
+                if record.response is None:
+                    await self.__reject(scope=scope,
+                                        receive=receive,
+                                        send=send,
+                                        status_code=status.HTTP_409_CONFLICT,
+                                        message='A request with this Idempotency-Key is still in progress.')
+                    return
+
+            await self.__replay(send=send, response=record.response)
+            return
+
+        body_received = False
+        response_start: Message = {}
+        response_body = b''
+        response_completed = False
+
+        async def receive_request() -> Message:
+            nonlocal body_received
+            if not body_received:
+                body_received = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+
+            return await receive()
+
+        async def send_response(message: Message) -> None:
+            nonlocal response_start, response_body, response_completed
+            if message['type'] == 'http.response.start':
+                response_start = message
+
+            elif message['type'] == 'http.response.body':
+                response_body += message.get('body', b'')
+                response_completed = not message.get('more_body', False)
+
+            await send(message)
+
+        try:
+            await self.__app(scope, receive_request, send_response)
+
+        finally:
+            status_code = response_start.get('status', status.HTTP_500_INTERNAL_SERVER_ERROR)
+            if (response_completed and status_code < status.HTTP_500_INTERNAL_SERVER_ERROR and
+                    status_code != status.HTTP_429_TOO_MANY_REQUESTS):
+                response_headers = [(name.decode('latin-1'), value.decode('latin-1'))
+                                    for name, value in response_start.get('headers', ())]
+                await self.__store.complete(key=key,
+                                            fingerprint=fingerprint,
+                                            response=StoredResponse(status_code=status_code,
+                                                                    headers=response_headers,
+                                                                    body=response_body),
+                                            ttl=settings.IDEMPOTENCY_TTL)
+
+            else:
+                await self.__store.release(key=key)
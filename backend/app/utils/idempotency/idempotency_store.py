@@ -0,0 +1,78 @@
+"""
+This module contains the interface of the idempotency key stores.
+"""
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+
+class StoredResponse(NamedTuple):
+    """
+    Response of a completed request, replayed to the repeats of the request.
+    """
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class IdempotencyRecord(NamedTuple):
+    """
+    State of an idempotency key, its response is None while the original request is in progress.
+    """
+    fingerprint: str
+    response: StoredResponse | None
+
+
+class IdempotencyStore(ABC):
+    """
+    Store of the idempotency keys and the responses of their requests. Shared stores keep the keys across several
+    workers.
+    """
+
+    @abstractmethod
+    async def begin(self, key: str, fingerprint: str, ttl: float) -> IdempotencyRecord | None:
+        """
+        Mark the key as in progress if it is not stored yet.
+
+        Args:
+            key (str): Idempotency key.
+            fingerprint (str): Hash of the request.
+            ttl (float): Seconds the key is kept in progress, so the key of a crashed worker is freed.
+
+        Returns:
+            IdempotencyRecord | None: None if the key was marked as in progress, otherwise its stored record.
+        """
+
+    @abstractmethod
+    async def complete(self, key: str, fingerprint: str, response: StoredResponse, ttl: float) -> None:
+        """
+        Store the response of the key, so the repeats of the request replay it.
+
+        Args:
+            key (str): Idempotency key.
+            fingerprint (str): Hash of the request.
+            response (StoredResponse): Response of the request.
+            ttl (float): Seconds the response is replayed.
+        """
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """
+        Remove the key, so a repeat of the request runs it again.
+
+        Args:
+            key (str): Idempotency key.
+        """
+
+    @abstractmethod
+    async def wait(self, key: str, timeout: float) -> IdempotencyRecord | None:
+        """
+        Wait until the request of the key is completed or released.
+
+        Args:
+            key (str): Idempotency key.
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            IdempotencyRecord | None: Record of the key, still in progress if the timeout passed, or None if the key
+            was released.
+        """
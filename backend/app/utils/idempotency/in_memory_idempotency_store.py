@@ -0,0 +1,144 @@
+"""
+This module contains the in-memory idempotency key store.
+"""
+from asyncio import Event, wait_for
+from collections import OrderedDict
+from time import monotonic
+
+from .idempotency_store import IdempotencyRecord, IdempotencyStore, StoredResponse
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency key store local to the worker process. It keeps at most max_keys keys, evicting the expired keys and
+    then the oldest ones.
+    """
+    __max_keys: int
+    __records: OrderedDict[str, tuple[float, IdempotencyRecord]]
+    __completions: dict[str, Event]
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        """
+        Create a new InMemoryIdempotencyStore instance.
+
+        Args:
+            max_keys (int, optional): Maximum number of stored keys. Defaults to 10_000.
+        """
+        self.__max_keys = max_keys
+        self.__records = OrderedDict()
+        self.__completions = {}
+
+    def __remove(self, key: str) -> None:
+        """
+        Remove the record of the key and wake up the requests waiting for it.
+
+        Args:
+            key (str): Idempotency key.
+        """
+        self.__records.pop(key, None)
+        completion = self.__completions.pop(key, None)
+        if completion is not None:
+            completion.set()
+
+    def __get(self, key: str) -> IdempotencyRecord | None:
+        """
+        Get the record of the key, removing it if it expired.
+
+        Args:
+            key (str): Idempotency key.
+
+        Returns:
+            IdempotencyRecord | None: Record of the key, or None if it is not stored.
+        """
+        expiration, record = self.__records.get(key, (0, None))
+        if record is not None and expiration <= monotonic():
+            self.__remove(key=key)
+            return None
+
+        return record
+
+    def __set(self, key: str, record: IdempotencyRecord, ttl: float) -> None:
+        """
+        Store the record of the key as the newest one, evicting the expired and the oldest keys above the limit.
+
+        Args:
+            key (str): Idempotency key.
+            record (IdempotencyRecord): Record of the key.
+            ttl (float): Seconds the record is kept.
+        """
+        now = monotonic()
+        self.__records[key] = (now + ttl, record)
+        self.__records.move_to_end(key)
+
+        while self.__records:
+            oldest_key, (expiration, _) = next(iter(self.__records.items()))
+            if expiration > now and len(self.__records) <= self.__max_keys:
+                break
+
+            self.__remove(key=oldest_key)
+
+    async def begin(self, key: str, fingerprint: str, ttl: float) -> IdempotencyRecord | None:
+        """
+        Mark the key as in progress if it is not stored yet.
+
+        Args:
+            key (str): Idempotency key.
+            fingerprint (str): Hash of the request.
+            ttl (float): Seconds the key is kept in progress, so the key of a crashed worker is freed.
+
+        Returns:
+            IdempotencyRecord | None: None if the key was marked as in progress, otherwise its stored record.
+        """
+        record = self.__get(key=key)
+        if record is not None:
+            return record
+
+        self.__set(key=key, record=IdempotencyRecord(fingerprint=fingerprint, response=None), ttl=ttl)
+        self.__completions[key] = Event()
+        return None
+
+    async def complete(self, key: str, fingerprint: str, response: StoredResponse, ttl: float) -> None:
+        """
+        Store the response of the key, so the repeats of the request replay it.
+
+        Args:
+            key (str): Idempotency key.
+            fingerprint (str): Hash of the request.
+            response (StoredResponse): Response of the request.
+            ttl (float): Seconds the response is replayed.
+        """
+        self.__set(key=key, record=IdempotencyRecord(fingerprint=fingerprint, response=response), ttl=ttl)
+        completion = self.__completions.pop(key, None)
+        if completion is not None:
+            completion.set()
+
+    async def release(self, key: str) -> None:
+        """
+        Remove the key, so a repeat of the request runs it again.
+
+        Args:
+            key (str): Idempotency key.
+        """
+        self.__remove(key=key)
+
+    async def wait(self, key: str, timeout: float) -> IdempotencyRecord | None:
+        """
+        Wait until the request of the key is completed or released.
+
+        Args:
+            key (str): Idempotency key.
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            IdempotencyRecord | None: Record of the key, still in progress if the timeout passed, or None if the key
+            was released.
+        """
+        completion = self.__completions.get(key)
+        if completion is not None:
+            try:
+                await wait_for(completion.wait(), timeout=timeout)
+
+            except TimeoutError:
+                pass
+
+        return self.__get(key=key)
@@ -0,0 +1,153 @@
+"""
+This module contains the Redis idempotency key store, shared by all the workers.
+"""
+from __future__ import annotations
+
+from asyncio import sleep
+from base64 import b64decode, b64encode
+from json import dumps, loads
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .idempotency_store import IdempotencyRecord, IdempotencyStore, StoredResponse
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency key store kept in Redis, so the repeats of a request are deduplicated across several workers and
+    replicas. Redis evicts the expired keys, and the requests waiting for a key poll it.
+    """
+    __client: Redis
+    __prefix: str
+    __poll_interval: float
+
+    def __init__(self, url: str, prefix: str = 'idempotency', poll_interval: float = 0.1) -> None:
+        """
+        Create a new RedisIdempotencyStore instance.
+
+        Args:
+            url (str): Redis URL.
+            prefix (str, optional): Prefix of the Redis keys. Defaults to 'idempotency'.
+            poll_interval (float, optional): Seconds between the checks of a key in progress. Defaults to 0.1.
+
+        Raises:
+            ImportError: If the redis package is not installed.
+        """
+        from redis.asyncio import Redis
+
+        self.__client = Redis.from_url(url=url)
+        self.__prefix = prefix
+        self.__poll_interval = poll_interval
+
+    @staticmethod
+    def __dump(record: IdempotencyRecord) -> str:
+        """
+        Serialize the record as JSON.
+
+        Args:
+            record (IdempotencyRecord): Record of the key.
+
+        Returns:
+            str: Serialized record.
+        """
+        response = record.response
+        return dumps({
+            'fingerprint': record.fingerprint,
+            'response': None if response is None else {
+                'status_code': response.status_code,
+                'headers': response.headers,
+                'body': b64encode(response.body).decode('ascii'),
+            },
+        })
+
+    @staticmethod
+    def __load(value: bytes | None) -> IdempotencyRecord | None:
+        """
+        Deserialize the record from JSON.
+
+        Args:
+            value (bytes | None): Serialized record, if the key is stored.
+
+        Returns:
+            IdempotencyRecord | None: Record of the key, or None if it is not stored.
+        """
+        if value is None:
+            return None
+
+        data = loads(value)
+        response = data['response']
+        return IdempotencyRecord(fingerprint=data['fingerprint'],
+                                 response=None if response is None else StoredResponse(
+                                     status_code=response['status_code'],
+                                     headers=[(name, header) for name, header in response['headers']],
+                                     body=b64decode(response['body'])))
+
+    async def begin(self, key: str, fingerprint: str, ttl: float) -> IdempotencyRecord | None:
+        """
+        Mark the key as in progress if it is not stored yet.
+
+        Args:
+            key (str): Idempotency key.
+            fingerprint (str): Hash of the request.
+            ttl (float): Seconds the key is kept in progress, so the key of a crashed worker is freed.
+
+        Returns:
+            IdempotencyRecord | None: None if the key was marked as in progress, otherwise its stored record.
+        """
+        while True:
+            if await self.__client.set(name=f'{self.__prefix}:{key}',
+                                       value=self.__dump(IdempotencyRecord(fingerprint=fingerprint, response=None)),
+                                       px=int(ttl * 1000),
+                                       nx=True):
+                return None
+
+            # The key can expire between both commands, then it is marked again
+            record = self.__load(value=await self.__client.get(name=f'{self.__prefix}:{key}'))
+            if record is not None:
+                return record
+
+    async def complete(self, key: str, fingerprint: str, response: StoredResponse, ttl: float) -> None:
+        """
+        Store the response of the key, so the repeats of the request replay it.
+
+        Args:
+            key (str): Idempotency key.
+            fingerprint (str): Hash of the request.
+            response (StoredResponse): Response of the request.
+            ttl (float): Seconds the response is replayed.
+        """
+        await self.__client.set(name=f'{self.__prefix}:{key}',
+                                value=self.__dump(IdempotencyRecord(fingerprint=fingerprint, response=response)),
+                                px=int(ttl * 1000))
+
+    async def release(self, key: str) -> None:
+        """
+        Remove the key, so a repeat of the request runs it again.
+
+        Args:
+            key (str): Idempotency key.
+        """
+        await self.__client.delete(f'{self.__prefix}:{key}')
+
+    async def wait(self, key: str, timeout: float) -> IdempotencyRecord | None:
+        """
+        Wait until the request of the key is completed or released.
+
+        Args:
+            key (str): Idempotency key.
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            IdempotencyRecord | None: Record of the key, still in progress if the timeout passed, or None if the key
+            was released.
+        """
+        deadline = monotonic() + timeout
+        while True:
+            record = self.__load(value=await self.__client.get(name=f'{self.__prefix}:{key}'))
+            if record is None or record.response is not None or monotonic() >= deadline:
+                return record
+
+            await sleep(self.__poll_interval)
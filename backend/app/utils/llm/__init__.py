@@ -0,0 +1,6 @@
+from .chat_model import (get_model_engine, invoke_chat_model, invoke_structured_chat_model, record_usage,
+                         stream_chat_model)
+from .fair_share_scheduler import FairShareScheduler, model_call_scheduler
+from .langchain_engine import LangChainEngine
+from .model_engine import ChatMessage, ModelEngine, ModelResponse
+from .openai_http_engine import OpenAIHttpEngine
@@ -0,0 +1,172 @@
+"""
+This module contains the functions to call the chat model engine and meter its usage.
+"""
+from contextlib import AbstractAsyncContextManager
+from functools import cache
+from time import perf_counter
+from typing import AsyncIterator
+
+from app.settings import AIEngine, Priority, settings
+from app.usage.functions import usage_aggregator
+from app.utils.cryptography import current_api_key_id, current_api_key_priority, current_user_id
+from app.utils.deadline import enforce_deadline
+from app.utils.rate_limiting import estimate_tokens
+
+from .fair_share_scheduler import model_call_scheduler
+from .langchain_engine import LangChainEngine
+from .model_engine import ChatMessage, ModelEngine, StructuredOutput
+from .openai_http_engine import OpenAIHttpEngine
+
+
+@cache
+def get_model_engine() -> ModelEngine:
+    """
+    Get the chat model engine selected by the AI_ENGINE setting. It is built once per process and reused, so its HTTP
+    connections are reused too.
+
+    Returns:
+        ModelEngine: Chat model engine.
+    """
+    engine_arguments = {
+        'api_key': settings.OPENAI_API_KEY,
+        'model': settings.AI_MODEL,
+        'base_url': settings.AI_BASE_URL,
+        'timeout': settings.AI_TIMEOUT,
+        'max_connections': settings.AI_MAX_CONNECTIONS,
+        'max_retries': settings.AI_MAX_RETRIES,
+    }
+
+    if settings.AI_ENGINE == AIEngine.OPENAI_HTTP:
+        return OpenAIHttpEngine(**engine_arguments)
+
+    return LangChainEngine(**engine_arguments)
+
+
+def record_usage(operation: str, model: str, prompt_tokens: int, completion_tokens: int, latency: float) -> None:
+    """
+    Record the token usage and latency of a model call for the API key of the current request, if there is one.
+
+    Args:
+        operation (str): Name of the operation, such as 'translate'.
+        model (str): Model used by the call.
+        prompt_tokens (int): Tokens sent to the model.
+        completion_tokens (int): Tokens generated by the model.
+        latency (float): Upstream latency in seconds.
+    """
+    api_key_id = current_api_key_id.get()
+    if api_key_id is not None:
+        usage_aggregator.record(api_key_id=api_key_id,
+                                operation=operation,
+                                model=model,
+                                prompt_tokens=prompt_tokens,
+                                completion_tokens=completion_tokens,
+                                latency=latency)
+
+
+def model_call_slot(messages: list[ChatMessage]) -> AbstractAsyncContextManager[None]:
+    """
+    Get a slot of the model call scheduler for the messages, scheduled by the owner and priority of the current API key.
+
+    Args:
+        messages (list[ChatMessage]): Messages sent to the model.
+
+    Returns:
+        AbstractAsyncContextManager[None]: Context manager holding the model call slot.
+    """
+    return model_call_scheduler.slot(
+        user_id=current_user_id.get() or '',
+        priority=current_api_key_priority.get() or Priority.STANDARD,
+        cost=sum(estimate_tokens(content=message.get('content', '').encode()) for message in messages))
+
+
+async def invoke_chat_model(operation: str, messages: list[ChatMessage]) -> str:
+    """
+    Call the chat model and record the token usage and latency of the call for the current API key.
+
+    Args:
+        operation (str): Name of the operation, such as 'translate'.
+        messages (list[ChatMessage]): Messages sent to the model.
+
+    Raises:
+        ModelUnavailableException: If the model provider fails or cannot be reached.
+        ServiceUnavailableException: If too many model calls are waiting for the model provider.
+        DeadlineExceededException: If the deadline of the request passes before the model answers.
+
+    Returns:
+        str: Content of the model response.
+    """
+    async with enforce_deadline(), model_call_slot(messages=messages):
+        start = perf_counter()
+        model_response = await get_model_engine().complete(messages=messages)
+
+    record_usage(operation=operation,
+                 model=model_response.model,
+                 prompt_tokens=model_response.prompt_tokens,
+                 completion_tokens=model_response.completion_tokens,
+                 latency=perf_counter() - start)
+
+    return model_response.content
+
+
+async def invoke_structured_chat_model(operation: str, messages: list[ChatMessage],
+                                       schema: type[StructuredOutput]) -> StructuredOutput:
+    """
+    Call the chat model, parse its response as an instance of the schema and record the token usage and latency of the
+    call for the current API key.
+
+    Args:
+        operation (str): Name of the operation, such as 'translate'.
+        messages (list[ChatMessage]): Messages sent to the model.
+        schema (type[StructuredOutput]): Pydantic model of the response.
+
+    Raises:
+        ModelUnavailableException: If the model provider fails or the response does not match the schema.
+        ServiceUnavailableException: If too many model calls are waiting for the model provider.
+        DeadlineExceededException: If the deadline of the request passes before the model answers.
+
+    Returns:
+        StructuredOutput: Parsed model response.
+    """
+    async with enforce_deadline(), model_call_slot(messages=messages):
+        start = perf_counter()
+        output, model_response = await get_model_engine().complete_structured(messages=messages, schema=schema)
+
+    record_usage(operation=operation,
+                 model=model_response.model,
+                 prompt_tokens=model_response.prompt_tokens,
+                 completion_tokens=model_response.completion_tokens,
+                 latency=perf_counter() - start)
+
+    return output
+
+
+async def stream_chat_model(operation: str, messages: list[ChatMessage]) -> AsyncIterator[str]:
+    """
+    Stream the chat model response and record the token usage and latency of the call for the current API key when
+    the stream ends.
+
+    Args:
+        operation (str): Name of the operation, such as 'translate'.
+        messages (list[ChatMessage]): Messages sent to the model.
+
+    Raises:
+        ModelUnavailableException: If the model provider fails or cannot be reached.
+        ServiceUnavailableException: If too many model calls are waiting for the model provider.
+        DeadlineExceededException: If the deadline of the request passes before the model answers.
+
+    Yields:
+        str: Content chunks of the model response.
+    """
+    usage: dict[str, int | str] = {}
+    async with enforce_deadline(), model_call_slot(messages=messages):
+        start = perf_counter()
+        try:
+            async for content in get_model_engine().stream(messages=messages, usage=usage):
+                yield content
+
+        finally:
+            record_usage(operation=operation,
+                         model=str(usage.get('model', settings.AI_MODEL)),
+                         prompt_tokens=int(usage.get('prompt_tokens', 0)),
+                         completion_tokens=int(usage.get('completion_tokens', 0)),
+                         latency=perf_counter() - start)
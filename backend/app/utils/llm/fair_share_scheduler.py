@@ -0,0 +1,250 @@
+"""
+This module contains the fair-share scheduler of the calls to the model provider.
+"""
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque, OrderedDict
+from contextlib import asynccontextmanager
+from math import floor
+from time import perf_counter
+from typing import AsyncIterator
+
+from app.settings import Priority, settings
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.metrics import metrics
+
+metrics.describe(name='model_calls_queue_depth', description='Model calls waiting for a model call slot per priority.')
+metrics.describe(name='model_calls_in_flight', description='Model calls waiting for the model provider per priority.')
+metrics.describe(name='model_calls_rejections_total', description='Model calls rejected because the queue was full.')
+metrics.describe(name='model_calls_wait_seconds', description='Seconds the model calls waited for a slot.')
+
+# Priorities from the highest to the lowest, a slot is always given to the highest priority with waiting calls
+PRIORITIES = tuple(Priority)
+
+
+class FairShareScheduler():
+    """
+    Schedules the calls to the model provider of the worker. At most max_concurrency calls run at the same time, and
+    the waiting calls get the free slots by priority, so a latency-sensitive call never waits behind the bulk traffic.
+    Each priority and the ones below it can only use their share of the slots, which keeps free slots for the higher
+    priorities. Within a priority, the users get the slots by deficit round-robin on the estimated tokens of their
+    calls, so a user sending many or large calls does not delay the calls of the other users.
+
+    At most max_queue calls wait for a slot, and at most max_user_queue per user, the rest are rejected immediately.
+    Its queue depth is one of the load shedding signals, so the model requests are rejected before they are
+    authenticated when the queue is full.
+    """
+    __max_concurrency: int
+    __max_queue: int
+    __max_user_queue: int
+    __quantum: int
+    __limits: dict[Priority, int]
+    __queues: dict[Priority, OrderedDict[str, deque[tuple[Future[None], int]]]]
+    __deficits: dict[Priority, dict[str, int]]
+    __running: dict[Priority, int]
+    __queued: int
+    __average_time: float
+
+    def __init__(self,
+                 max_concurrency: int,
+                 max_queue: int,
+                 max_user_queue: int,
+                 shares: dict[Priority, float],
+                 quantum: int = 500) -> None:
+        """
+        Create a new FairShareScheduler instance.
+
+        Args:
+            max_concurrency (int): Maximum number of running model calls.
+            max_queue (int): Maximum number of model calls waiting for a slot.
+            max_user_queue (int): Maximum number of model calls of a user waiting for a slot.
+            shares (dict[Priority, float]): Share of the slots used by each priority and the ones below it, the
+            priorities that are not given use all the slots.
+            quantum (int, optional): Tokens added to the deficit of a user on each round. Defaults to 500.
+        """
+        self.__max_concurrency = max_concurrency
+        self.__max_queue = max_queue
+        self.__max_user_queue = max_user_queue
+        self.__quantum = quantum
+        self.__limits = {
+            priority: max(1, floor(max_concurrency * shares.get(priority, 1))) for priority in PRIORITIES
+        }
+        self.__queues = {priority: OrderedDict() for priority in PRIORITIES}
+        self.__deficits = {priority: {} for priority in PRIORITIES}
+        self.__running = {priority: 0 for priority in PRIORITIES}
+        self.__queued = 0
+        self.__average_time = 1
+
+    def __publish_metrics(self, priority: Priority) -> None:
+        """
+        Publish the queue depth and the running calls of the priority.
+
+        Args:
+            priority (Priority): Priority of the model calls.
+        """
+        metrics.set_gauge(name='model_calls_queue_depth',
+                          value=sum(len(waiters) for waiters in self.__queues[priority].values()),
+                          labels={'priority': priority})
+        metrics.set_gauge(name='model_calls_in_flight', value=self.__running[priority], labels={'priority': priority})
+
+    def __has_free_slot(self, priority: Priority) -> bool:
+        """
+        Check if a model call of the priority can start.
+
+        Args:
+            priority (Priority): Priority of the model call.
+
+        Returns:
+            bool: True if there is a free slot for the priority, False otherwise.
+        """
+        if sum(self.__running.values()) >= self.__max_concurrency:
+            return False
+
+        running = sum(self.__running[lower_priority] for lower_priority in PRIORITIES[PRIORITIES.index(priority):])
+        return running < self.__limits[priority]
+
+    def __dispatch(self) -> None:
+        """
+        Give the free slots to the waiting calls, by priority and by deficit round-robin between the users.
+        """
+        for priority in PRIORITIES:
+            queues = self.__queues[priority]
+            deficits = self.__deficits[priority]
+            while queues and self.__has_free_slot(priority=priority):
+                user_id, waiters = next(iter(queues.items()))
+                future, cost = waiters[0]
+                if deficits[user_id] < cost:
+                    # The user gets its quantum for the next round and waits for the other users
+                    deficits[user_id] += self.__quantum
+                    queues.move_to_end(user_id)
+                    continue
+
+                deficits[user_id] -= cost
+                waiters.popleft()
+                if not waiters:
+                    # The deficit is not kept by idle users
+                    del queues[user_id]
+                    del deficits[user_id]
+
+                self.__queued -= 1
+                self.__running[priority] += 1
+                future.set_result(None)
+
+            self.__publish_metrics(priority=priority)
+
+    def __remove(self, priority: Priority, user_id: str, future: Future[None]) -> None:
+        """
+        Remove a waiting call, such as when its request is cancelled.
+
+        Args:
+            priority (Priority): Priority of the model call.
+            user_id (str): ID of the user of the model call.
+            future (Future[None]): Future of the waiting call.
+        """
+        waiters = self.__queues[priority].get(user_id)
+        if waiters is None:
+            return
+
+        for waiter in waiters:
+            if waiter[0] is future:
+                waiters.remove(waiter)
+                self.__queued -= 1
+                break
+
+        if not waiters:
+            del self.__queues[priority][user_id]
+            del self.__deficits[priority][user_id]
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of model calls waiting for a slot.
+
+        Returns:
+            int: Number of waiting model calls.
+        """
+        return self.__queued
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Check if the queue is full, so new model calls would be rejected.
+
+        Returns:
+            bool: True if the queue is full, False otherwise.
+        """
+        return self.__queued >= self.__max_queue
+
+    @property
+    def retry_after(self) -> float:
+        """
+        Get the estimated seconds until the queued model calls finish.
+
+        Returns:
+            float: Estimated seconds until the queue is empty.
+        """
+        return self.__average_time * (self.__queued / self.__max_concurrency + 1)
+
+    @asynccontextmanager
+    async def slot(self, user_id: str, priority: Priority, cost: int) -> AsyncIterator[None]:
+        """
+        Hold a model call slot while the model call runs.
+
+        Args:
+            user_id (str): ID of the user of the model call.
+            priority (Priority): Priority of the API key of the model call.
+            cost (int): Estimated tokens of the model call.
+
+        Raises:
+            ServiceUnavailableException: If the queue, or the queue of the user, is full.
+        """
+        waiters = self.__queues[priority].get(user_id)
+        if self.saturated or (waiters is not None and len(waiters) >= self.__max_user_queue):
+            metrics.increment(name='model_calls_rejections_total', labels={'priority': priority})
+            raise ServiceUnavailableException(message='The model is busy. Please try again later.',
+                                              retry_after=self.retry_after)
+
+        if waiters is None:
+            waiters = self.__queues[priority][user_id] = deque()
+            self.__deficits[priority][user_id] = 0
+
+        future: Future[None] = get_running_loop().create_future()
+        waiters.append((future, cost))
+        self.__queued += 1
+        self.__dispatch()
+
+        start = perf_counter()
+        try:
+            await future
+
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was given just before the cancellation, so it is freed for the next call
+                self.__running[priority] -= 1
+
+            else:
+                self.__remove(priority=priority, user_id=user_id, future=future)
+
+            self.__dispatch()
+            raise
+
+        metrics.observe(name='model_calls_wait_seconds',
+                        value=perf_counter() - start,
+                        labels={'priority': priority})
+        start = perf_counter()
+        try:
+            yield
+
+        finally:
+            self.__average_time = 0.9 * self.__average_time + 0.1 * (perf_counter() - start)
+            self.__running[priority] -= 1
+            self.__dispatch()
+
+
+model_call_scheduler = FairShareScheduler(
+    max_concurrency=settings.AI_MAX_CONCURRENT_CALLS or settings.AI_MAX_CONNECTIONS,
+    max_queue=settings.AI_MAX_QUEUED_CALLS,
+    max_user_queue=settings.AI_MAX_QUEUED_CALLS_PER_USER,
+    shares={
+        Priority.STANDARD: settings.AI_STANDARD_MAX_SHARE,
+        Priority.BULK: settings.AI_BULK_MAX_SHARE
+    })
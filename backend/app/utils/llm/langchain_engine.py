@@ -0,0 +1,134 @@
+"""
+This module contains the chat model engine that calls the model through LangChain.
+"""
+from __future__ import annotations
+
+from typing import AsyncIterator, TYPE_CHECKING
+
+from httpx import AsyncClient, HTTPError, Limits
+
+from app.utils.exceptions import ModelUnavailableException
+
+from .model_engine import ChatMessage, ModelEngine, ModelResponse
+
+# LangChain takes most of the import time of the app, it is imported when the engine is created
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+class LangChainEngine(ModelEngine):
+    """
+    Chat model engine backed by the LangChain ChatOpenAI client. LangChain 0.1 does not report the token usage of
+    streamed calls, so only the model is filled in their usage.
+    """
+    __http_client: AsyncClient
+    __client: ChatOpenAI
+    __json_client: ChatOpenAI
+    __model: str
+    __base_url: str
+
+    def __init__(self,
+                 api_key: str,
+                 model: str,
+                 base_url: str = 'https://api.openai.com/v1',
+                 timeout: float = 60,
+                 max_connections: int = 100,
+                 max_retries: int = 2) -> None:
+        """
+        Create a new LangChainEngine instance.
+
+        Args:
+            api_key (str): API key of the provider.
+            model (str): Model name.
+            base_url (str, optional): Base URL of the OpenAI compatible API. Defaults to 'https://api.openai.com/v1'.
+            timeout (float, optional): Seconds waiting for the provider. Defaults to 60.
+            max_connections (int, optional): Maximum number of open connections. Defaults to 100.
+            max_retries (int, optional): Retries of the transient failures. Defaults to 2.
+        """
+        from langchain.pydantic_v1 import SecretStr
+        from langchain_openai import ChatOpenAI
+
+        self.__http_client = AsyncClient(
+            limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections))
+        self.__client = ChatOpenAI(api_key=SecretStr(value=api_key),
+                                   model=model,
+                                   base_url=base_url,
+                                   timeout=timeout,
+                                   max_retries=max_retries,
+                                   http_async_client=self.__http_client)
+        self.__json_client = self.__client.bind(response_format={'type': 'json_object'})
+        self.__model = model
+        self.__base_url = base_url.rstrip('/')
+
+    async def complete(self, messages: list[ChatMessage], json_output: bool = False) -> ModelResponse:
+        """
+        Get the model response to the messages.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            json_output (bool, optional): Force the model to answer with a JSON object. Defaults to False.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or cannot be reached.
+
+        Returns:
+            ModelResponse: Model response.
+        """
+        from openai import OpenAIError
+
+        try:
+            model_response = await (self.__json_client if json_output else self.__client).ainvoke(input=messages)
+
+        except OpenAIError as exception:
+            raise ModelUnavailableException(message=f'The model provider failed: {exception}.')
+
+        token_usage = model_response.response_metadata.get('token_usage', {})
+        return ModelResponse(content=model_response.content,
+                             model=model_response.response_metadata.get('model_name', self.__model),
+                             prompt_tokens=token_usage.get('prompt_tokens', 0),
+                             completion_tokens=token_usage.get('completion_tokens', 0))
+
+    async def stream(self, messages: list[ChatMessage], usage: dict[str, int | str]) -> AsyncIterator[str]:
+        """
+        Stream the model response to the messages.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            usage (dict[str, int | str]): Filled with the model, prompt_tokens and completion_tokens of the call when
+                the stream ends.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or cannot be reached.
+
+        Yields:
+            str: Content chunks of the model response.
+        """
+        from openai import OpenAIError
+
+        try:
+            async for chunk in self.__client.astream(input=messages):
+                usage['model'] = chunk.response_metadata.get('model_name', self.__model)
+                if chunk.content:
+                    yield chunk.content
+
+        except OpenAIError as exception:
+            raise ModelUnavailableException(message=f'The model response stream failed: {exception}.')
+
+    async def warm_up(self) -> None:
+        """
+        Open the connection to the provider listing the models, which does not use tokens. The response is ignored.
+
+        Raises:
+            ModelUnavailableException: If the model provider cannot be reached.
+        """
+        try:
+            await self.__http_client.get(url=f'{self.__base_url}/models')
+
+        except HTTPError as exception:
+            raise ModelUnavailableException(message=f'The model provider cannot be reached: {exception}.')
+
+    async def close(self) -> None:
+        """
+        Close the open connections to the provider.
+        """
+        await self.__http_client.aclose()
@@ -0,0 +1,109 @@
+"""
+This module contains the interface of the chat model engines.
+"""
+from abc import ABC, abstractmethod
+from json import dumps
+from typing import AsyncIterator, NamedTuple, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from app.utils.exceptions import ModelUnavailableException
+
+# Chat message of the OpenAI chat completions protocol, with its role and content
+ChatMessage = dict[str, str]
+
+StructuredOutput = TypeVar('StructuredOutput', bound=BaseModel)
+
+
+class ModelResponse(NamedTuple):
+    """
+    Response of a chat model call.
+    """
+    content: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+
+
+class ModelEngine(ABC):
+    """
+    Engine that sends the chat messages to the model. Streamed calls yield the content as it is generated and return
+    the token usage through the usage argument.
+    """
+
+    @abstractmethod
+    async def complete(self, messages: list[ChatMessage], json_output: bool = False) -> ModelResponse:
+        """
+        Get the model response to the messages.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            json_output (bool, optional): Force the model to answer with a JSON object. Defaults to False.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or cannot be reached.
+
+        Returns:
+            ModelResponse: Model response.
+        """
+
+    @abstractmethod
+    def stream(self, messages: list[ChatMessage], usage: dict[str, int | str]) -> AsyncIterator[str]:
+        """
+        Stream the model response to the messages.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            usage (dict[str, int | str]): Filled with the model, prompt_tokens and completion_tokens of the call when
+                the stream ends.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or cannot be reached.
+
+        Yields:
+            str: Content chunks of the model response.
+        """
+
+    async def warm_up(self) -> None:
+        """
+        Open the connection to the provider before the first call, so the first call does not pay for the connection
+        and TLS handshake.
+
+        Raises:
+            ModelUnavailableException: If the model provider cannot be reached.
+        """
+
+    async def close(self) -> None:
+        """
+        Release the engine resources, such as its open connections.
+        """
+
+    async def complete_structured(self, messages: list[ChatMessage],
+                                  schema: type[StructuredOutput]) -> tuple[StructuredOutput, ModelResponse]:
+        """
+        Get the model response to the messages as an instance of the schema. The JSON schema is added to the messages
+        and the model is forced to answer with a JSON object, which works with every OpenAI compatible provider.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            schema (type[StructuredOutput]): Pydantic model of the response.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or the response does not match the schema.
+
+        Returns:
+            tuple[StructuredOutput, ModelResponse]: Parsed response and raw model response.
+        """
+        schema_message = {
+            'role': 'system',
+            'content': f'Answer only with a JSON object that follows this JSON schema:\n'
+                       f'{dumps(schema.model_json_schema())}',
+        }
+        response = await self.complete(messages=[schema_message, *messages], json_output=True)
+
+        try:
+            return schema.model_validate_json(response.content), response
+
+        except ValidationError as exception:
+            raise ModelUnavailableException(message=f'The model response does not match the expected format: '
+                                            f'{exception.error_count()} errors.')
@@ -0,0 +1,203 @@
+"""
+This module contains the chat model engine that calls the OpenAI chat completions API directly over HTTP.
+"""
+from asyncio import sleep
+from importlib.util import find_spec
+from json import JSONDecodeError, loads
+from typing import Any, AsyncIterator
+
+from httpx import AsyncClient, HTTPError, Limits, Response, Timeout
+
+from app.utils.deadline import get_remaining_time
+from app.utils.exceptions import ModelUnavailableException
+
+from .model_engine import ChatMessage, ModelEngine, ModelResponse
+
+RETRIED_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class OpenAIHttpEngine(ModelEngine):
+    """
+    Minimal async client of the OpenAI chat completions protocol. It keeps a pool of connections to the provider,
+    uses HTTP/2 when the h2 package is installed and retries the transient failures.
+    """
+    __client: AsyncClient
+    __model: str
+    __max_retries: int
+
+    def __init__(self,
+                 api_key: str,
+                 model: str,
+                 base_url: str = 'https://api.openai.com/v1',
+                 timeout: float = 60,
+                 max_connections: int = 100,
+                 max_retries: int = 2) -> None:
+        """
+        Create a new OpenAIHttpEngine instance.
+
+        Args:
+            api_key (str): API key of the provider.
+            model (str): Model name.
+            base_url (str, optional): Base URL of the OpenAI compatible API. Defaults to 'https://api.openai.com/v1'.
+            timeout (float, optional): Seconds waiting for the provider. Defaults to 60.
+            max_connections (int, optional): Maximum number of open connections. Defaults to 100.
+            max_retries (int, optional): Retries of the transient failures. Defaults to 2.
+        """
+        self.__client = AsyncClient(base_url=base_url.rstrip('/'),
+                                    headers={'Authorization': f'Bearer {api_key}'},
+                                    http2=find_spec('h2') is not None,
+                                    limits=Limits(max_connections=max_connections,
+                                                  max_keepalive_connections=max_connections,
+                                                  keepalive_expiry=30),
+                                    timeout=Timeout(timeout=timeout, connect=min(timeout, 5)))
+        self.__model = model
+        self.__max_retries = max_retries
+
+    @staticmethod
+    def __can_retry(retry_after: float) -> bool:
+        """
+        Check if a retry after the delay can finish before the deadline of the current request.
+
+        Args:
+            retry_after (float): Seconds before the retry.
+
+        Returns:
+            bool: True if the request has no deadline or the deadline is after the delay, False otherwise.
+        """
+        remaining_time = get_remaining_time()
+        return remaining_time is None or remaining_time > retry_after
+
+    async def __send(self, body: dict[str, Any], stream: bool = False) -> Response:
+        """
+        Send a chat completions request, retrying the transient failures with an exponential backoff, unless the retry
+        would start after the deadline of the current request.
+
+        Args:
+            body (dict[str, Any]): Request body.
+            stream (bool, optional): Do not read the response body. Defaults to False.
+
+        Raises:
+            ModelUnavailableException: If the request fails after the retries.
+
+        Returns:
+            Response: Successful response, it must be closed by the caller when streamed.
+        """
+        for attempt in range(self.__max_retries + 1):
+            retry_after = 0.5 * 2**attempt
+            try:
+                request = self.__client.build_request(method='POST', url='/chat/completions', json=body)
+                response = await self.__client.send(request=request, stream=stream)
+
+            except HTTPError as exception:
+                if attempt == self.__max_retries or not self.__can_retry(retry_after=retry_after):
+                    raise ModelUnavailableException(message=f'The model provider cannot be reached: {exception}.')
+
+                await sleep(retry_after)
+                continue
+
+            if response.is_success:
+                return response
+
+            await response.aclose()
+            retry_after_header = response.headers.get('Retry-After', '')
+            retry_after = float(retry_after_header) if retry_after_header.isdigit() else retry_after
+            if (response.status_code not in RETRIED_STATUS_CODES or attempt == self.__max_retries or
+                    not self.__can_retry(retry_after=retry_after)):
+                raise ModelUnavailableException(message=f'The model provider failed with status '
+                                                f'{response.status_code}.')
+
+            await sleep(retry_after)
+
+    async def complete(self, messages: list[ChatMessage], json_output: bool = False) -> ModelResponse:
+        """
+        Get the model response to the messages.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            json_output (bool, optional): Force the model to answer with a JSON object. Defaults to False.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or cannot be reached.
+
+        Returns:
+            ModelResponse: Model response.
+        """
+        body: dict[str, Any] = {'model': self.__model, 'messages': messages}
+        if json_output:
+            body['response_format'] = {'type': 'json_object'}
+
+        response = await self.__send(body=body)
+
+        try:
+            data = response.json()
+            usage = data.get('usage') or {}
+            return ModelResponse(content=data['choices'][0]['message']['content'] or '',
+                                 model=data.get('model', self.__model),
+                                 prompt_tokens=usage.get('prompt_tokens', 0),
+                                 completion_tokens=usage.get('completion_tokens', 0))
+
+        except (JSONDecodeError, KeyError, IndexError, TypeError):
+            raise ModelUnavailableException(message='The model provider returned an invalid response.')
+
+    async def stream(self, messages: list[ChatMessage], usage: dict[str, int | str]) -> AsyncIterator[str]:
+        """
+        Stream the model response to the messages from the server-sent events of the provider.
+
+        Args:
+            messages (list[ChatMessage]): Messages sent to the model.
+            usage (dict[str, int | str]): Filled with the model, prompt_tokens and completion_tokens of the call when
+                the stream ends.
+
+        Raises:
+            ModelUnavailableException: If the model provider fails or cannot be reached.
+
+        Yields:
+            str: Content chunks of the model response.
+        """
+        body = {'model': self.__model, 'messages': messages, 'stream': True, 'stream_options': {'include_usage': True}}
+        response = await self.__send(body=body, stream=True)
+
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith('data:'):
+                    continue
+
+                data = line.removeprefix('data:').strip()
+                if data == '[DONE]':
+                    break
+
+                chunk = loads(data)
+                usage['model'] = chunk.get('model', self.__model)
+                if chunk.get('usage'):
+                    usage['prompt_tokens'] = chunk['usage'].get('prompt_tokens', 0)
+                    usage['completion_tokens'] = chunk['usage'].get('completion_tokens', 0)
+
+                for choice in chunk.get('choices') or ():
+                    content = (choice.get('delta') or {}).get('content')
+                    if content:
+                        yield content
+
+        except (HTTPError, JSONDecodeError) as exception:
+            raise ModelUnavailableException(message=f'The model response stream failed: {exception}.')
+
+        finally:
+            await response.aclose()
+
+    async def warm_up(self) -> None:
+        """
+        Open the connection to the provider listing the models, which does not use tokens. The response is ignored.
+
+        Raises:
+            ModelUnavailableException: If the model provider cannot be reached.
+        """
+        try:
+            await self.__client.get(url='/models')
+
+        except HTTPError as exception:
+            raise ModelUnavailableException(message=f'The model provider cannot be reached: {exception}.')
+
+    async def close(self) -> None:
+        """
+        Close the open connections to the provider.
+        """
+        await self.__client.aclose()
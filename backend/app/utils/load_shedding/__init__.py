@@ -0,0 +1,2 @@
+from .event_loop_lag_monitor import event_loop_lag_monitor, EventLoopLagMonitor
+from .load_shedding_middleware import LoadSheddingMiddleware
@@ -0,0 +1,54 @@
+"""
+This module contains the monitor of the event loop lag of the worker.
+"""
+from asyncio import sleep
+from time import perf_counter
+
+from app.utils.metrics import metrics
+
+metrics.describe(name='event_loop_lag_seconds', description='Delay of the event loop running the scheduled callbacks.')
+
+
+class EventLoopLagMonitor():
+    """
+    Measures how late the event loop wakes up a task that sleeps for a fixed interval. A busy event loop delays every
+    request of the worker, so its lag is one of the load shedding signals. A lag spike decays over a few samples, so
+    one on time sample does not stop the load shedding.
+    """
+    __interval: float
+    __lag: float
+
+    def __init__(self, interval: float = 0.1) -> None:
+        """
+        Create a new EventLoopLagMonitor instance.
+
+        Args:
+            interval (float, optional): Seconds between samples. Defaults to 0.1.
+        """
+        self.__interval = interval
+        self.__lag = 0
+
+    @property
+    def lag(self) -> float:
+        """
+        Get the current event loop lag.
+
+        Returns:
+            float: Event loop lag in seconds.
+        """
+        return self.__lag
+
+    async def run(self) -> None:
+        """
+        Sample the event loop lag until the task is cancelled.
+        """
+        while True:
+            start = perf_counter()
+            await sleep(self.__interval)
+            sample = max(0, perf_counter() - start - self.__interval)
+
+            self.__lag = max(sample, 0.5 * self.__lag)
+            metrics.set_gauge(name='event_loop_lag_seconds', value=self.__lag)
+
+
+event_loop_lag_monitor = EventLoopLagMonitor()
@@ -0,0 +1,110 @@
+"""
+This module contains the middleware that rejects the requests early when the worker is overloaded.
+"""
+from math import ceil
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.settings import settings
+from app.utils.cryptography import hashing_executor
+from app.utils.llm import model_call_scheduler
+from app.utils.metrics import metrics
+
+from .event_loop_lag_monitor import event_loop_lag_monitor
+
+metrics.describe(name='in_flight_requests', description='Requests being handled by the worker per route group.')
+metrics.describe(name='load_shed_total', description='Requests rejected by the load shedding per route group.')
+
+# Route group by first path segment, the routes without group, such as the probes and the metrics, are never shed
+ROUTE_GROUPS = {'translate': 'model', 'emotions': 'model', 'auth': 'account', 'user': 'account'}
+
+# Route groups shed first, under a lower event loop lag and when the model calls queue is full
+LOW_PRIORITY_GROUPS = {'model'}
+
+
+class LoadSheddingMiddleware():
+    """
+    Rejects the requests with 503 and Retry-After before they are authenticated, so an overloaded worker does not
+    spend database and hashing work on requests that would time out. The requests are rejected when the event loop
+    lags, when their route group has too many in-flight requests, or when the queue of the model calls or of the
+    hashing operations is full.
+    """
+    __app: ASGIApp
+    __in_flight: dict[str, int]
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Create a new LoadSheddingMiddleware instance.
+
+        Args:
+            app (ASGIApp): Wrapped ASGI app.
+        """
+        self.__app = app
+        self.__in_flight = {group: 0 for group in set(ROUTE_GROUPS.values())}
+
+    def __shedding_reason(self, group: str) -> tuple[str, float] | None:
+        """
+        Check if the requests of the route group must be rejected.
+
+        Args:
+            group (str): Route group of the request.
+
+        Returns:
+            tuple[str, float] | None: Reason of the rejection and seconds after which the request can be retried, or
+            None if the request is accepted.
+        """
+        low_priority = group in LOW_PRIORITY_GROUPS
+
+        max_loop_lag = settings.LOAD_SHEDDING_MAX_LOOP_LAG * (1 if low_priority else 2)
+        if max_loop_lag and event_loop_lag_monitor.lag > max_loop_lag:
+            return 'event_loop_lag', event_loop_lag_monitor.lag
+
+        if settings.LOAD_SHEDDING_MAX_IN_FLIGHT and self.__in_flight[group] >= settings.LOAD_SHEDDING_MAX_IN_FLIGHT:
+            return 'in_flight', 1
+
+        if low_priority and model_call_scheduler.saturated:
+            return 'model_queue', model_call_scheduler.retry_after
+
+        if hashing_executor.saturated:
+            return 'hashing_queue', hashing_executor.retry_after
+
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle the request, or reject it if the worker is overloaded.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        group = ROUTE_GROUPS.get(scope['path'].split('/')[1]) if scope['type'] == 'http' else None
+        if group is None:
+            await self.__app(scope, receive, send)
+            return
+
+        shedding_reason = self.__shedding_reason(group=group)
+        if shedding_reason is not None:
+            reason, retry_after = shedding_reason
+            metrics.increment(name='load_shed_total', labels={'group': group, 'reason': reason})
+
+            response = JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                    headers={'Retry-After': str(max(1, ceil(retry_after)))},
+                                    content={
+                                        'message': 'The server is overloaded. Please try again later.',
+                                        'error': 'Service Unavailable'
+                                    })
+            await response(scope, receive, send)
+            return
+
+        self.__in_flight[group] += 1
+        metrics.set_gauge(name='in_flight_requests', value=self.__in_flight[group], labels={'group': group})
+        try:
+            await self.__app(scope, receive, send)
+
+        finally:
+            self.__in_flight[group] -= 1
+            metrics.set_gauge(name='in_flight_requests', value=self.__in_flight[group], labels={'group': group})
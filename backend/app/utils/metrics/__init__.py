@@ -0,0 +1 @@
+from .metrics_registry import metrics, MetricsRegistry
@@ -0,0 +1,164 @@
+"""
+This module contains the in-process metrics registry exposed on the /metrics endpoint.
+"""
+from bisect import bisect_left
+from threading import Lock
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class MetricsRegistry():
+    """
+    Registry of counters, gauges and histograms rendered in the Prometheus text format.
+    """
+    __lock: Lock
+    __counters: dict[str, dict[Labels, float]]
+    __gauges: dict[str, dict[Labels, float]]
+    __histograms: dict[str, dict[Labels, list[float]]]
+    __buckets: dict[str, tuple[float, ...]]
+    __descriptions: dict[str, str]
+
+    def __init__(self) -> None:
+        """
+        Create a new empty MetricsRegistry instance.
+        """
+        self.__lock = Lock()
+        self.__counters = {}
+        self.__gauges = {}
+        self.__histograms = {}
+        self.__buckets = {}
+        self.__descriptions = {}
+
+    @staticmethod
+    def __labels(labels: dict[str, str] | None) -> Labels:
+        """
+        Get the hashable representation of the labels.
+
+        Args:
+            labels (dict[str, str] | None): Metric labels.
+
+        Returns:
+            Labels: Sorted label pairs.
+        """
+        return tuple(sorted((labels or {}).items()))
+
+    def describe(self, name: str, description: str, buckets: tuple[float, ...] | None = None) -> None:
+        """
+        Set the description of a metric and, for histograms, its buckets.
+
+        Args:
+            name (str): Metric name.
+            description (str): Metric description.
+            buckets (tuple[float, ...] | None, optional): Histogram upper bounds. Defaults to DEFAULT_BUCKETS.
+        """
+        with self.__lock:
+            self.__descriptions[name] = description
+            if buckets is not None:
+                self.__buckets[name] = tuple(sorted(buckets))
+
+    def increment(self, name: str, value: float = 1, labels: dict[str, str] | None = None) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name (str): Counter name.
+            value (float, optional): Increment. Defaults to 1.
+            labels (dict[str, str] | None, optional): Counter labels. Defaults to None.
+        """
+        key = self.__labels(labels=labels)
+        with self.__lock:
+            counter = self.__counters.setdefault(name, {})
+            counter[key] = counter.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        """
+        Set the value of a gauge.
+
+        Args:
+            name (str): Gauge name.
+            value (float): Gauge value.
+            labels (dict[str, str] | None, optional): Gauge labels. Defaults to None.
+        """
+        key = self.__labels(labels=labels)
+        with self.__lock:
+            self.__gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        """
+        Record an observation in a histogram.
+
+        Args:
+            name (str): Histogram name.
+            value (float): Observed value.
+            labels (dict[str, str] | None, optional): Histogram labels. Defaults to None.
+        """
+        key = self.__labels(labels=labels)
+        with self.__lock:
+            buckets = self.__buckets.setdefault(name, DEFAULT_BUCKETS)
+            # Bucket counts followed by the overflow bucket, the sum and the count
+            histogram = self.__histograms.setdefault(name, {}).setdefault(key, [0.0] * (len(buckets) + 3))
+            histogram[bisect_left(buckets, value)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def get_value(self, name: str, labels: dict[str, str] | None = None) -> float:
+        """
+        Get the current value of a counter or a gauge.
+
+        Args:
+            name (str): Metric name.
+            labels (dict[str, str] | None, optional): Metric labels. Defaults to None.
+
+        Returns:
+            float: Metric value, 0 if it has not been recorded.
+        """
+        key = self.__labels(labels=labels)
+        with self.__lock:
+            return self.__counters.get(name, self.__gauges.get(name, {})).get(key, 0)
+
+    def render(self) -> str:
+        """
+        Render all the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Rendered metrics.
+        """
+
+        def format_labels(labels: Labels, extra: tuple[tuple[str, str], ...] = ()) -> str:
+            pairs = labels + extra
+            if not pairs:
+                return ''
+
+            return '{' + ','.join(f'{name}="{value}"' for name, value in pairs) + '}'
+
+        lines = []
+        with self.__lock:
+            for metric_type, metrics in (('counter', self.__counters), ('gauge', self.__gauges)):
+                for name, values in sorted(metrics.items()):
+                    if name in self.__descriptions:
+                        lines.append(f'# HELP {name} {self.__descriptions[name]}')
+                    lines.append(f'# TYPE {name} {metric_type}')
+                    lines.extend(f'{name}{format_labels(labels)} {value}' for labels, value in values.items())
+
+            for name, values in sorted(self.__histograms.items()):
+                if name in self.__descriptions:
+                    lines.append(f'# HELP {name} {self.__descriptions[name]}')
+                lines.append(f'# TYPE {name} histogram')
+
+                buckets = self.__buckets[name]
+                for labels, histogram in values.items():
+                    cumulative = 0.0
+                    for upper_bound, count in zip(buckets + (float('inf'),), histogram[:-2]):
+                        cumulative += count
+                        bound = '+Inf' if upper_bound == float('inf') else str(upper_bound)
+                        lines.append(f'{name}_bucket{format_labels(labels, (("le", bound),))} {cumulative}')
+
+                    lines.append(f'{name}_sum{format_labels(labels)} {histogram[-2]}')
+                    lines.append(f'{name}_count{format_labels(labels)} {histogram[-1]}')
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
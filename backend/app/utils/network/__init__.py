@@ -0,0 +1 @@
+from .public_address import check_public_host, is_public_address, resolve_public_address
@@ -0,0 +1,81 @@
+"""
+This module contains the checks of the hosts the server sends requests to on behalf of the users, so the users cannot
+reach the loopback, private, link-local or cloud metadata addresses of the server network.
+"""
+from asyncio import get_running_loop
+from ipaddress import ip_address
+from socket import SOCK_STREAM
+
+from app.utils.exceptions import ValidationException
+
+
+def is_public_address(address: str) -> bool:
+    """
+    Check if an IP address is a public unicast address.
+
+    Args:
+        address (str): IPv4 or IPv6 address.
+
+    Raises:
+        ValueError: If the address is not an IP address.
+
+    Returns:
+        bool: True if the address is global and not multicast, False otherwise.
+    """
+    # The zone of the scoped IPv6 addresses, such as fe80::1%eth0, is not part of the address
+    ip = ip_address(address.strip('[]').partition('%')[0])
+    return ip.is_global and not ip.is_multicast
+
+
+def check_public_host(host: str) -> None:
+    """
+    Check that a host is not a local name or a non public IP address. Other host names are checked when they are
+    resolved.
+
+    Args:
+        host (str): Host name or IP address.
+
+    Raises:
+        ValidationException: If the host is a local name or a non public IP address.
+    """
+    host = host.rstrip('.').lower()
+    if host == 'localhost' or host.endswith('.localhost'):
+        raise ValidationException(message=f'Host {host} is not public.')
+
+    try:
+        public = is_public_address(address=host)
+
+    except ValueError:
+        return
+
+    if not public:
+        raise ValidationException(message=f'Host {host} is not public.')
+
+
+async def resolve_public_address(host: str, port: int) -> str:
+    """
+    Resolve a host to a public IP address. Every resolved address must be public, so the host cannot point to a local
+    address on another resolution, and the request must be sent to the returned address.
+
+    Args:
+        host (str): Host name or IP address.
+        port (int): Port of the request.
+
+    Raises:
+        ValidationException: If the host cannot be resolved or resolves to a non public address.
+
+    Returns:
+        str: First resolved address.
+    """
+    check_public_host(host=host)
+
+    try:
+        addresses = [info[4][0] for info in await get_running_loop().getaddrinfo(host, port, type=SOCK_STREAM)]
+
+    except (OSError, UnicodeError) as exception:
+        raise ValidationException(message=f'Host {host} cannot be resolved.') from exception
+
+    if not addresses or not all(is_public_address(address=address) for address in addresses):
+        raise ValidationException(message=f'Host {host} does not resolve to a public address.')
+
+    return addresses[0]
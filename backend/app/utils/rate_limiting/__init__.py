@@ -0,0 +1,5 @@
+from .api_key_rate_limiter import api_key_rate_limiter, ApiKeyRateLimiter, estimate_tokens
+from .in_memory_rate_limit_store import InMemoryRateLimitStore
+from .rate_limit_store import RateLimitResult, RateLimitStore
+from .redis_rate_limit_store import RedisRateLimitStore
+from .token_bucket import TokenBucket, TokenBucketRegistry
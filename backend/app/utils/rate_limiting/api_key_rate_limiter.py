@@ -0,0 +1,146 @@
+"""
+This module contains the rate limiter of the API key protected routes.
+"""
+from contextlib import asynccontextmanager
+from math import ceil
+from typing import AsyncIterator
+
+from app.settings import settings
+from app.utils.exceptions import TooManyRequestsException
+from app.utils.metrics import metrics
+
+from .in_memory_rate_limit_store import InMemoryRateLimitStore
+from .rate_limit_store import RateLimitResult, RateLimitStore
+from .redis_rate_limit_store import RedisRateLimitStore
+
+metrics.describe(name='api_key_rate_limited_total', description='Requests rejected by the API key rate limits.')
+
+DAY = 24 * 60 * 60
+
+
+class ApiKeyRateLimiter():
+    """
+    Requests per second, concurrent requests and daily input tokens limits per API key and per user. A limit of 0
+    disables it.
+    """
+    __store: RateLimitStore
+
+    def __init__(self, store: RateLimitStore) -> None:
+        """
+        Create a new ApiKeyRateLimiter instance.
+
+        Args:
+            store (RateLimitStore): Store of the rate limit state.
+        """
+        self.__store = store
+
+    @staticmethod
+    def __headers(result: RateLimitResult) -> dict[str, str]:
+        """
+        Get the rate limit headers of the result.
+
+        Args:
+            result (RateLimitResult): Rate limit result.
+
+        Returns:
+            dict[str, str]: RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset headers.
+        """
+        return {
+            'RateLimit-Limit': str(result.limit),
+            'RateLimit-Remaining': str(result.remaining),
+            'RateLimit-Reset': str(ceil(result.reset_after)),
+        }
+
+    def __reject(self, limit: str, message: str, retry_after: float, headers: dict[str, str]) -> None:
+        """
+        Reject the request.
+
+        Args:
+            limit (str): Name of the exceeded limit.
+            message (str): Message of the rejection.
+            retry_after (float): Seconds after which the request can be retried.
+            headers (dict[str, str]): Rate limit headers.
+
+        Raises:
+            TooManyRequestsException: Always.
+        """
+        metrics.increment(name='api_key_rate_limited_total', labels={'limit': limit})
+        raise TooManyRequestsException(message=message, retry_after=retry_after, headers=headers)
+
+    @asynccontextmanager
+    async def limit(self, api_key_id: str, user_id: str, input_tokens: int) -> AsyncIterator[dict[str, str]]:
+        """
+        Check the limits of the API key and its owner and hold a concurrency slot of both while the request runs.
+
+        Args:
+            api_key_id (str): ID of the API key.
+            user_id (str): ID of the owner of the API key.
+            input_tokens (int): Estimated input tokens of the request.
+
+        Raises:
+            TooManyRequestsException: If any of the limits is exceeded.
+
+        Yields:
+            dict[str, str]: Rate limit headers of the most restrictive requests per second limit.
+        """
+        headers: dict[str, str] = {}
+        tightest_result = None
+        for key, limit in ((f'api-key:{api_key_id}:requests', settings.API_KEY_RATE_LIMIT),
+                           (f'user:{user_id}:requests', settings.USER_RATE_LIMIT)):
+            if limit > 0:
+                result = await self.__store.hit(key=key, limit=limit, window=1)
+                if tightest_result is None or result.remaining < tightest_result.remaining:
+                    tightest_result = result
+                    headers = self.__headers(result=result)
+
+                if not result.allowed:
+                    self.__reject(limit='requests',
+                                  message='Request rate limit exceeded. Please try again later.',
+                                  retry_after=result.reset_after,
+                                  headers=headers)
+
+        acquired_keys: list[str] = []
+        try:
+            for key, limit in ((f'api-key:{api_key_id}', settings.API_KEY_MAX_CONCURRENT_REQUESTS),
+                               (f'user:{user_id}', settings.USER_MAX_CONCURRENT_REQUESTS)):
+                if limit > 0:
+                    if not await self.__store.acquire(key=key, limit=limit):
+                        self.__reject(limit='concurrency',
+                                      message='Too many concurrent requests. Please try again later.',
+                                      retry_after=1,
+                                      headers=headers)
+
+                    acquired_keys.append(key)
+
+            for key, limit in ((f'api-key:{api_key_id}:tokens', settings.API_KEY_DAILY_INPUT_TOKENS),
+                               (f'user:{user_id}:tokens', settings.USER_DAILY_INPUT_TOKENS)):
+                if limit > 0:
+                    result = await self.__store.hit(key=key, limit=limit, window=DAY, cost=input_tokens)
+                    if not result.allowed:
+                        self.__reject(limit='tokens',
+                                      message='Daily input tokens quota exceeded. Please try again later.',
+                                      retry_after=result.reset_after,
+                                      headers=headers)
+
+            yield headers
+
+        finally:
+            for key in acquired_keys:
+                await self.__store.release(key=key)
+
+
+def estimate_tokens(content: bytes) -> int:
+    """
+    Estimate the number of model tokens of the content, about 4 bytes per token for english text.
+
+    Args:
+        content (bytes): Request content.
+
+    Returns:
+        int: Estimated number of tokens.
+    """
+    return max(1, ceil(len(content) / 4))
+
+
+api_key_rate_limiter = ApiKeyRateLimiter(store=RedisRateLimitStore(
+    url=settings.RATE_LIMIT_REDIS_URL) if settings.RATE_LIMIT_REDIS_URL else InMemoryRateLimitStore())
@@ -0,0 +1,106 @@
+"""
+This module contains the in-memory rate limit store.
+"""
+from collections import OrderedDict
+from time import time
+
+from .rate_limit_store import RateLimitResult, RateLimitStore
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    Rate limit store local to the worker process. It uses sliding window counters, which keep two counters per key
+    instead of a log of every request.
+    """
+    __max_keys: int
+    __windows: OrderedDict[str, list[float]]
+    __slots: dict[str, int]
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        """
+        Create a new InMemoryRateLimitStore instance.
+
+        Args:
+            max_keys (int, optional): Maximum number of tracked windows. Defaults to 100_000.
+        """
+        self.__max_keys = max_keys
+        self.__windows = OrderedDict()
+        self.__slots = {}
+
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> RateLimitResult:
+        """
+        Add the cost to the sliding window of the key if it does not exceed the limit.
+
+        Args:
+            key (str): Rate limit key.
+            limit (int): Maximum cost allowed in the window.
+            window (float): Window length in seconds.
+            cost (int, optional): Cost of the request. Defaults to 1.
+
+        Returns:
+            RateLimitResult: Result of the check.
+        """
+        now = time()
+        window_index = now // window
+        elapsed = now - window_index * window
+
+        # Window index, count of the current window and count of the previous window
+        state = self.__windows.get(key)
+        if state is None:
+            state = [window_index, 0, 0]
+            self.__windows[key] = state
+            if len(self.__windows) > self.__max_keys:
+                self.__windows.popitem(last=False)
+
+        else:
+            self.__windows.move_to_end(key)
+
+        if state[0] != window_index:
+            state[2] = state[1] if state[0] == window_index - 1 else 0
+            state[1] = 0
+            state[0] = window_index
+
+        estimate = state[2] * (1 - elapsed / window) + state[1]
+        if estimate + cost > limit:
+            return RateLimitResult(allowed=False,
+                                   limit=limit,
+                                   remaining=max(0, int(limit - estimate)),
+                                   reset_after=window - elapsed)
+
+        state[1] += cost
+        return RateLimitResult(allowed=True,
+                               limit=limit,
+                               remaining=max(0, int(limit - estimate - cost)),
+                               reset_after=window - elapsed)
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        """
+        Take a concurrency slot of the key if there is one free.
+
+        Args:
+            key (str): Concurrency key.
+            limit (int): Maximum number of concurrent slots.
+
+        Returns:
+            bool: True if the slot was taken, False otherwise.
+        """
+        slots = self.__slots.get(key, 0)
+        if slots >= limit:
+            return False
+
+        self.__slots[key] = slots + 1
+        return True
+
+    async def release(self, key: str) -> None:
+        """
+        Release a concurrency slot of the key.
+
+        Args:
+            key (str): Concurrency key.
+        """
+        slots = self.__slots.get(key, 0) - 1
+        if slots > 0:
+            self.__slots[key] = slots
+
+        else:
+            self.__slots.pop(key, None)
@@ -0,0 +1,58 @@
+"""
+This module contains the interface of the rate limit state stores.
+"""
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+
+class RateLimitResult(NamedTuple):
+    """
+    Result of a sliding window rate limit check.
+    """
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+
+
+class RateLimitStore(ABC):
+    """
+    Store of the rate limit state. Shared stores keep the limits across several workers.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> RateLimitResult:
+        """
+        Add the cost to the sliding window of the key if it does not exceed the limit.
+
+        Args:
+            key (str): Rate limit key.
+            limit (int): Maximum cost allowed in the window.
+            window (float): Window length in seconds.
+            cost (int, optional): Cost of the request. Defaults to 1.
+
+        Returns:
+            RateLimitResult: Result of the check.
+        """
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: int) -> bool:
+        """
+        Take a concurrency slot of the key if there is one free.
+
+        Args:
+            key (str): Concurrency key.
+            limit (int): Maximum number of concurrent slots.
+
+        Returns:
+            bool: True if the slot was taken, False otherwise.
+        """
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """
+        Release a concurrency slot of the key.
+
+        Args:
+            key (str): Concurrency key.
+        """
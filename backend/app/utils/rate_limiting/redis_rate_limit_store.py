@@ -0,0 +1,127 @@
+"""
+This module contains the Redis rate limit store, shared by all the workers.
+"""
+from __future__ import annotations
+
+from time import time
+from typing import Any, TYPE_CHECKING
+
+from .rate_limit_store import RateLimitResult, RateLimitStore
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# Sliding window counter, it returns whether the cost was added and the estimated count in thousandths
+HIT_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimate = previous * tonumber(ARGV[3]) + current
+if estimate + tonumber(ARGV[2]) > tonumber(ARGV[1]) then
+    return {0, math.floor(estimate * 1000)}
+end
+redis.call('INCRBY', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return {1, math.floor((estimate + tonumber(ARGV[2])) * 1000)}
+"""
+
+# Concurrency slots, the expiration frees the slots of crashed workers
+ACQUIRE_SCRIPT = """
+local slots = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if slots > tonumber(ARGV[1]) then
+    redis.call('DECR', KEYS[1])
+    return 0
+end
+return 1
+"""
+
+# Release a concurrency slot without going below zero when the slots already expired
+RELEASE_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') > 0 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Rate limit store kept in Redis, so the limits hold across several workers and replicas.
+    """
+    __client: Redis
+    __prefix: str
+    __slot_expiration: int
+    __hit_script: Any
+    __acquire_script: Any
+    __release_script: Any
+
+    def __init__(self, url: str, prefix: str = 'rate-limit', slot_expiration: int = 300) -> None:
+        """
+        Create a new RedisRateLimitStore instance.
+
+        Args:
+            url (str): Redis URL.
+            prefix (str, optional): Prefix of the Redis keys. Defaults to 'rate-limit'.
+            slot_expiration (int, optional): Seconds after which the concurrency slots of an idle key are freed.
+            Defaults to 300.
+
+        Raises:
+            ImportError: If the redis package is not installed.
+        """
+        from redis.asyncio import Redis
+
+        self.__client = Redis.from_url(url=url)
+        self.__prefix = prefix
+        self.__slot_expiration = slot_expiration
+        self.__hit_script = self.__client.register_script(script=HIT_SCRIPT)
+        self.__acquire_script = self.__client.register_script(script=ACQUIRE_SCRIPT)
+        self.__release_script = self.__client.register_script(script=RELEASE_SCRIPT)
+
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> RateLimitResult:
+        """
+        Add the cost to the sliding window of the key if it does not exceed the limit.
+
+        Args:
+            key (str): Rate limit key.
+            limit (int): Maximum cost allowed in the window.
+            window (float): Window length in seconds.
+            cost (int, optional): Cost of the request. Defaults to 1.
+
+        Returns:
+            RateLimitResult: Result of the check.
+        """
+        now = time()
+        window_index = int(now // window)
+        elapsed = now - window_index * window
+
+        allowed, estimate = await self.__hit_script(
+            keys=[f'{self.__prefix}:{key}:{window_index}', f'{self.__prefix}:{key}:{window_index - 1}'],
+            args=[limit, cost, 1 - elapsed / window, int(2 * window) + 1])
+
+        return RateLimitResult(allowed=bool(allowed),
+                               limit=limit,
+                               remaining=max(0, int(limit - estimate / 1000)),
+                               reset_after=window - elapsed)
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        """
+        Take a concurrency slot of the key if there is one free.
+
+        Args:
+            key (str): Concurrency key.
+            limit (int): Maximum number of concurrent slots.
+
+        Returns:
+            bool: True if the slot was taken, False otherwise.
+        """
+        return bool(await self.__acquire_script(keys=[f'{self.__prefix}:slots:{key}'],
+                                                args=[limit, self.__slot_expiration]))
+
+    async def release(self, key: str) -> None:
+        """
+        Release a concurrency slot of the key.
+
+        Args:
+            key (str): Concurrency key.
+        """
+        await self.__release_script(keys=[f'{self.__prefix}:slots:{key}'])
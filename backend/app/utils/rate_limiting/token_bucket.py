@@ -0,0 +1,95 @@
+"""
+This module contains the token bucket rate limiter.
+"""
+from collections import OrderedDict
+from time import monotonic
+
+
+class TokenBucket():
+    """
+    Token bucket that refills continuously up to its capacity.
+    """
+    __capacity: float
+    __refill_rate: float
+    __tokens: float
+    __updated_at: float
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        """
+        Create a new full TokenBucket instance.
+
+        Args:
+            capacity (float): Maximum number of tokens, that is, the allowed burst.
+            refill_rate (float): Tokens added per second.
+        """
+        self.__capacity = capacity
+        self.__refill_rate = refill_rate
+        self.__tokens = capacity
+        self.__updated_at = monotonic()
+
+    def consume(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket if there are enough of them.
+
+        Args:
+            tokens (float, optional): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the seconds until they are available.
+        """
+        now = monotonic()
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__refill_rate)
+        self.__updated_at = now
+
+        if self.__tokens >= tokens:
+            self.__tokens -= tokens
+            return 0
+
+        return (tokens - self.__tokens) / self.__refill_rate
+
+
+class TokenBucketRegistry():
+    """
+    Token buckets per key, evicting the least recently used keys when the registry is full.
+    """
+    __capacity: float
+    __refill_rate: float
+    __max_keys: int
+    __buckets: OrderedDict[str, TokenBucket]
+
+    def __init__(self, capacity: float, refill_rate: float, max_keys: int = 100_000) -> None:
+        """
+        Create a new TokenBucketRegistry instance.
+
+        Args:
+            capacity (float): Capacity of each token bucket.
+            refill_rate (float): Tokens added per second to each token bucket.
+            max_keys (int, optional): Maximum number of tracked keys. Defaults to 100_000.
+        """
+        self.__capacity = capacity
+        self.__refill_rate = refill_rate
+        self.__max_keys = max_keys
+        self.__buckets = OrderedDict()
+
+    def consume(self, key: str, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket of the key.
+
+        Args:
+            key (str): Bucket key.
+            tokens (float, optional): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the seconds until they are available.
+        """
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(capacity=self.__capacity, refill_rate=self.__refill_rate)
+            self.__buckets[key] = bucket
+            if len(self.__buckets) > self.__max_keys:
+                self.__buckets.popitem(last=False)
+
+        else:
+            self.__buckets.move_to_end(key)
+
+        return bucket.consume(tokens=tokens)
@@ -0,0 +1,184 @@
+"""
+Measure the latency of the UserDAL lookups and deletes on the seeded dataset and print the EXPLAIN plan of each of
+their statements, so a missing or unused index shows up as a full scan. The deletes run in a transaction that is
+rolled back, so the dataset is not modified.
+
+Usage:
+    python -m benchmarks.seed_dataset --users 10000000 --keys-per-user 5 --fast-hashing
+    python -m benchmarks.dal_benchmark --samples 2000 --output dal_benchmark.json
+"""
+from argparse import ArgumentParser
+from json import dump
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+from sqlalchemy import Connection, event, select, text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.users.dal import UserDAL
+from app.users.models import ApiKey, User
+
+
+def sample_rows(connection: Connection, column: Any, samples: int) -> list[Any]:
+    """
+    Sample values of random rows. The primary keys are random UUIDs, so the first row after a random UUID is a random
+    row, without scanning the table.
+
+    Args:
+        connection (Connection): Database connection.
+        column (Any): Column of the sampled values.
+        samples (int): Number of samples.
+
+    Returns:
+        list[Any]: Sampled values.
+    """
+    table = column.table
+    values = []
+    for _ in range(samples):
+        value = connection.execute(select(column).where(table.c.id >= uuid4()).order_by(table.c.id).limit(1)).scalar()
+        if value is None:
+            value = connection.execute(select(column).order_by(table.c.id).limit(1)).scalar()
+
+        if value is None:
+            raise RuntimeError(f'Table {table.name} is empty, seed it with python -m benchmarks.seed_dataset.')
+
+        values.append(value)
+
+    return values
+
+
+def measure(connection: Connection, method: Callable[[UserDAL, Any], Any],
+            values: list[Any]) -> tuple[list[float], list[tuple[str, Any]]]:
+    """
+    Measure the latency of a DAL method and capture the statements of its first call. Each call runs in a savepoint
+    that is rolled back, so the deletes do not modify the dataset.
+
+    Args:
+        connection (Connection): Database connection with an open transaction.
+        method (Callable[[UserDAL, Any], Any]): DAL method call.
+        values (list[Any]): Argument of each call.
+
+    Returns:
+        tuple[list[float], list[tuple[str, Any]]]: Latencies in milliseconds, and the statements of the first call
+            with their parameters.
+    """
+    statements: list[tuple[str, Any]] = []
+    latencies: list[float] = []
+
+    def capture_statement(connection: Connection, cursor: Any, statement: str, parameters: Any, context: Any,
+                          executemany: bool) -> None:
+        if not latencies and not statement.startswith(('SAVEPOINT', 'RELEASE', 'ROLLBACK')):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', capture_statement)
+    try:
+        for value in values:
+            savepoint = connection.begin_nested()
+            with Session(bind=connection, join_transaction_mode='create_savepoint') as session:
+                start = perf_counter()
+                method(UserDAL(session=session), value)
+                latencies.append((perf_counter() - start) * 1000)
+
+            savepoint.rollback()
+
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture_statement)
+
+    return latencies, statements
+
+
+def explain(connection: Connection, statement: str, parameters: Any) -> list[dict[str, Any]]:
+    """
+    Get the EXPLAIN plan of a statement.
+
+    Args:
+        connection (Connection): Database connection.
+        statement (str): SQL statement.
+        parameters (Any): Parameters of the statement.
+
+    Returns:
+        list[dict[str, Any]]: Rows of the plan.
+    """
+    return [dict(row._mapping) for row in connection.exec_driver_sql(f'EXPLAIN {statement}', parameters)]
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Measure the UserDAL latency and print the EXPLAIN plans.')
+    parser.add_argument('--samples', type=int, default=1000, help='Number of calls per method. Defaults to 1000.')
+    parser.add_argument('--output', default=None, help='JSON file where the results are stored.')
+    arguments = parser.parse_args()
+
+    with engine.connect() as connection:
+        emails = sample_rows(connection=connection, column=User.__table__.c.email, samples=arguments.samples)
+        user_ids = sample_rows(connection=connection, column=User.__table__.c.id, samples=arguments.samples)
+        secret_keys = sample_rows(connection=connection,
+                                  column=ApiKey.__table__.c.secret_key,
+                                  samples=arguments.samples)
+        connection.rollback()
+
+        methods: dict[str, tuple[Callable[[UserDAL, Any], Any], list[Any]]] = {
+            'get_user_by_email': (lambda user_dal, email: user_dal.get_user_by_email(email=email), emails),
+            'get_user_by_id': (lambda user_dal, id: user_dal.get_user_by_id(id=id), user_ids),
+            'get_api_key_by_secret_key':
+                (lambda user_dal, secret_key: user_dal.get_api_key_by_secret_key(secret_key=secret_key), secret_keys),
+            'delete_user': (lambda user_dal, id: user_dal.delete_user(user=user_dal.get_user_by_id(id=id)), user_ids),
+        }
+
+        results = {}
+        print(f'{"Method":<28}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}')
+        for name, (method, values) in methods.items():
+            transaction = connection.begin()
+            try:
+                latencies, statements = measure(connection=connection, method=method, values=values)
+                plans = [{
+                    'statement': statement,
+                    'plan': explain(connection=connection, statement=statement, parameters=parameters)
+                } for statement, parameters in statements]
+
+            finally:
+                transaction.rollback()
+
+            percentiles = quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            results[name] = {'p50': percentiles[49], 'p95': percentiles[94], 'p99': percentiles[98], 'plans': plans}
+            print(f'{name:<28}{percentiles[49]:>9.3f}{percentiles[94]:>9.3f}{percentiles[98]:>9.3f}')
+
+        for name, result in results.items():
+            print(f'\n{name}:')
+            for plan in result['plans']:
+                print(f'  {plan["statement"]}')
+                for row in plan['plan']:
+                    print(f'    table={row.get("table")} type={row.get("type")} key={row.get("key")} '
+                          f'rows={row.get("rows")} extra={row.get("Extra")}')
+
+        with connection.begin():
+            table_sizes = connection.execute(
+                text('SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES '
+                     'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN (:user_table, :api_key_table)'),
+                parameters={
+                    'user_table': User.__tablename__,
+                    'api_key_table': ApiKey.__tablename__
+                }).all()
+
+        print(f'\n{"Table":<10}{"Rows":>14}{"Data MiB":>12}{"Index MiB":>12}')
+        for table_name, table_rows, data_length, index_length in table_sizes:
+            print(f'{table_name:<10}{table_rows:>14}{data_length / 2**20:>12.2f}{index_length / 2**20:>12.2f}')
+
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            dump({
+                'samples': arguments.samples,
+                'methods': results,
+                'tables': {
+                    table_name: {
+                        'rows': table_rows,
+                        'data_length': data_length,
+                        'index_length': index_length
+                    } for table_name, table_rows, data_length, index_length in table_sizes
+                },
+            },
+                 file,
+                 indent=4,
+                 default=str)
@@ -0,0 +1,107 @@
+"""
+Measure the cold start of the app, importing it in fresh interpreters with -X importtime, and print the slowest
+modules. The heavy dependencies, such as LangChain, argon2, jose and langcodes, are imported on first use, so they must
+not show up here. The command fails if the median import time is above --max-time, so it can run in CI.
+
+Usage:
+    python -m benchmarks.import_time_benchmark --runs 5 --top 20 --max-time 2 --output import_time.json
+"""
+from argparse import ArgumentParser
+from json import dump
+from statistics import median
+from subprocess import run
+from sys import executable, exit
+
+LAZY_MODULES = ('langchain', 'langchain_core', 'langchain_openai', 'openai', 'argon2', 'jose', 'langcodes')
+
+
+def measure_import(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import the module in a fresh interpreter and get the import time of every imported module.
+
+    Args:
+        module (str): Module to import.
+
+    Raises:
+        RuntimeError: If the import fails.
+
+    Returns:
+        dict[str, tuple[int, int]]: Self and cumulative import time in microseconds by module name.
+    """
+    process = run([executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f'Could not import {module}:\n{process.stderr}')
+
+    timings = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, cumulative_time, name = line.removeprefix('import time:').split('|')
+        timings[name.strip()] = (int(self_time), int(cumulative_time))
+
+    return timings
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Measure the import time of the app.')
+    parser.add_argument('--module', default='app.app', help='Module to import. Defaults to app.app.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters. Defaults to 5.')
+    parser.add_argument('--top', type=int, default=20, help='Number of slowest modules shown. Defaults to 20.')
+    parser.add_argument('--max-time', type=float, default=None, help='Maximum median import time in seconds.')
+    parser.add_argument('--output', default=None, help='JSON file where the results are stored.')
+    arguments = parser.parse_args()
+
+    runs = [measure_import(module=arguments.module) for _ in range(arguments.runs)]
+    total_time = median(timings[arguments.module][1] for timings in runs) / 1e6
+
+    # Median per module of the runs that imported it
+    modules = {
+        name: (median(timings[name][0] for timings in runs if name in timings) / 1e3,
+               median(timings[name][1] for timings in runs if name in timings) / 1e3)
+        for name in runs[0]
+    }
+
+    # Cumulative time per top level package, only counting the outermost import of each package
+    packages: dict[str, float] = {}
+    for name, (_, cumulative_time) in modules.items():
+        package = name.split('.')[0]
+        if name == package or package not in modules:
+            packages[package] = max(packages.get(package, 0), cumulative_time)
+
+    eager_lazy_modules = sorted({name.split('.')[0] for name in modules} & set(LAZY_MODULES))
+
+    print(f'Median import time of {arguments.module}: {total_time:.3f}s over {arguments.runs} runs\n')
+    print(f'{"Package":<40}{"Cumulative ms":>15}')
+    for package, cumulative_time in sorted(packages.items(), key=lambda item: -item[1])[:arguments.top]:
+        print(f'{package:<40}{cumulative_time:>15.1f}')
+
+    print(f'\n{"Module":<60}{"Self ms":>10}{"Cumulative ms":>15}')
+    for name, (self_time, cumulative_time) in sorted(modules.items(), key=lambda item: -item[1][0])[:arguments.top]:
+        print(f'{name:<60}{self_time:>10.1f}{cumulative_time:>15.1f}')
+
+    if eager_lazy_modules:
+        print('\nModules that should be imported on first use were imported at startup: '
+              f'{", ".join(eager_lazy_modules)}')
+
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            dump({
+                'module': arguments.module,
+                'runs': arguments.runs,
+                'total_time': total_time,
+                'packages': packages,
+                'modules': {
+                    name: {
+                        'self': self_time,
+                        'cumulative': cumulative_time
+                    } for name, (self_time, cumulative_time) in modules.items()
+                },
+                'eager_lazy_modules': eager_lazy_modules,
+            },
+                 file,
+                 indent=4)
+
+    if arguments.max_time is not None and total_time > arguments.max_time:
+        print(f'\nImport time {total_time:.3f}s is above the maximum of {arguments.max_time:.3f}s')
+        exit(1)
@@ -0,0 +1,210 @@
+"""
+Compare the per-call overhead and the memory of the LangChain and the native OpenAI HTTP model engines. By default the
+engines call a local mock of the chat completions API that answers instantly, so the measured latency is the overhead
+of the engine and not the model. Use --base-url and --api-key to call a real provider instead.
+
+Usage:
+    python -m benchmarks.model_engine_benchmark --calls 500 --concurrency 20
+"""
+from argparse import ArgumentParser, Namespace
+from asyncio import gather, run, Semaphore
+from json import dumps
+from statistics import quantiles
+from subprocess import run as run_process
+from sys import executable
+from threading import Thread
+from time import perf_counter, sleep, time
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from uvicorn import Config, Server
+
+from app.utils.llm import LangChainEngine, ModelEngine, OpenAIHttpEngine
+
+ENGINES = {'langchain': LangChainEngine, 'openai-http': OpenAIHttpEngine}
+
+# Client libraries imported by each engine
+ENGINE_DEPENDENCIES = {'langchain': 'langchain_openai', 'openai-http': 'httpx'}
+
+MESSAGES = [{'role': 'user', 'content': 'Translate the provided passage to es-ES.\n\nPassage:\nHello world!'}]
+
+
+class Translation(BaseModel):
+    """
+    Structured output of the benchmark calls.
+    """
+    text: str
+
+
+mock_app = FastAPI()
+
+
+@mock_app.post('/v1/chat/completions', response_model=None)
+async def mock_chat_completions(request: Request) -> JSONResponse | StreamingResponse:
+    """
+    Answer a chat completions request with a fixed response.
+
+    Args:
+        request (Request): Chat completions request.
+
+    Returns:
+        JSONResponse | StreamingResponse: Chat completion, or its server-sent events if the request is streamed.
+    """
+    body = await request.json()
+    chunk = {'id': 'chatcmpl-mock', 'object': 'chat.completion.chunk', 'created': int(time()), 'model': body['model']}
+    usage = {'prompt_tokens': 25, 'completion_tokens': 4, 'total_tokens': 29}
+
+    if body.get('stream'):
+
+        async def events() -> AsyncIterator[str]:
+            for content in ('¡Hola', ' mundo', '!'):
+                choice = {'index': 0, 'delta': {'role': 'assistant', 'content': content}, 'finish_reason': None}
+                yield f'data: {dumps(chunk | {"choices": [choice]})}\n\n'
+
+            yield f'data: {dumps(chunk | {"choices": [], "usage": usage})}\n\n'
+            yield 'data: [DONE]\n\n'
+
+        return StreamingResponse(content=events(), media_type='text/event-stream')
+
+    content = '{"text": "¡Hola mundo!"}' if body.get('response_format') else '¡Hola mundo!'
+    return JSONResponse(content=chunk | {
+        'object': 'chat.completion',
+        'choices': [{
+            'index': 0,
+            'message': {
+                'role': 'assistant',
+                'content': content
+            },
+            'finish_reason': 'stop'
+        }],
+        'usage': usage,
+    })
+
+
+def start_mock_server(port: int) -> Server:
+    """
+    Start the mock chat completions API in a background thread.
+
+    Args:
+        port (int): Port of the mock server.
+
+    Returns:
+        Server: Running mock server.
+    """
+    server = Server(config=Config(app=mock_app, port=port, log_level='warning', access_log=False))
+    Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        sleep(0.05)
+
+    return server
+
+
+def measure_import_time(engine: str) -> float:
+    """
+    Measure the import time of the client library of an engine in a fresh interpreter.
+
+    Args:
+        engine (str): Engine name.
+
+    Returns:
+        float: Import time in milliseconds.
+    """
+    code = (f'from time import perf_counter; start = perf_counter(); import {ENGINE_DEPENDENCIES[engine]}; '
+            f'print((perf_counter() - start) * 1000)')
+    return float(run_process([executable, '-c', code], capture_output=True, text=True, check=True).stdout)
+
+
+async def measure_engine(engine: ModelEngine, calls: int, concurrency: int, stream: bool) -> list[float]:
+    """
+    Measure the latency of the engine calls.
+
+    Args:
+        engine (ModelEngine): Model engine.
+        calls (int): Number of calls.
+        concurrency (int): Number of concurrent calls.
+        stream (bool): Stream the responses.
+
+    Returns:
+        list[float]: Latencies in milliseconds.
+    """
+    semaphore = Semaphore(value=concurrency)
+    latencies = []
+
+    async def call() -> None:
+        async with semaphore:
+            start = perf_counter()
+            if stream:
+                async for _ in engine.stream(messages=MESSAGES, usage={}):
+                    pass
+
+            else:
+                await engine.complete(messages=MESSAGES)
+
+            latencies.append((perf_counter() - start) * 1000)
+
+    await gather(*(call() for _ in range(calls)))
+    return latencies
+
+
+async def benchmark(arguments: Namespace) -> None:
+    """
+    Run the benchmark of every engine.
+
+    Args:
+        arguments (Namespace): Command line arguments.
+    """
+    print(f'{"Engine":<14}{"Mode":<10}{"Calls/s":>10}{"p50 ms":>9}{"p99 ms":>9}{"Peak KiB":>10}{"Import ms":>11}')
+    for name, engine_class in ENGINES.items():
+        import_time = measure_import_time(engine=name)
+        engine = engine_class(api_key=arguments.api_key, model=arguments.model, base_url=arguments.base_url)
+        try:
+            # Warm up the connections before measuring
+            await measure_engine(engine=engine, calls=arguments.concurrency, concurrency=arguments.concurrency,
+                                 stream=False)
+
+            for stream in (False, True):
+                start = perf_counter()
+                latencies = await measure_engine(engine=engine,
+                                                 calls=arguments.calls,
+                                                 concurrency=arguments.concurrency,
+                                                 stream=stream)
+                elapsed = perf_counter() - start
+
+                # Memory is traced in a separate run, tracing slows down the calls
+                start_tracing()
+                await measure_engine(engine=engine,
+                                     calls=arguments.concurrency * 5,
+                                     concurrency=arguments.concurrency,
+                                     stream=stream)
+                peak_memory = get_traced_memory()[1] / 1024
+                stop_tracing()
+
+                percentiles = quantiles(latencies, n=100)
+                print(f'{name:<14}{"stream" if stream else "complete":<10}{arguments.calls / elapsed:>10.0f}'
+                      f'{percentiles[49]:>9.2f}{percentiles[98]:>9.2f}{peak_memory:>10.0f}{import_time:>11.0f}')
+
+            output, _ = await engine.complete_structured(messages=MESSAGES, schema=Translation)
+            print(f'{name:<14}{"structured":<10} {output!r}')
+
+        finally:
+            await engine.close()
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Compare the per-call overhead and the memory of the model engines.')
+    parser.add_argument('--calls', type=int, default=500, help='Number of calls per engine and mode. Defaults to 500.')
+    parser.add_argument('--concurrency', type=int, default=20, help='Number of concurrent calls. Defaults to 20.')
+    parser.add_argument('--base-url', default=None, help='OpenAI compatible API. Defaults to a local mock server.')
+    parser.add_argument('--api-key', default='mock-key', help='API key of the provider. Defaults to a mock key.')
+    parser.add_argument('--model', default='gpt-3.5-turbo', help='Model name. Defaults to gpt-3.5-turbo.')
+    parser.add_argument('--port', type=int, default=8765, help='Port of the local mock server. Defaults to 8765.')
+    arguments = parser.parse_args()
+
+    if arguments.base_url is None:
+        start_mock_server(port=arguments.port)
+        arguments.base_url = f'http://127.0.0.1:{arguments.port}/v1'
+
+    run(benchmark(arguments=arguments))
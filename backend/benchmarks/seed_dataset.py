@@ -0,0 +1,192 @@
+"""
+Fill the User and ApiKey tables of the configured database with a synthetic dataset for the DAL scaling benchmarks.
+The number of API keys per user follows a geometric distribution and the emails mix the usual address shapes. Use a
+scratch database, the seeded rows are not removed.
+
+Usage:
+    python -m benchmarks.seed_dataset --users 10000000 --keys-per-user 5 --fast-hashing
+"""
+from argparse import ArgumentParser
+from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from math import log
+from multiprocessing import get_context
+from os import cpu_count, urandom
+from random import choices, random, randrange
+from time import perf_counter
+from typing import Any, Callable, Iterator
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.migrations import run_migrations
+from app.users.models import ApiKey, User
+from app.utils.cryptography import api_keys_hashing, generate_secret_key, password_hashing
+
+BATCH_SIZE = 10000
+
+FIRST_NAMES = ('james', 'maria', 'wei', 'fatima', 'olga', 'juan', 'aiko', 'david', 'amara', 'lucas', 'sofia', 'ivan')
+LAST_NAMES = ('smith', 'garcia', 'wang', 'khan', 'ivanova', 'martinez', 'sato', 'muller', 'okafor', 'rossi', 'silva')
+DOMAINS = ('gmail.com', 'outlook.com', 'yahoo.com', 'icloud.com', 'proton.me', 'example-corp.com', 'uni.example.edu')
+DOMAIN_WEIGHTS = (40, 20, 10, 8, 2, 15, 5)
+
+# Email shapes and their weights, the user number keeps the emails unique
+EMAIL_SHAPES: tuple[tuple[Callable[[str, str, str], str], int], ...] = (
+    (lambda first, last, number: f'{first}.{last}{number}', 40),
+    (lambda first, last, number: f'{first[0]}{last}{number}', 25),
+    (lambda first, last, number: f'{first}_{number}', 15),
+    (lambda first, last, number: f'{first}.{last}+news{number}', 10),
+    (lambda first, last, number: f'{last}.{first}.{number}', 10),
+)
+
+
+def generate_email(number: int) -> str:
+    """
+    Generate a unique email with a realistic shape.
+
+    Args:
+        number (int): Number of the user.
+
+    Returns:
+        str: Email of the user.
+    """
+    shape = choices([shape for shape, _ in EMAIL_SHAPES], weights=[weight for _, weight in EMAIL_SHAPES])[0]
+    first, last = FIRST_NAMES[randrange(len(FIRST_NAMES))], LAST_NAMES[randrange(len(LAST_NAMES))]
+
+    return f'{shape(first, last, format(number, "x"))}@{choices(DOMAINS, weights=DOMAIN_WEIGHTS)[0]}'
+
+
+def generate_key_count(mean: float, maximum: int) -> int:
+    """
+    Generate the number of API keys of a user with a geometric distribution, so most users have a few API keys and
+    some have many.
+
+    Args:
+        mean (float): Mean number of API keys per user.
+        maximum (int): Maximum number of API keys per user.
+
+    Returns:
+        int: Number of API keys of the user.
+    """
+    if mean <= 0:
+        return 0
+
+    return min(maximum, int(log(1 - random()) / log(mean / (mean + 1))))
+
+
+def fake_hash(template: str) -> str:
+    """
+    Build a random hash with the length and the parameters of a real argon2 hash, without the hashing cost.
+
+    Args:
+        template (str): Real argon2 hash.
+
+    Returns:
+        str: Random hash with the shape of the template.
+    """
+    prefix, digest = template.rsplit('$', 1)
+    return f'{prefix}${b64encode(urandom(len(digest) * 3 // 4)).decode().rstrip("=")}'
+
+
+def generate_batches(users: int, keys_per_user: float, max_keys_per_user: int,
+                     days: int) -> Iterator[tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]]:
+    """
+    Generate the users and their API keys in batches.
+
+    Args:
+        users (int): Number of users.
+        keys_per_user (float): Mean number of API keys per user.
+        max_keys_per_user (int): Maximum number of API keys per user.
+        days (int): Number of past days of the creation dates.
+
+    Yields:
+        tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]: User rows, API key rows without their hashed
+            secret key, and the secret keys of the API key rows.
+    """
+    now = datetime.now(tz=timezone.utc)
+    for offset in range(0, users, BATCH_SIZE):
+        user_rows, api_key_rows, secret_keys = [], [], []
+        for number in range(offset, min(users, offset + BATCH_SIZE)):
+            creation_date = now - timedelta(seconds=randrange(days * 24 * 60 * 60))
+            user_rows.append({
+                'id': uuid4(),
+                'email': generate_email(number=number),
+                'creation_date': creation_date,
+                'update_date': creation_date,
+            })
+
+            for key_number in range(generate_key_count(mean=keys_per_user, maximum=max_keys_per_user)):
+                secret_key = generate_secret_key()
+                key_creation_date = creation_date + (now - creation_date) * random()
+                secret_keys.append(secret_key)
+                api_key_rows.append({
+                    'id': uuid4(),
+                    'name': f'Key {key_number + 1}',
+                    'public_key': ApiKey.build_public_key(secret_key=secret_key),
+                    'user_id': user_rows[-1]['id'],
+                    'creation_date': key_creation_date,
+                    'last_utilization_date': None if random() < 0.3 else key_creation_date +
+                                             (now - key_creation_date) * random(),
+                })
+
+        yield user_rows, api_key_rows, secret_keys
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Fill the User and ApiKey tables with a synthetic dataset.')
+    parser.add_argument('--users', type=int, default=100_000, help='Number of users. Defaults to 100000.')
+    parser.add_argument('--keys-per-user', type=float, default=5, help='Mean API keys per user. Defaults to 5.')
+    parser.add_argument('--max-keys-per-user', type=int, default=1000, help='Maximum API keys per user. Defaults '
+                        'to 1000.')
+    parser.add_argument('--days', type=int, default=3 * 365, help='Days of history of the dates. Defaults to 1095.')
+    parser.add_argument('--fast-hashing',
+                        action='store_true',
+                        help='Store random hashes with the shape of argon2 hashes instead of hashing the passwords, '
+                        'the seeded users cannot log in.')
+    parser.add_argument('--workers',
+                        type=int,
+                        default=cpu_count() or 1,
+                        help='Number of hashing processes without --fast-hashing. Defaults to the number of CPUs.')
+    arguments = parser.parse_args()
+
+    run_migrations()
+
+    password_template = password_hashing(password=generate_secret_key())
+
+    seeded_users, seeded_api_keys, start = 0, 0, perf_counter()
+    with ProcessPoolExecutor(max_workers=arguments.workers, mp_context=get_context('spawn')) as executor:
+        for user_rows, api_key_rows, secret_keys in generate_batches(users=arguments.users,
+                                                                     keys_per_user=arguments.keys_per_user,
+                                                                     max_keys_per_user=arguments.max_keys_per_user,
+                                                                     days=arguments.days):
+            # The api keys are hashed with HMAC-SHA256, which is cheap enough to run for every api key
+            hashed_secret_keys = api_keys_hashing(api_keys=secret_keys)
+            if arguments.fast_hashing:
+                passwords = [fake_hash(template=password_template) for _ in user_rows]
+
+            else:
+                passwords = list(
+                    executor.map(password_hashing, [generate_secret_key() for _ in user_rows],
+                                 chunksize=max(1, len(user_rows) // (arguments.workers * 4))))
+
+            for user_row, password in zip(user_rows, passwords):
+                user_row['password'] = password
+
+            for api_key_row, hashed_secret_key in zip(api_key_rows, hashed_secret_keys):
+                api_key_row['secret_key'] = hashed_secret_key
+
+            with engine.begin() as connection:
+                connection.execute(User.__table__.insert(), user_rows)
+                if api_key_rows:
+                    connection.execute(ApiKey.__table__.insert(), api_key_rows)
+
+            seeded_users, seeded_api_keys = seeded_users + len(user_rows), seeded_api_keys + len(api_key_rows)
+            elapsed = perf_counter() - start
+            print(f'Seeded {seeded_users} users and {seeded_api_keys} API keys in {elapsed:.0f}s '
+                  f'({seeded_users / elapsed:.0f} users/s)')
+
+    # Refresh the index statistics, so the benchmark plans match the seeded data
+    with engine.begin() as connection:
+        connection.execute(text(f'ANALYZE TABLE `{User.__tablename__}`, `{ApiKey.__tablename__}`'))
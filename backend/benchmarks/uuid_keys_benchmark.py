@@ -0,0 +1,107 @@
+"""
+Compare the index size and the lookup latency of CHAR(36) and BINARY(16) UUID keys on a seeded dataset. Two scratch
+tables with the layout of the ApiKey table are created in the configured database and dropped at the end.
+
+Usage:
+    python -m benchmarks.uuid_keys_benchmark --rows 200000 --lookups 5000
+"""
+from argparse import ArgumentParser
+from random import choice
+from statistics import quantiles
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from sqlalchemy import Column, Index, MetaData, String, Table, select, text
+from sqlalchemy.types import TypeEngine
+
+from app.database import engine
+from app.utils.database import BinaryUUID
+
+BATCH_SIZE = 5000
+
+
+def create_table(metadata: MetaData, name: str, key_type: TypeEngine) -> Table:
+    """
+    Create a scratch table with the ApiKey keys and indexes.
+
+    Args:
+        metadata (MetaData): Metadata of the scratch tables.
+        name (str): Table name.
+        key_type (TypeEngine): Type of the ID columns.
+
+    Returns:
+        Table: Scratch table.
+    """
+    return Table(name, metadata, Column('id', key_type, primary_key=True), Column('user_id', key_type, nullable=False),
+                 Column('secret_key', String(length=256), nullable=False), Index(f'{name}_user_index', 'user_id'))
+
+
+def measure_lookups(table: Table, ids: list[UUID], lookups: int) -> tuple[float, float]:
+    """
+    Measure the latency of primary key lookups of random IDs.
+
+    Args:
+        table (Table): Table to query.
+        ids (list[UUID]): Seeded IDs.
+        lookups (int): Number of lookups.
+
+    Returns:
+        tuple[float, float]: Median and 99th percentile latency in milliseconds.
+    """
+    latencies = []
+    with engine.connect() as connection:
+        for _ in range(lookups):
+            id = choice(ids)
+            start = perf_counter()
+            connection.execute(select(table).where(table.c.id == (id if isinstance(table.c.id.type, BinaryUUID) else
+                                                                  str(id)))).first()
+            latencies.append((perf_counter() - start) * 1000)
+
+    percentiles = quantiles(latencies, n=100)
+    return percentiles[49], percentiles[98]
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Compare CHAR(36) and BINARY(16) UUID keys.')
+    parser.add_argument('--rows', type=int, default=200_000, help='Number of seeded rows. Defaults to 200000.')
+    parser.add_argument('--lookups', type=int, default=5000, help='Number of timed lookups. Defaults to 5000.')
+    arguments = parser.parse_args()
+
+    metadata = MetaData()
+    tables = (create_table(metadata=metadata, name='BenchmarkTextKey', key_type=String(length=36)),
+              create_table(metadata=metadata, name='BenchmarkBinaryKey', key_type=BinaryUUID))
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+
+    ids = [uuid4() for _ in range(arguments.rows)]
+    user_ids = [uuid4() for _ in range(max(1, arguments.rows // 5))]
+
+    try:
+        for table in tables:
+            print(f'Seeding {arguments.rows} rows into {table.name} ...')
+            is_binary = isinstance(table.c.id.type, BinaryUUID)
+            with engine.begin() as connection:
+                for offset in range(0, arguments.rows, BATCH_SIZE):
+                    connection.execute(table.insert(), [{
+                        'id': id if is_binary else str(id),
+                        'user_id': choice(user_ids) if is_binary else str(choice(user_ids)),
+                        'secret_key': id.hex,
+                    } for id in ids[offset:offset + BATCH_SIZE]])
+
+                connection.execute(text(f'ANALYZE TABLE `{table.name}`'))
+
+        print(f'{"Table":<20}{"Data MiB":>10}{"Index MiB":>11}{"p50 ms":>9}{"p99 ms":>9}')
+        for table in tables:
+            with engine.connect() as connection:
+                data_length, index_length = connection.execute(
+                    text('SELECT DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES '
+                         'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table'),
+                    parameters={
+                        'table': table.name
+                    }).one()
+
+            p50, p99 = measure_lookups(table=table, ids=ids, lookups=arguments.lookups)
+            print(f'{table.name:<20}{data_length / 2**20:>10.2f}{index_length / 2**20:>11.2f}{p50:>9.3f}{p99:>9.3f}')
+
+    finally:
+        metadata.drop_all(bind=engine)
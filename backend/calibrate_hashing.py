@@ -0,0 +1,47 @@
+"""
+Benchmark argon2 on this host and recommend the password hashing parameters.
+
+Usage:
+    python calibrate_hashing.py --target-time 0.5 --memory-budget 1024 --workers 4
+"""
+from argparse import ArgumentParser
+from os import cpu_count
+
+from app.settings import settings
+from app.utils.cryptography import calibrate_hashing_parameters
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Benchmark argon2 on this host and recommend the hashing parameters.')
+    parser.add_argument('--target-time',
+                        type=float,
+                        default=0.5,
+                        help='Maximum time of a single hash in seconds. Defaults to 0.5.')
+    parser.add_argument('--memory-budget',
+                        type=int,
+                        default=1024,
+                        help='Memory in MiB available for all the concurrent hashes. Defaults to 1024.')
+    parser.add_argument('--workers',
+                        type=int,
+                        default=settings.HASHING_WORKERS or cpu_count() or 1,
+                        help='Number of concurrent hashes (HASHING_WORKERS). Defaults to the current setting.')
+    parser.add_argument('--parallelism',
+                        type=int,
+                        default=settings.HASHING_PARALLELISM,
+                        help='Argon2 parallelism. Defaults to the current setting.')
+    arguments = parser.parse_args()
+
+    max_memory_cost = arguments.memory_budget * 1024 // arguments.workers
+    print(f'Calibrating argon2 for {arguments.target_time}s per hash and {max_memory_cost} KiB per hash ...')
+
+    parameters = calibrate_hashing_parameters(target_time=arguments.target_time,
+                                              max_memory_cost=max_memory_cost,
+                                              parallelism=arguments.parallelism,
+                                              hash_length=settings.HASHING_HASH_LENGTH)
+
+    print(f'Measured hashing time: {parameters.hashing_time:.3f}s\n')
+    print(f'HASHING_TIME_COST={parameters.time_cost}')
+    print(f'HASHING_MEMORY_COST={parameters.memory_cost}')
+    print(f'HASHING_PARALLELISM={parameters.parallelism}')
+    print(f'HASHING_WORKERS={arguments.workers}')
+    print('\nPasswords are rehashed with the new parameters on the next successful login. API keys are looked up by '
+          'their hash, so existing API keys stop working if the parameters change.')
@@ -1,11 +1,30 @@
 """
 Start application module.
 """
+from importlib.util import find_spec
+from os import cpu_count
+
 from uvicorn import run as uvicorn_run
 
-from app.database import create_database
+from app.migrations import run_migrations
+from app.settings import Environment, settings
 
 if __name__ == '__main__':
-    create_database()
+    # The migrations run once before the workers start, so the workers do not repeat them
+    run_migrations()
+
+    if settings.ENVIRONMENT == Environment.PRODUCTION:
+        # On SIGTERM the workers stop accepting connections and wait for the in-flight requests before shutting down
+        uvicorn_run(app='app.app:app',
+                    host='0.0.0.0',
+                    port=80,
+                    log_level='info',
+                    workers=settings.WORKERS or cpu_count() or 1,
+                    loop='uvloop' if find_spec('uvloop') else 'asyncio',
+                    http='httptools' if find_spec('httptools') else 'h11',
+                    backlog=settings.BACKLOG,
+                    timeout_keep_alive=settings.KEEP_ALIVE_TIMEOUT,
+                    timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_TIMEOUT)
 
-    uvicorn_run(app='app.app:app', host='0.0.0.0', port=80, log_level='info', reload=True, reload_delay=2)
+    else:
+        uvicorn_run(app='app.app:app', host='0.0.0.0', port=80, log_level='info', reload=True, reload_delay=2)
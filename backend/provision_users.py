@@ -0,0 +1,58 @@
+"""
+Create the users of a CSV or JSONL file in bulk.
+
+The CSV file needs a header row with the email and password columns, the JSONL file needs a JSON object per line with
+the email and password keys. If the provisioning fails, running the same command again resumes after the last commit.
+
+Usage:
+    python provision_users.py users.csv --batch-size 1000 --commit-every 5 --workers 4
+"""
+from argparse import ArgumentParser
+from logging import basicConfig, INFO
+from pathlib import Path
+
+from app.migrations import run_migrations
+from app.settings import settings
+from app.users.functions import provision_users
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Create the users of a CSV or JSONL file in bulk.')
+    parser.add_argument('path', type=Path, help='CSV or JSONL file with the users.')
+    parser.add_argument('--batch-size',
+                        type=int,
+                        default=1000,
+                        help='Number of users validated, hashed and inserted together. Defaults to 1000.')
+    parser.add_argument('--commit-every',
+                        type=int,
+                        default=5,
+                        help='Number of batches of each transaction. Defaults to 5.')
+    parser.add_argument('--workers',
+                        type=int,
+                        default=settings.HASHING_WORKERS,
+                        help='Number of hashing processes. Defaults to HASHING_WORKERS or the number of CPUs.')
+    parser.add_argument('--checkpoint',
+                        type=Path,
+                        default=None,
+                        help='Checkpoint file of the progress. Defaults to the input path with a .checkpoint suffix.')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start from the first user.')
+    arguments = parser.parse_args()
+
+    basicConfig(level=INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    checkpoint = arguments.checkpoint or arguments.path.with_name(f'{arguments.path.name}.checkpoint')
+    if arguments.restart:
+        checkpoint.unlink(missing_ok=True)
+
+    run_migrations()
+
+    report = provision_users(path=arguments.path,
+                             checkpoint=checkpoint,
+                             batch_size=arguments.batch_size,
+                             commit_every=arguments.commit_every,
+                             workers=arguments.workers)
+
+    print(f'\nProcessed records: {report.processed}')
+    print(f'Created users: {report.created}')
+    print(f'Existing emails: {report.duplicated}')
+    print(f'Invalid records: {report.invalid}')
+    print(f'\nThe progress is stored in {checkpoint}, delete it or use --restart to provision the file again.')
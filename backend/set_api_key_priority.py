@@ -0,0 +1,38 @@
+"""
+Set the scheduling priority of the model calls made with an API key.
+
+The API key owners cannot choose the priority, so only the administrators give the interactive priority to the API keys
+of latency-sensitive clients, or the bulk priority to the API keys of batch workloads.
+
+Usage:
+    python set_api_key_priority.py 806c877c-d506-4e83-bc49-50d219a0a3d9 interactive
+"""
+from argparse import ArgumentParser
+from uuid import UUID
+
+from app.database import session_maker
+from app.migrations import run_migrations
+from app.settings import Priority
+from app.users.dal import UserDAL
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Set the scheduling priority of the model calls made with an API key.')
+    parser.add_argument('api_key_id', type=UUID, help='ID of the API key.')
+    parser.add_argument('priority', type=Priority, choices=list(Priority), help='New priority of the API key.')
+    arguments = parser.parse_args()
+
+    run_migrations()
+
+    session = session_maker()
+    try:
+        user_dal = UserDAL(session=session)
+
+        api_key = user_dal.get_api_key_by_id(id=arguments.api_key_id)
+        if api_key is None:
+            parser.exit(status=1, message=f'API key with id {arguments.api_key_id} not found.\n')
+
+        user_dal.update_api_key(api_key=api_key, priority=arguments.priority)
+        print(f'API key {arguments.api_key_id} has the {arguments.priority} priority.')
+
+    finally:
+        session_maker.remove()
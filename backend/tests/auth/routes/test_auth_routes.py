@@ -0,0 +1,22 @@
+"""
+Tests of the SQL statements sent by the auth routes.
+"""
+from typing import Any
+
+import pytest
+
+from tests.conftest import StatementCounter
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_login_does_not_load_the_api_keys(client: Any, database: StatementCounter, access_token: str) -> None:
+    response = await client.post('/user/api-key', headers={'Authorization': access_token}, json={'name': 'My API key'})
+    assert response.status_code == 200
+    database.reset()
+
+    response = await client.post('/auth/login', json={'email': 'user@example.com', 'password': 'Password1!'})
+
+    assert response.status_code == 200
+    assert database.count == 1
+    assert 'ApiKey' not in database.statements[0]
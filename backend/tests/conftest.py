@@ -0,0 +1,188 @@
+"""
+Test configuration. The required settings get test values, so the app can be imported without a .env file, and the
+route tests run on an in-memory SQLite database.
+"""
+from os import environ
+from typing import Any, AsyncIterator, Iterator
+
+from pytest import fixture
+
+TEST_SETTINGS = {
+    'APP_NAME': 'insight-lang',
+    'APP_VERSION': '0.0.0',
+    'BACKEND_PORT': '8000',
+    'AI_MODEL': 'gpt-4o',
+    'OPENAI_API_KEY': 'sk-test',
+    'SECRET_KEY': 'test-secret-key',
+    'ACCESS_TOKEN_EXPIRATION_DELTA': '30',
+    'HASHING_TIME_COST': '1',
+    'HASHING_MEMORY_COST': '1024',
+    'HASHING_PARALLELISM': '1',
+    'HASHING_HASH_LENGTH': '32',
+    'PASSWORD_MIN_UPPERCASE_LETTERS': '1',
+    'PASSWORD_MIN_LOWERCASE_LETTERS': '1',
+    'PASSWORD_MIN_DIGITS': '1',
+    'PASSWORD_MIN_SPECIAL_CHARACTERS': '1',
+    'PASSWORD_VALID_SPECIAL_CHARACTERS': '!@#',
+    'DB_USERNAME': 'test',
+    'DB_PASSWORD': 'test',
+    'DB_HOST': 'localhost',
+    'DB_PORT': '3306',
+    'DB_NAME': 'test',
+}
+
+for name, value in TEST_SETTINGS.items():
+    environ.setdefault(name, value)
+
+
+@fixture
+def anyio_backend() -> str:
+    """
+    Run the asynchronous tests on asyncio, as the app does.
+
+    Returns:
+        str: Name of the anyio backend.
+    """
+    return 'asyncio'
+
+
+class StatementCounter():
+    """
+    Records the SQL statements sent to the database.
+    """
+    statements: list[str]
+
+    def __init__(self) -> None:
+        """
+        Create a new empty StatementCounter instance.
+        """
+        self.statements = []
+
+    def __call__(self, connection: Any, cursor: Any, statement: str, *args: Any) -> None:
+        """
+        Record a statement, as a before_cursor_execute listener.
+
+        Args:
+            connection (Any): Database connection.
+            cursor (Any): Database cursor.
+            statement (str): SQL statement.
+            *args (Any): Parameters, context and executemany flag of the statement.
+        """
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of recorded statements.
+
+        Returns:
+            int: Number of recorded statements.
+        """
+        return len(self.statements)
+
+    def reset(self) -> None:
+        """
+        Forget the recorded statements.
+        """
+        self.statements.clear()
+
+
+@fixture(scope='session')
+def hashing_pool() -> Iterator[None]:
+    """
+    Stop the hashing process pool after the tests.
+    """
+    from app.utils.cryptography import hashing_executor
+
+    yield
+    hashing_executor.shutdown()
+
+
+@fixture
+async def database(hashing_pool: None) -> AsyncIterator[StatementCounter]:
+    """
+    Run the routes on a new in-memory SQLite database, counting the statements they send.
+
+    Yields:
+        StatementCounter: Statements sent to the database.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
+    from sqlalchemy.pool import StaticPool
+
+    from app.app import app
+    from app.database import Base, get_session
+    from app.utils.database import RoutingSession
+
+    engine = create_async_engine(url='sqlite+aiosqlite://', poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine,
+                                       sync_session_class=RoutingSession,
+                                       autoflush=False,
+                                       expire_on_commit=False)
+
+    async def get_test_session() -> AsyncIterator[AsyncSession]:
+        async with session_maker() as session:
+            try:
+                yield session
+                await session.commit()
+
+            except Exception:
+                await session.rollback()
+                raise
+
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, 'before_cursor_execute', counter)
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        yield counter
+
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        await engine.dispose()
+
+
+@fixture
+async def client(database: StatementCounter, monkeypatch: Any) -> AsyncIterator[Any]:
+    """
+    Get a client of the app, without running its lifespan. The login rate limits are disabled, as every test logs in
+    with the same email.
+
+    Yields:
+        AsyncClient: Client of the app.
+    """
+    from httpx import ASGITransport, AsyncClient
+
+    from app.app import app
+    from app.settings import settings
+
+    monkeypatch.setattr(settings, 'LOGIN_EMAIL_RATE_LIMIT', 0)
+    monkeypatch.setattr(settings, 'LOGIN_IP_RATE_LIMIT', 0)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+@fixture
+async def access_token(client: Any) -> str:
+    """
+    Create a user and log it in.
+
+    Returns:
+        str: Authorization header of the user.
+    """
+    password = 'Password1!'
+    response = await client.post('/user',
+                                 json={
+                                     'email': 'user@example.com',
+                                     'password': password,
+                                     'password_verification': password
+                                 })
+    assert response.status_code == 200, response.text
+
+    response = await client.post('/auth/login', json={'email': 'user@example.com', 'password': password})
+    assert response.status_code == 200, response.text
+
+    return f'Bearer {response.json()["access_token"]}'
@@ -0,0 +1,420 @@
+"""
+Tests of the background runner of the translation jobs, with the translation jobs stored in memory.
+"""
+import sys
+from asyncio import create_task, Event, sleep, timeout
+from datetime import datetime, timezone
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
+from uuid import UUID, uuid4
+
+import pytest
+from httpx import URL
+
+from app.settings import settings
+from app.translate.functions import split_text, TranslationJobRunner
+from app.translate.models import TranslationJobStatus
+from app.utils.exceptions import ModelUnavailableException, ServiceUnavailableException
+
+pytestmark = pytest.mark.anyio
+
+runner_module = sys.modules['app.translate.functions.translation_job_runner']
+
+
+class InMemoryJobs():
+    """
+    Translation jobs and chunks stored in memory, with the semantics of the TranslationJobDAL queries.
+    """
+    jobs: dict[UUID, dict[str, Any]]
+    chunks: dict[UUID, dict[int, list[str | None]]]
+
+    def __init__(self) -> None:
+        """
+        Create a new empty InMemoryJobs instance.
+        """
+        self.jobs = {}
+        self.chunks = {}
+
+    def add_job(self, text: str, callback_url: str | None = None, **columns: Any) -> UUID:
+        """
+        Add a queued translation job.
+
+        Args:
+            text (str): Text to translate.
+            callback_url (str | None, optional): Callback URL of the job. Defaults to None.
+            **columns (Any): Columns that override the ones of a new job.
+
+        Returns:
+            UUID: ID of the job.
+        """
+        job_id = uuid4()
+        chunks = split_text(text=text, chunk_size=20)
+        now = datetime.now(tz=timezone.utc)
+        self.jobs[job_id] = {
+            'id': job_id,
+            'user_id': uuid4(),
+            'api_key_id': None,
+            'language': 'es-ES',
+            'status': TranslationJobStatus.QUEUED,
+            'callback_url': callback_url,
+            'total_chunks': len(chunks),
+            'completed_chunks': 0,
+            'error': None,
+            'pending': True,
+            'attempts': 0,
+            'lease_expiration': None,
+            'creation_date': now,
+            'update_date': now,
+            'completion_date': None,
+        } | columns
+        self.chunks[job_id] = {position: [chunk, separator, None] for position, (chunk, separator) in enumerate(chunks)}
+        return job_id
+
+    def translated_text(self, job_id: UUID) -> str:
+        """
+        Get the translated text of a job.
+
+        Args:
+            job_id (UUID): ID of the job.
+
+        Returns:
+            str: Translated chunks and their separators.
+        """
+        return ''.join(translated_text + separator
+                       for _, separator, translated_text in self.chunks[job_id].values()
+                       if translated_text is not None)
+
+
+class StoredJob():
+    """
+    Translation job read from the store, iterable as a TranslationJob.
+    """
+    status: TranslationJobStatus
+    __job: dict[str, Any]
+
+    def __init__(self, job: dict[str, Any]) -> None:
+        self.status = job['status']
+        self.__job = dict(job)
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for name in ('id', 'status', 'language', 'total_chunks', 'completed_chunks', 'error', 'creation_date',
+                     'update_date', 'completion_date'):
+            yield name, self.__job[name]
+
+        yield 'progress', self.__job['completed_chunks'] / self.__job['total_chunks']
+
+
+class InMemoryTranslationJobDAL():
+    """
+    TranslationJobDAL backed by an InMemoryJobs instance.
+    """
+    store: InMemoryJobs
+
+    def __init__(self, session: Any) -> None:
+        self.jobs = self.store.jobs
+        self.chunks = self.store.chunks
+
+    async def claim_job(self, lease: float) -> SimpleNamespace | None:
+        for job in sorted(self.jobs.values(), key=lambda job: job['creation_date']):
+            if job['pending'] and (job['lease_expiration'] is None or job['lease_expiration'] < monotonic()):
+                job.update(lease_expiration=monotonic() + lease, attempts=job['attempts'] + 1)
+                return SimpleNamespace(**job)
+
+        return None
+
+    async def get_pending_chunks(self, job_id: UUID) -> list[tuple[int, str]]:
+        return [(position, text) for position, (text, _, translated_text) in self.chunks[job_id].items()
+                if translated_text is None]
+
+    async def renew_lease(self, job_id: UUID, lease: float) -> None:
+        self.jobs[job_id]['lease_expiration'] = monotonic() + lease
+
+    async def start_job(self, job_id: UUID) -> None:
+        if self.jobs[job_id]['status'] == TranslationJobStatus.QUEUED:
+            self.jobs[job_id]['status'] = TranslationJobStatus.RUNNING
+
+    async def complete_chunk(self, job_id: UUID, position: int, translated_text: str, lease: float) -> None:
+        chunk, job = self.chunks[job_id][position], self.jobs[job_id]
+        job['completed_chunks'] += chunk[2] is None
+        chunk[2] = translated_text
+        job.update(attempts=0, error=None, lease_expiration=monotonic() + lease)
+
+    async def finish_job(self, job_id: UUID, status: TranslationJobStatus, error: str | None = None) -> None:
+        job = self.jobs[job_id]
+        job.update(status=status,
+                   error=error or job['error'],
+                   pending=job['callback_url'] is not None,
+                   attempts=0,
+                   lease_expiration=None,
+                   completion_date=datetime.now(tz=timezone.utc))
+
+    async def finish_callback(self, job_id: UUID) -> None:
+        self.jobs[job_id].update(pending=False, lease_expiration=None)
+
+    async def release_job(self, job_id: UUID, delay: float, error: str | None = None) -> None:
+        job = self.jobs[job_id]
+        job.update(lease_expiration=monotonic() + delay, error=error or job['error'])
+
+    async def release_jobs(self, job_ids: list[UUID]) -> None:
+        for job_id in job_ids:
+            job = self.jobs[job_id]
+            job.update(lease_expiration=None, attempts=max(job['attempts'] - 1, 0))
+
+    async def get_job_by_id(self, id: UUID) -> 'StoredJob':
+        return StoredJob(job=self.jobs[id])
+
+    async def get_translated_text(self, job_id: UUID) -> str:
+        return self.store.translated_text(job_id=job_id)
+
+
+class Session():
+    """
+    Session and transaction that do nothing, the jobs are stored in memory.
+    """
+
+    async def __aenter__(self) -> 'Session':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def begin(self) -> 'Session':
+        return self
+
+
+class CallbackClient():
+    """
+    Callback client that fails its first failures posts and records the delivered callbacks.
+    """
+    failures: int
+    delivered: list[tuple[str, str]]
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.delivered = []
+
+    async def post(self, url: URL, content: str, headers: dict[str, str],
+                   extensions: dict[str, str]) -> SimpleNamespace:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError('The callback URL is down.')
+
+        # The request is sent to the resolved address, with the callback host in the Host header and the TLS SNI
+        self.delivered.append((str(url.copy_with(host=headers['Host'])), content))
+        assert extensions['sni_hostname'] == headers['Host']
+        return SimpleNamespace(raise_for_status=lambda: None)
+
+    async def aclose(self) -> None:
+        pass
+
+
+async def resolve_public_address(host: str, port: int) -> str:
+    """
+    Resolve every callback host to the same public address, without DNS.
+
+    Args:
+        host (str): Callback host.
+        port (int): Callback port.
+
+    Returns:
+        str: Public address.
+    """
+    return '93.184.216.34'
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> InMemoryJobs:
+    """
+    Store the translation jobs in memory and shorten the poll interval of the runner.
+
+    Returns:
+        InMemoryJobs: Translation jobs of the runner.
+    """
+    store = InMemoryJobs()
+    monkeypatch.setattr(InMemoryTranslationJobDAL, 'store', store, raising=False)
+    monkeypatch.setattr('app.translate.dal.TranslationJobDAL', InMemoryTranslationJobDAL)
+    monkeypatch.setattr(runner_module, 'async_session_maker', Session)
+    monkeypatch.setattr(runner_module, 'resolve_public_address', resolve_public_address)
+    monkeypatch.setattr(settings, 'TRANSLATION_JOB_POLL_INTERVAL', 0.01)
+    return store
+
+
+@pytest.fixture
+def translations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Translate the chunks to upper case.
+
+    Returns:
+        list[str]: Translated chunks, in the order they were translated.
+    """
+    translated: list[str] = []
+
+    async def translate_text(text: str, language: str) -> str:
+        translated.append(text)
+        return text.upper()
+
+    monkeypatch.setattr(runner_module, 'translate_text', translate_text)
+    return translated
+
+
+def build_runner(client: CallbackClient | None = None) -> TranslationJobRunner:
+    """
+    Build a runner with a fake callback client.
+
+    Args:
+        client (CallbackClient | None, optional): Callback client. Defaults to a client that never fails.
+
+    Returns:
+        TranslationJobRunner: Translation job runner.
+    """
+    runner = TranslationJobRunner(workers=2)
+    runner._TranslationJobRunner__client = client or CallbackClient()
+    return runner
+
+
+async def run_until(runner: TranslationJobRunner, condition: Callable[[], bool]) -> None:
+    """
+    Run the runner until the condition holds, and close it.
+
+    Args:
+        runner (TranslationJobRunner): Translation job runner.
+        condition (Callable[[], bool]): Condition to wait for.
+    """
+    task = create_task(runner.run())
+    try:
+        async with timeout(delay=5):
+            while not condition():
+                await sleep(0.01)
+
+    finally:
+        task.cancel()
+        await runner.close()
+
+
+async def test_run_translates_the_job_and_delivers_its_callback(store: InMemoryJobs, translations: list[str]) -> None:
+    job_id = store.add_job(text='Hello world.\n\nThis is a translation job.', callback_url='https://example.com/jobs')
+    client = CallbackClient()
+
+    await run_until(build_runner(client=client), lambda: not store.jobs[job_id]['pending'])
+
+    job = store.jobs[job_id]
+    assert job['status'] == TranslationJobStatus.COMPLETED
+    assert job['completed_chunks'] == job['total_chunks']
+    assert store.translated_text(job_id=job_id) == 'HELLO WORLD.\n\nTHIS IS A TRANSLATION JOB.'
+    assert [url for url, _ in client.delivered] == ['https://example.com/jobs']
+    assert '"status":"completed"' in client.delivered[0][1]
+
+
+async def test_run_releases_a_failed_attempt_and_claims_the_job_again(store: InMemoryJobs,
+                                                                      monkeypatch: pytest.MonkeyPatch) -> None:
+    job_id = store.add_job(text='Hello world.')
+    attempts: list[int] = []
+
+    async def translate_text(text: str, language: str) -> str:
+        attempts.append(store.jobs[job_id]['attempts'])
+        if len(attempts) == 1:
+            raise ModelUnavailableException()
+
+        return text.upper()
+
+    monkeypatch.setattr(runner_module, 'translate_text', translate_text)
+
+    await run_until(build_runner(), lambda: not store.jobs[job_id]['pending'])
+
+    assert attempts == [1, 2]
+    assert store.jobs[job_id]['status'] == TranslationJobStatus.COMPLETED
+    assert store.translated_text(job_id=job_id) == 'HELLO WORLD.'
+
+
+async def test_run_waits_while_the_model_is_busy_without_losing_the_attempt(store: InMemoryJobs,
+                                                                           monkeypatch: pytest.MonkeyPatch) -> None:
+    job_id = store.add_job(text='Hello world.')
+    calls: list[str] = []
+
+    async def translate_text(text: str, language: str) -> str:
+        calls.append(text)
+        if len(calls) < 3:
+            raise ServiceUnavailableException(retry_after=0.01)
+
+        return text.upper()
+
+    monkeypatch.setattr(runner_module, 'translate_text', translate_text)
+
+    await run_until(build_runner(), lambda: not store.jobs[job_id]['pending'])
+
+    assert len(calls) == 3
+    assert store.jobs[job_id]['status'] == TranslationJobStatus.COMPLETED
+
+
+async def test_run_fails_the_job_after_too_many_attempts(store: InMemoryJobs, monkeypatch: pytest.MonkeyPatch) -> None:
+    job_id = store.add_job(text='Hello world.', attempts=settings.TRANSLATION_JOB_MAX_ATTEMPTS, error='Model error.')
+
+    async def translate_text(text: str, language: str) -> str:
+        raise AssertionError('A failed job is not translated again.')
+
+    monkeypatch.setattr(runner_module, 'translate_text', translate_text)
+
+    await run_until(build_runner(), lambda: not store.jobs[job_id]['pending'])
+
+    assert store.jobs[job_id]['status'] == TranslationJobStatus.FAILED
+    assert store.jobs[job_id]['error'] == 'Model error.'
+
+
+async def test_run_resumes_a_job_from_its_last_translated_chunk(store: InMemoryJobs, translations: list[str]) -> None:
+    job_id = store.add_job(text='First chunk. Second chunk. Third chunk.',
+                           status=TranslationJobStatus.RUNNING,
+                           attempts=1,
+                           lease_expiration=monotonic() - 1)
+    chunks = store.chunks[job_id]
+    chunks[0][2] = chunks[0][0].upper()
+    store.jobs[job_id]['completed_chunks'] = 1
+
+    await run_until(build_runner(), lambda: not store.jobs[job_id]['pending'])
+
+    assert translations == [text for text, _, _ in list(chunks.values())[1:]]
+    assert store.jobs[job_id]['completed_chunks'] == store.jobs[job_id]['total_chunks']
+    assert store.translated_text(job_id=job_id) == 'FIRST CHUNK. SECOND CHUNK. THIRD CHUNK.'
+
+
+async def test_run_does_not_claim_a_job_leased_by_another_worker(store: InMemoryJobs, translations: list[str]) -> None:
+    leased_id = store.add_job(text='Leased job.', lease_expiration=monotonic() + 60)
+    job_id = store.add_job(text='Free job.')
+
+    await run_until(build_runner(), lambda: not store.jobs[job_id]['pending'])
+
+    assert store.jobs[leased_id]['pending']
+    assert translations == ['Free job.']
+
+
+async def test_close_releases_the_claimed_jobs(store: InMemoryJobs, monkeypatch: pytest.MonkeyPatch) -> None:
+    job_id = store.add_job(text='First chunk. Second chunk.')
+    translating = Event()
+
+    async def translate_text(text: str, language: str) -> str:
+        if store.jobs[job_id]['completed_chunks'] > 0:
+            translating.set()
+            await sleep(60)
+
+        return text.upper()
+
+    monkeypatch.setattr(runner_module, 'translate_text', translate_text)
+
+    await run_until(build_runner(), translating.is_set)
+
+    job = store.jobs[job_id]
+    assert job['lease_expiration'] is None
+    assert job['attempts'] == 0
+    assert job['status'] == TranslationJobStatus.RUNNING
+    assert job['completed_chunks'] == 1
+
+
+async def test_run_retries_a_failed_callback_without_translating_again(store: InMemoryJobs,
+                                                                       translations: list[str]) -> None:
+    job_id = store.add_job(text='Hello world.', callback_url='https://example.com/jobs')
+    client = CallbackClient(failures=1)
+
+    await run_until(build_runner(client=client), lambda: not store.jobs[job_id]['pending'])
+
+    assert translations == ['Hello world.']
+    assert len(client.delivered) == 1
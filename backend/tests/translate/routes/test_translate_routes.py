@@ -0,0 +1,119 @@
+"""
+Tests of the SQL statements sent by the translate routes, which authenticate with an API key.
+"""
+import sys
+from typing import Any
+
+import pytest
+
+from app.settings import settings
+from app.utils.cryptography import check_token
+from app.utils.database import current_reader, primary_stickiness
+from tests.conftest import StatementCounter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def api_key(client: Any, access_token: str, monkeypatch: pytest.MonkeyPatch) -> str:
+    """
+    Create an API key and replace the model with one that returns the text as it is.
+
+    Returns:
+        str: Secret key of the API key.
+    """
+
+    async def translate_text(text: str, language: str) -> str:
+        return text
+
+    monkeypatch.setattr(sys.modules['app.translate.routes.translate_routes'], 'translate_text', translate_text)
+
+    response = await client.post('/user/api-key', headers={'Authorization': access_token}, json={'name': 'My API key'})
+    assert response.status_code == 200
+    return response.json()['secret_key']
+
+
+async def test_translate_loads_the_api_key_and_its_owner_in_one_query(client: Any, database: StatementCounter,
+                                                                      api_key: str) -> None:
+    database.reset()
+
+    response = await client.post('/translate', headers={'X-API-Key': api_key}, json={'text': 'Hola', 'language': 'en'})
+
+    assert response.status_code == 200
+    # The API key with its owner, and the update of its last utilization date
+    assert database.count == 2
+    assert database.statements[0].count('JOIN') == 1
+
+
+async def test_create_translation_job(client: Any, database: StatementCounter, api_key: str) -> None:
+    database.reset()
+
+    response = await client.post('/translate/jobs',
+                                 headers={'X-API-Key': api_key},
+                                 json={
+                                     'text': 'Hola mundo. ' * 1000,
+                                     'language': 'en'
+                                 })
+
+    assert response.status_code == 202
+    # The API key, its last utilization date, the pending jobs count, the job and a single insert of the chunks
+    assert database.count == 5
+
+
+@pytest.mark.parametrize('callback_url', ['http://localhost:8000/jobs', 'http://169.254.169.254/latest/meta-data'])
+async def test_create_translation_job_rejects_a_local_callback_url(client: Any, api_key: str,
+                                                                   callback_url: str) -> None:
+    response = await client.post('/translate/jobs',
+                                 headers={'X-API-Key': api_key},
+                                 json={
+                                     'text': 'Hola mundo.',
+                                     'language': 'en',
+                                     'callback_url': callback_url
+                                 })
+
+    assert response.status_code == 422
+
+
+async def test_get_translation_job(client: Any, database: StatementCounter, api_key: str) -> None:
+    response = await client.post('/translate/jobs',
+                                 headers={'X-API-Key': api_key},
+                                 json={
+                                     'text': 'Hola',
+                                     'language': 'en'
+                                 })
+    database.reset()
+
+    response = await client.get(f'/translate/jobs/{response.json()["id"]}', headers={'X-API-Key': api_key})
+
+    assert response.status_code == 200
+    assert database.count == 3
+
+
+async def test_get_translation_job_reads_from_the_primary_after_the_owner_writes(
+        client: Any, access_token: str, api_key: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    response = await client.post('/translate/jobs',
+                                 headers={'X-API-Key': api_key},
+                                 json={
+                                     'text': 'Hola',
+                                     'language': 'en'
+                                 })
+    readers: list[str] = []
+
+    async def is_sticky(key: str) -> bool:
+        readers.append(key)
+        return True
+
+    monkeypatch.setattr(settings, 'DB_REPLICA_HOSTS', 'replica:3306')
+    monkeypatch.setattr(primary_stickiness, 'is_sticky', is_sticky)
+
+    # The test client runs the requests in the test context, where the login already set the reader
+    token = current_reader.set(None)
+    try:
+        response = await client.get(f'/translate/jobs/{response.json()["id"]}', headers={'X-API-Key': api_key})
+
+    finally:
+        current_reader.reset(token)
+
+    assert response.status_code == 200
+    # The reads of the API key routes are checked against the writes of the API key owner
+    assert readers and set(readers) == {str(check_token(token=access_token.removeprefix('Bearer ')).sub)}
@@ -0,0 +1,136 @@
+"""
+Tests of the bulk provisioning of users.
+"""
+from json import dumps
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.users.functions.user_provisioning import ProvisioningReport, provision_users, validate_user_records
+
+
+class InMemoryUserDAL():
+    """
+    User DAL that stores the users in memory and compares the emails ignoring the case, as the email column does.
+    """
+    emails: list[str] = []
+
+    def __init__(self, session: Any) -> None:
+        """
+        Create a new InMemoryUserDAL instance.
+
+        Args:
+            session (Any): Database session, not used.
+        """
+
+    def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """
+        Get which of the emails already belong to a user, ignoring the case.
+
+        Args:
+            emails (list[str]): Emails to check.
+
+        Returns:
+            set[str]: Stored emails that match one of the emails.
+        """
+        return {email for email in self.emails if email.lower() in {email.lower() for email in emails}}
+
+    def create_users(self, users: list[dict[str, Any]]) -> None:
+        """
+        Store the users, failing on an email that already exists in any case, as the unique index does.
+
+        Args:
+            users (list[dict[str, Any]]): Users to store.
+
+        Raises:
+            ValueError: If an email already exists.
+        """
+        for user in users:
+            if user['email'].lower() in {email.lower() for email in self.emails}:
+                raise ValueError(f'Duplicate entry {user["email"]}.')
+
+            self.emails.append(user['email'])
+
+
+class Session():
+    """
+    Session that does not store anything, as the DAL stores the users.
+    """
+
+    def commit(self) -> None:
+        """
+        Commit nothing.
+        """
+
+    def rollback(self) -> None:
+        """
+        Rollback nothing.
+        """
+
+    def remove(self) -> None:
+        """
+        Remove nothing.
+        """
+
+    def __call__(self) -> 'Session':
+        """
+        Return the session, as the session maker does.
+
+        Returns:
+            Session: The session.
+        """
+        return self
+
+
+@pytest.fixture
+def users(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Provision the users into an in-memory DAL.
+
+    Returns:
+        list[str]: Stored emails.
+    """
+    emails = ['existing@example.com']
+    monkeypatch.setattr(InMemoryUserDAL, 'emails', emails)
+    monkeypatch.setattr('app.users.functions.user_provisioning.UserDAL', InMemoryUserDAL)
+    monkeypatch.setattr('app.users.functions.user_provisioning.session_maker', Session())
+    return emails
+
+
+def record(email: str) -> dict[str, Any]:
+    """
+    Build a valid user record.
+
+    Args:
+        email (str): Email of the user.
+
+    Returns:
+        dict[str, Any]: User record.
+    """
+    return {'email': email, 'password': 'Password1!'}
+
+
+def test_validate_user_records_counts_case_variants_as_duplicated() -> None:
+    report = ProvisioningReport()
+
+    users = validate_user_records(records=[record('User@Example.com'), record(' user@example.com '), None],
+                                  first_record=1,
+                                  report=report)
+
+    assert list(users) == ['user@example.com']
+    assert (report.duplicated, report.invalid) == (1, 1)
+
+
+def test_provision_users_skips_case_variants_of_existing_emails(tmp_path: Path, users: list[str]) -> None:
+    path = tmp_path / 'users.jsonl'
+    path.write_text('\n'.join(
+        dumps(user) for user in [record('EXISTING@example.com'),
+                                 record('New@Example.com'),
+                                 record('new@example.com')]),
+                    encoding='utf-8')
+
+    report = provision_users(path=path, checkpoint=tmp_path / 'users.checkpoint', batch_size=2, workers=1)
+
+    assert users == ['existing@example.com', 'new@example.com']
+    assert report == ProvisioningReport(processed=3, created=1, duplicated=2, invalid=0)
@@ -0,0 +1,195 @@
+"""
+Tests of the user routes and of the SQL statements they send. Each route loads the logged user without its API keys,
+and only queries the API keys it needs.
+"""
+import sys
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from tests.conftest import StatementCounter
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_api_key(client: Any, access_token: str, name: str = 'My API key') -> dict[str, Any]:
+    """
+    Create an API key of the logged user.
+
+    Args:
+        client (AsyncClient): Client of the app.
+        access_token (str): Authorization header of the user.
+        name (str, optional): Name of the API key. Defaults to 'My API key'.
+
+    Returns:
+        dict[str, Any]: Created API key.
+    """
+    response = await client.post('/user/api-key', headers={'Authorization': access_token}, json={'name': name})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_get_user_does_not_load_the_api_keys(client: Any, database: StatementCounter,
+                                                   access_token: str) -> None:
+    await create_api_key(client=client, access_token=access_token)
+    database.reset()
+
+    response = await client.get('/user', headers={'Authorization': access_token})
+
+    assert response.status_code == 200
+    assert database.count == 1
+    assert 'ApiKey' not in database.statements[0]
+
+
+async def test_update_user(client: Any, database: StatementCounter, access_token: str) -> None:
+    database.reset()
+
+    response = await client.put('/user', headers={'Authorization': access_token}, json={'email': 'new@example.com'})
+
+    assert response.status_code == 200
+    # The logged user, the check of the new email and the update
+    assert database.count == 3
+
+
+async def test_delete_user_does_not_load_the_api_keys(client: Any, database: StatementCounter,
+                                                      access_token: str) -> None:
+    for index in range(3):
+        await create_api_key(client=client, access_token=access_token, name=f'API key {index}')
+    database.reset()
+
+    response = await client.delete('/user', headers={'Authorization': access_token})
+
+    assert response.status_code == 200
+    # The API keys are deleted by the database cascade
+    assert database.count == 2
+    assert all('ApiKey' not in statement for statement in database.statements)
+
+
+async def test_create_api_key(client: Any, database: StatementCounter, access_token: str) -> None:
+    database.reset()
+
+    api_key = await create_api_key(client=client, access_token=access_token)
+
+    assert api_key['priority'] == 'standard'
+    assert database.count == 2
+
+
+async def test_create_api_keys_uses_a_single_insert(client: Any, database: StatementCounter,
+                                                    access_token: str) -> None:
+    database.reset()
+
+    response = await client.post('/user/api-keys',
+                                 headers={'Authorization': access_token},
+                                 json={'api_keys': [{
+                                     'name': f'API key {index}'
+                                 } for index in range(5)]})
+
+    assert response.status_code == 200
+    assert database.count == 2
+
+
+async def test_get_api_keys(client: Any, database: StatementCounter, access_token: str) -> None:
+    for index in range(3):
+        await create_api_key(client=client, access_token=access_token, name=f'API key {index}')
+    database.reset()
+
+    response = await client.get('/user/api-keys', headers={'Authorization': access_token})
+
+    assert response.status_code == 200
+    assert len(response.json()['items']) == 3
+    assert database.count == 2
+
+
+async def test_get_api_key(client: Any, database: StatementCounter, access_token: str) -> None:
+    api_key = await create_api_key(client=client, access_token=access_token)
+    database.reset()
+
+    response = await client.get(f'/user/api-key/{api_key["id"]}', headers={'Authorization': access_token})
+
+    assert response.status_code == 200
+    assert database.count == 2
+
+
+async def test_get_api_key_usage(client: Any, database: StatementCounter, access_token: str) -> None:
+    api_key = await create_api_key(client=client, access_token=access_token)
+    database.reset()
+
+    response = await client.get(f'/user/api-key/{api_key["id"]}/usage', headers={'Authorization': access_token})
+
+    assert response.status_code == 200
+    assert database.count == 3
+
+
+async def test_get_api_key_usage_converts_the_period_to_utc(client: Any, access_token: str,
+                                                            monkeypatch: pytest.MonkeyPatch) -> None:
+    api_key = await create_api_key(client=client, access_token=access_token)
+    periods = []
+
+    async def get_api_key_usage(self: Any, api_key_id: Any, start: datetime, end: datetime) -> list:
+        periods.append((start, end))
+        return []
+
+    monkeypatch.setattr(sys.modules['app.users.routes.user_routes'].UsageDAL, 'get_api_key_usage', get_api_key_usage)
+
+    response = await client.get(f'/user/api-key/{api_key["id"]}/usage',
+                                headers={'Authorization': access_token},
+                                params={
+                                    'start': '2026-10-19T13:00:00+02:00',
+                                    'end': '2026-10-19T15:00:00'
+                                })
+
+    assert response.status_code == 200
+    assert periods == [(datetime(2026, 10, 19, 11), datetime(2026, 10, 19, 15))]
+
+
+async def test_update_api_key(client: Any, database: StatementCounter, access_token: str) -> None:
+    api_key = await create_api_key(client=client, access_token=access_token)
+    database.reset()
+
+    response = await client.put(f'/user/api-key/{api_key["id"]}',
+                                headers={'Authorization': access_token},
+                                json={'name': 'Renamed API key'})
+
+    assert response.status_code == 200
+    assert database.count == 3
+
+
+async def test_api_key_owner_cannot_set_the_priority(client: Any, access_token: str) -> None:
+    api_key = await create_api_key(client=client, access_token=access_token)
+
+    create_response = await client.post('/user/api-key',
+                                        headers={'Authorization': access_token},
+                                        json={
+                                            'name': 'Interactive API key',
+                                            'priority': 'interactive'
+                                        })
+    update_response = await client.put(f'/user/api-key/{api_key["id"]}',
+                                       headers={'Authorization': access_token},
+                                       json={'priority': 'interactive'})
+
+    assert (create_response.status_code, update_response.status_code) == (422, 422)
+
+
+async def test_delete_api_key(client: Any, database: StatementCounter, access_token: str) -> None:
+    api_key = await create_api_key(client=client, access_token=access_token)
+    database.reset()
+
+    response = await client.delete(f'/user/api-key/{api_key["id"]}', headers={'Authorization': access_token})
+
+    assert response.status_code == 200
+    assert database.count == 3
+
+
+async def test_delete_api_keys_uses_a_single_delete(client: Any, database: StatementCounter,
+                                                    access_token: str) -> None:
+    api_keys = [await create_api_key(client=client, access_token=access_token, name=f'API key {index}')
+                for index in range(3)]
+    database.reset()
+
+    response = await client.post('/user/api-keys/delete',
+                                 headers={'Authorization': access_token},
+                                 json={'ids': [api_key['id'] for api_key in api_keys]})
+
+    assert response.status_code == 200
+    assert database.count == 3
@@ -0,0 +1,94 @@
+"""
+Tests of the lookup of the API keys hashed with argon2 before the HMAC-SHA256 hashing.
+"""
+import sys
+from typing import Any, AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.settings import settings
+from app.users.models import ApiKey, User
+from app.utils.cryptography import LegacyApiKeyLookup, legacy_api_key_lookup
+from tests.conftest import StatementCounter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def session_maker(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[async_sessionmaker]:
+    """
+    Run the lookup check on a new in-memory SQLite database.
+
+    Yields:
+        async_sessionmaker: Session maker of the database.
+    """
+    engine = create_async_engine(url='sqlite+aiosqlite://')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    monkeypatch.setattr(sys.modules['app.utils.cryptography.api_key.legacy_api_key_lookup'], 'async_session_maker',
+                        session_maker)
+    yield session_maker
+    await engine.dispose()
+
+
+async def add_api_key(session_maker: async_sessionmaker, hashed_secret_key: str) -> None:
+    """
+    Store an API key with the given hash.
+
+    Args:
+        session_maker (async_sessionmaker): Session maker of the database.
+        hashed_secret_key (str): Stored hash of the API key.
+    """
+    async with session_maker() as session, session.begin():
+        user = User(email='user@example.com', hashed_password='hashed-password')
+        session.add(ApiKey(user=user, name='My API key', secret_key='0' * 64, hashed_secret_key=hashed_secret_key))
+
+
+async def test_check_disables_the_lookup_without_argon2_hashed_api_keys(session_maker: async_sessionmaker) -> None:
+    await add_api_key(session_maker=session_maker, hashed_secret_key='a' * 64)
+    lookup = LegacyApiKeyLookup()
+
+    await lookup.check()
+
+    assert not lookup.enabled
+
+
+async def test_check_enables_the_lookup_with_argon2_hashed_api_keys(session_maker: async_sessionmaker) -> None:
+    await add_api_key(session_maker=session_maker, hashed_secret_key='$argon2id$v=19$m=1024,t=1,p=1$c2FsdA$aGFzaA')
+    lookup = LegacyApiKeyLookup()
+
+    await lookup.check()
+
+    assert lookup.enabled
+
+
+async def test_check_keeps_the_lookup_disabled_by_the_setting(session_maker: async_sessionmaker,
+                                                              monkeypatch: pytest.MonkeyPatch) -> None:
+    await add_api_key(session_maker=session_maker, hashed_secret_key='$argon2id$v=19$m=1024,t=1,p=1$c2FsdA$aGFzaA')
+    monkeypatch.setattr(settings, 'API_KEY_LEGACY_HASHING', False)
+    lookup = LegacyApiKeyLookup()
+
+    await lookup.check()
+
+    assert not lookup.enabled
+
+
+async def test_unknown_api_key_is_not_hashed_with_argon2_without_legacy_api_keys(
+        client: Any, database: StatementCounter, monkeypatch: pytest.MonkeyPatch) -> None:
+
+    async def legacy_api_key_hashing_async(api_key: str) -> str:
+        raise AssertionError('The unknown API key was hashed with argon2.')
+
+    monkeypatch.setattr(legacy_api_key_lookup, '_LegacyApiKeyLookup__enabled', False)
+    monkeypatch.setattr(sys.modules['app.utils.cryptography.api_key.api_key_checking'],
+                        'legacy_api_key_hashing_async', legacy_api_key_hashing_async)
+    database.reset()
+
+    response = await client.post('/translate', headers={'X-API-Key': 'f' * 64}, json={'text': 'Hola', 'language': 'en'})
+
+    assert response.status_code == 401
+    assert database.count == 1
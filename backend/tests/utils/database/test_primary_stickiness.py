@@ -0,0 +1,92 @@
+"""
+Tests of the registry of the users whose reads go to the primary database after a write.
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import Base
+from app.settings import settings
+from app.users.dal import AsyncUserDAL
+from app.utils.database import (current_reader, InMemoryPrimaryStickinessStore, primary_stickiness,
+                                PrimaryStickiness, read_only, reading_from_replica)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def stickiness(monkeypatch: pytest.MonkeyPatch) -> PrimaryStickiness:
+    """
+    Configure a replica and give the shared registry an empty store.
+
+    Returns:
+        PrimaryStickiness: Shared registry.
+    """
+    monkeypatch.setattr(settings, 'DB_REPLICA_HOSTS', 'replica:3306')
+    monkeypatch.setattr(primary_stickiness, '_PrimaryStickiness__store', InMemoryPrimaryStickinessStore())
+    return primary_stickiness
+
+
+async def test_in_memory_store_expires_the_keys() -> None:
+    store = InMemoryPrimaryStickinessStore()
+
+    await store.mark(key='sticky', ttl=60)
+    await store.mark(key='expired', ttl=0)
+
+    assert await store.is_marked(key='sticky')
+    assert not await store.is_marked(key='expired')
+    assert not await store.is_marked(key='unknown')
+
+
+async def test_in_memory_store_removes_the_least_recently_marked_keys() -> None:
+    store = InMemoryPrimaryStickinessStore(max_keys=2)
+
+    for key in ('first', 'second', 'third'):
+        await store.mark(key=key, ttl=60)
+
+    assert not await store.is_marked(key='first')
+    assert await store.is_marked(key='second')
+    assert await store.is_marked(key='third')
+
+
+async def test_record_write_is_skipped_without_replicas(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = InMemoryPrimaryStickinessStore()
+    monkeypatch.setattr(settings, 'DB_REPLICA_HOSTS', None)
+
+    await PrimaryStickiness(store=store, ttl=60).record_write(key='user')
+
+    assert not await store.is_marked(key='user')
+
+
+async def test_read_only_sticks_to_the_primary_after_a_write(stickiness: PrimaryStickiness) -> None:
+
+    @read_only
+    async def read() -> bool:
+        return reading_from_replica.get()
+
+    token = current_reader.set('user')
+    try:
+        assert await read()
+
+        await stickiness.record_write(key='user')
+
+        assert not await read()
+
+    finally:
+        current_reader.reset(token)
+
+
+async def test_create_user_records_the_write(stickiness: PrimaryStickiness) -> None:
+    engine = create_async_engine(url='sqlite+aiosqlite://')
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(bind=engine) as session, session.begin():
+            user = await AsyncUserDAL(session=session).create_user(email='user@example.com',
+                                                                   hashed_password='hashed-password')
+            user_id = str(user.id)
+
+        assert await stickiness.is_sticky(key=user_id)
+
+    finally:
+        await engine.dispose()
@@ -0,0 +1,147 @@
+"""
+Tests of the idempotency middleware.
+"""
+from asyncio import create_task, Event, sleep
+from typing import AsyncIterator
+
+import pytest
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.settings import settings
+from app.utils.idempotency import IdempotencyMiddleware, InMemoryIdempotencyStore
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingApp():
+    """
+    ASGI app that counts its calls, answers with the status codes it is given and can be paused.
+    """
+    calls: int
+    status_codes: list[int]
+    resume: Event
+
+    def __init__(self) -> None:
+        """
+        Create a new CountingApp instance, answering 200 without pausing.
+        """
+        self.calls = 0
+        self.status_codes = []
+        self.resume = Event()
+        self.resume.set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Answer the request with its call number.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        self.calls += 1
+        call = self.calls
+        await receive()
+        await self.resume.wait()
+
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        await JSONResponse(status_code=status_code, content={'call': call})(scope, receive, send)
+
+
+@pytest.fixture
+def app() -> CountingApp:
+    """
+    Create the wrapped app.
+
+    Returns:
+        CountingApp: Wrapped app.
+    """
+    return CountingApp()
+
+
+@pytest.fixture
+async def client(app: CountingApp) -> AsyncIterator[AsyncClient]:
+    """
+    Create a client of the app behind the idempotency middleware, with an in-memory store.
+
+    Yields:
+        AsyncClient: Client of the app.
+    """
+    middleware = IdempotencyMiddleware(app=app, store=InMemoryIdempotencyStore(), path_prefixes=('/translate',))
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url='http://test') as client:
+        yield client
+
+
+async def translate(client: AsyncClient, text: str = 'Hello', idempotency_key: str = 'key') -> tuple[int, dict, bool]:
+    """
+    Send a translation request with an idempotency key.
+
+    Args:
+        client (AsyncClient): Client of the app.
+        text (str, optional): Text of the request. Defaults to 'Hello'.
+        idempotency_key (str, optional): Idempotency key of the request. Defaults to 'key'.
+
+    Returns:
+        tuple[int, dict, bool]: Status code, body and whether the response was replayed.
+    """
+    response = await client.post('/translate',
+                                 json={'text': text},
+                                 headers={'Idempotency-Key': idempotency_key, 'X-API-Key': 'api-key'})
+    return response.status_code, response.json(), response.headers.get('idempotent-replayed') == 'true'
+
+
+async def test_repeat_replays_the_stored_response(app: CountingApp, client: AsyncClient) -> None:
+    assert await translate(client=client) == (200, {'call': 1}, False)
+    assert await translate(client=client) == (200, {'call': 1}, True)
+    assert await translate(client=client, idempotency_key='other') == (200, {'call': 2}, False)
+    assert app.calls == 2
+
+
+async def test_repeat_waits_for_the_request_in_progress(app: CountingApp, client: AsyncClient) -> None:
+    app.resume.clear()
+    original = create_task(translate(client=client))
+    await sleep(0.01)
+
+    repeat = create_task(translate(client=client))
+    await sleep(0.01)
+    app.resume.set()
+
+    assert await original == (200, {'call': 1}, False)
+    assert await repeat == (200, {'call': 1}, True)
+    assert app.calls == 1
+
+
+async def test_request_in_progress_keeps_its_key_after_the_wait_timeout(app: CountingApp, client: AsyncClient,
+                                                                         monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'IDEMPOTENCY_WAIT_TIMEOUT', 0.05)
+    app.resume.clear()
+    original = create_task(translate(client=client))
+    await sleep(0.01)
+
+    repeat = create_task(translate(client=client))
+    await sleep(0.1)
+    app.resume.set()
+
+    assert (await repeat)[0] == 409
+    assert await original == (200, {'call': 1}, False)
+    assert app.calls == 1
+
+
+async def test_key_reused_with_a_different_request_is_rejected(app: CountingApp, client: AsyncClient) -> None:
+    await translate(client=client)
+
+    status_code, _, _ = await translate(client=client, text='Goodbye')
+
+    assert status_code == 422
+    assert app.calls == 1
+
+
+async def test_failed_request_releases_its_key(app: CountingApp, client: AsyncClient) -> None:
+    app.status_codes = [500, 429]
+
+    assert await translate(client=client) == (500, {'call': 1}, False)
+    assert await translate(client=client) == (429, {'call': 2}, False)
+    assert await translate(client=client) == (200, {'call': 3}, False)
+    assert await translate(client=client) == (200, {'call': 3}, True)
@@ -0,0 +1,209 @@
+"""
+Tests of the fair-share scheduler of the model calls.
+"""
+from asyncio import create_task, Event, sleep, Task
+
+import pytest
+
+from app.settings import Priority
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.llm import FairShareScheduler
+
+pytestmark = pytest.mark.anyio
+
+
+class Call():
+    """
+    Model call that holds its slot until it is finished.
+    """
+    name: str
+    task: Task
+    __started: list[str]
+    __finished: Event
+
+    def __init__(self, scheduler: FairShareScheduler, started: list[str], name: str, user_id: str,
+                 priority: Priority = Priority.STANDARD, cost: int = 500) -> None:
+        """
+        Start waiting for a slot of the scheduler.
+
+        Args:
+            scheduler (FairShareScheduler): Scheduler of the call.
+            started (list[str]): Names of the calls in the order they got a slot.
+            name (str): Name of the call.
+            user_id (str): ID of the user of the call.
+            priority (Priority, optional): Priority of the call. Defaults to Priority.STANDARD.
+            cost (int, optional): Estimated tokens of the call. Defaults to 500.
+        """
+        self.name = name
+        self.__started = started
+        self.__finished = Event()
+        self.task = create_task(self.__run(scheduler=scheduler, user_id=user_id, priority=priority, cost=cost))
+
+    async def __run(self, scheduler: FairShareScheduler, user_id: str, priority: Priority, cost: int) -> None:
+        async with scheduler.slot(user_id=user_id, priority=priority, cost=cost):
+            self.__started.append(self.name)
+            await self.__finished.wait()
+
+    def stop(self) -> None:
+        """
+        Let the call free its slot when it runs again.
+        """
+        self.__finished.set()
+
+    async def finish(self) -> None:
+        """
+        Free the slot of the call and let the next calls start.
+        """
+        self.stop()
+        await self.task
+        await settle()
+
+
+async def settle() -> None:
+    """
+    Let the pending tasks run until they wait again.
+    """
+    for _ in range(10):
+        await sleep(0)
+
+
+async def test_slot_keeps_slots_free_for_the_higher_priorities() -> None:
+    scheduler = FairShareScheduler(max_concurrency=4,
+                                   max_queue=10,
+                                   max_user_queue=10,
+                                   shares={Priority.STANDARD: 0.75, Priority.BULK: 0.5})
+    started: list[str] = []
+
+    calls = [
+        Call(scheduler, started, name=f'bulk-{index}', user_id='bulk', priority=Priority.BULK) for index in range(3)
+    ]
+    calls += [Call(scheduler, started, name=f'standard-{index}', user_id='standard') for index in range(2)]
+    calls.append(Call(scheduler, started, name='interactive', user_id='interactive', priority=Priority.INTERACTIVE))
+    await settle()
+
+    # The bulk calls use 2 slots, the standard and bulk calls 3, and the interactive call gets the last one
+    assert started == ['bulk-0', 'bulk-1', 'standard-0', 'interactive']
+    assert scheduler.queue_depth == 2
+
+    for call in calls:
+        call.task.cancel()
+    await settle()
+
+
+async def test_slot_gives_a_free_slot_to_the_highest_priority() -> None:
+    scheduler = FairShareScheduler(max_concurrency=1, max_queue=10, max_user_queue=10, shares={})
+    started: list[str] = []
+
+    running = Call(scheduler, started, name='running', user_id='first')
+    Call(scheduler, started, name='bulk', user_id='second', priority=Priority.BULK)
+    Call(scheduler, started, name='standard', user_id='third')
+    interactive = Call(scheduler, started, name='interactive', user_id='fourth', priority=Priority.INTERACTIVE)
+    await settle()
+
+    await running.finish()
+    await interactive.finish()
+
+    assert started == ['running', 'interactive', 'standard']
+
+
+async def test_slot_shares_a_priority_between_the_users_by_deficit_round_robin() -> None:
+    scheduler = FairShareScheduler(max_concurrency=1, max_queue=10, max_user_queue=10, shares={}, quantum=500)
+    started: list[str] = []
+
+    running = Call(scheduler, started, name='running', user_id='first')
+    heavy = [Call(scheduler, started, name=f'heavy-{index}', user_id='heavy', cost=1000) for index in range(2)]
+    light = [Call(scheduler, started, name=f'light-{index}', user_id='light', cost=250) for index in range(4)]
+    await settle()
+
+    calls = {call.name: call for call in heavy + light}
+    await running.finish()
+    while len(started) < 7:
+        await calls[started[-1]].finish()
+
+    # Each round gives 500 tokens to each user, so the light user runs two calls for each call of the heavy user
+    assert started == ['running', 'light-0', 'light-1', 'heavy-0', 'light-2', 'light-3', 'heavy-1']
+
+
+async def test_slot_alternates_the_users_with_calls_of_the_same_cost() -> None:
+    scheduler = FairShareScheduler(max_concurrency=1, max_queue=10, max_user_queue=10, shares={})
+    started: list[str] = []
+
+    running = Call(scheduler, started, name='running', user_id='first')
+    calls = [Call(scheduler, started, name=f'burst-{index}', user_id='burst') for index in range(3)]
+    calls.append(Call(scheduler, started, name='single', user_id='single'))
+    await settle()
+
+    calls_by_name = {call.name: call for call in calls}
+    await running.finish()
+    while len(started) < 5:
+        await calls_by_name[started[-1]].finish()
+
+    assert started == ['running', 'burst-0', 'single', 'burst-1', 'burst-2']
+
+
+async def test_slot_removes_a_cancelled_call_from_the_queue() -> None:
+    scheduler = FairShareScheduler(max_concurrency=1, max_queue=10, max_user_queue=10, shares={})
+    started: list[str] = []
+
+    running = Call(scheduler, started, name='running', user_id='first')
+    cancelled = Call(scheduler, started, name='cancelled', user_id='second')
+    waiting = Call(scheduler, started, name='waiting', user_id='third')
+    await settle()
+    assert scheduler.queue_depth == 2
+
+    cancelled.task.cancel()
+    await settle()
+    assert scheduler.queue_depth == 1
+
+    await running.finish()
+    await waiting.finish()
+
+    assert started == ['running', 'waiting']
+    assert scheduler.queue_depth == 0
+
+
+async def test_slot_frees_a_slot_given_to_a_call_cancelled_before_it_started() -> None:
+    scheduler = FairShareScheduler(max_concurrency=1, max_queue=10, max_user_queue=10, shares={})
+    started: list[str] = []
+
+    running = Call(scheduler, started, name='running', user_id='first')
+    cancelled = Call(scheduler, started, name='cancelled', user_id='second')
+    await settle()
+
+    # The running call gives its slot to the waiting call, which is cancelled before it resumes
+    running.stop()
+    await sleep(0)
+    cancelled.task.cancel()
+    await settle()
+    assert cancelled.task.cancelled()
+
+    last = Call(scheduler, started, name='last', user_id='third')
+    await settle()
+
+    assert started == ['running', 'last']
+    await last.finish()
+
+
+async def test_slot_rejects_the_calls_over_the_queue_limits() -> None:
+    scheduler = FairShareScheduler(max_concurrency=1, max_queue=3, max_user_queue=2, shares={})
+    started: list[str] = []
+
+    calls = [Call(scheduler, started, name='running', user_id='first')]
+    calls += [Call(scheduler, started, name=f'queued-{index}', user_id='second') for index in range(2)]
+    await settle()
+
+    with pytest.raises(ServiceUnavailableException):
+        async with scheduler.slot(user_id='second', priority=Priority.STANDARD, cost=1):
+            pass
+
+    calls.append(Call(scheduler, started, name='queued-2', user_id='third'))
+    await settle()
+    assert scheduler.saturated
+
+    with pytest.raises(ServiceUnavailableException):
+        async with scheduler.slot(user_id='fourth', priority=Priority.INTERACTIVE, cost=1):
+            pass
+
+    for call in calls:
+        call.task.cancel()
+    await settle()
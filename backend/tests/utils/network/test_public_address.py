@@ -0,0 +1,67 @@
+"""
+Tests of the checks of the hosts the server sends requests to.
+"""
+import sys
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.utils.exceptions import ValidationException
+from app.utils.network import check_public_host, is_public_address, resolve_public_address
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def resolved_addresses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Resolve every host to the addresses of the returned list, without DNS.
+
+    Returns:
+        list[str]: Addresses the hosts resolve to.
+    """
+    addresses: list[str] = []
+
+    async def getaddrinfo(host: str, port: int, **kwargs: Any) -> list[tuple]:
+        return [(None, None, None, '', (address, port)) for address in addresses]
+
+    monkeypatch.setattr(sys.modules['app.utils.network.public_address'], 'get_running_loop',
+                        lambda: SimpleNamespace(getaddrinfo=getaddrinfo))
+    return addresses
+
+
+@pytest.mark.parametrize('address', [
+    '127.0.0.1', '10.0.0.1', '172.16.0.1', '192.168.1.1', '169.254.169.254', '100.64.0.1', '0.0.0.0', '224.0.0.1',
+    '::1', 'fe80::1%eth0', 'fd00::1', '::ffff:127.0.0.1'
+])
+def test_is_public_address_rejects_the_local_addresses(address: str) -> None:
+    assert not is_public_address(address=address)
+
+
+@pytest.mark.parametrize('address', ['93.184.216.34', '2606:4700::1111', '[2606:4700::1111]'])
+def test_is_public_address_accepts_the_public_addresses(address: str) -> None:
+    assert is_public_address(address=address)
+
+
+@pytest.mark.parametrize('host', ['localhost', 'api.localhost.', '169.254.169.254', '[::1]'])
+def test_check_public_host_rejects_the_local_hosts(host: str) -> None:
+    with pytest.raises(ValidationException):
+        check_public_host(host=host)
+
+
+def test_check_public_host_leaves_the_host_names_to_the_resolution() -> None:
+    check_public_host(host='example.com')
+
+
+async def test_resolve_public_address_returns_the_first_public_address(resolved_addresses: list[str]) -> None:
+    resolved_addresses.extend(['93.184.216.34', '2606:4700::1111'])
+
+    assert await resolve_public_address(host='example.com', port=443) == '93.184.216.34'
+
+
+async def test_resolve_public_address_rejects_a_host_with_any_local_address(resolved_addresses: list[str]) -> None:
+    resolved_addresses.extend(['93.184.216.34', '10.0.0.1'])
+
+    with pytest.raises(ValidationException):
+        await resolve_public_address(host='example.com', port=443)
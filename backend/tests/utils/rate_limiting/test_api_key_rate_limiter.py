@@ -0,0 +1,83 @@
+"""
+Tests of the rate limiter of the API key protected routes.
+"""
+import pytest
+
+from app.settings import settings
+from app.utils.exceptions import TooManyRequestsException
+from app.utils.rate_limiting import ApiKeyRateLimiter, InMemoryRateLimitStore
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Set small API key limits, disable the user limits and stop the clock of the rate limit store.
+    """
+    monkeypatch.setattr('app.utils.rate_limiting.in_memory_rate_limit_store.time', lambda: 1000.0)
+    for name, value in (('API_KEY_RATE_LIMIT', 2), ('API_KEY_MAX_CONCURRENT_REQUESTS', 1),
+                        ('API_KEY_DAILY_INPUT_TOKENS', 100), ('USER_RATE_LIMIT', 0),
+                        ('USER_MAX_CONCURRENT_REQUESTS', 0), ('USER_DAILY_INPUT_TOKENS', 0)):
+        monkeypatch.setattr(settings, name, value)
+
+
+async def test_limit_returns_the_rate_limit_headers(limits: None) -> None:
+    rate_limiter = ApiKeyRateLimiter(store=InMemoryRateLimitStore())
+
+    async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1) as headers:
+        assert headers['RateLimit-Limit'] == '2'
+        assert headers['RateLimit-Remaining'] == '1'
+
+
+async def test_limit_rejects_the_requests_over_the_rate(limits: None) -> None:
+    rate_limiter = ApiKeyRateLimiter(store=InMemoryRateLimitStore())
+    for _ in range(2):
+        async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1):
+            pass
+
+    with pytest.raises(TooManyRequestsException) as exception:
+        async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1):
+            pass
+
+    assert exception.value.headers['RateLimit-Remaining'] == '0'
+
+
+async def test_limit_holds_a_concurrency_slot_while_the_request_runs(limits: None,
+                                                                     monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'API_KEY_RATE_LIMIT', 0)
+    rate_limiter = ApiKeyRateLimiter(store=InMemoryRateLimitStore())
+
+    async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1):
+        with pytest.raises(TooManyRequestsException):
+            async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1):
+                pass
+
+    async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1):
+        pass
+
+
+async def test_limit_rejects_the_requests_over_the_daily_tokens(limits: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'API_KEY_RATE_LIMIT', 0)
+    rate_limiter = ApiKeyRateLimiter(store=InMemoryRateLimitStore())
+    async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=80):
+        pass
+
+    with pytest.raises(TooManyRequestsException):
+        async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=30):
+            pass
+
+    # The rejected request does not hold its concurrency slot
+    async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=20):
+        pass
+
+
+async def test_limit_ignores_the_disabled_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ('API_KEY_RATE_LIMIT', 'API_KEY_MAX_CONCURRENT_REQUESTS', 'API_KEY_DAILY_INPUT_TOKENS',
+                 'USER_RATE_LIMIT', 'USER_MAX_CONCURRENT_REQUESTS', 'USER_DAILY_INPUT_TOKENS'):
+        monkeypatch.setattr(settings, name, 0)
+    rate_limiter = ApiKeyRateLimiter(store=InMemoryRateLimitStore())
+
+    for _ in range(100):
+        async with rate_limiter.limit(api_key_id='key', user_id='user', input_tokens=1000) as headers:
+            assert headers == {}
@@ -0,0 +1,94 @@
+"""
+Tests of the in-memory sliding window rate limit store.
+"""
+import pytest
+
+from app.utils.rate_limiting import InMemoryRateLimitStore
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """
+    Replace the clock of the store with a manual one.
+
+    Returns:
+        list[float]: Current time, which the tests move forward.
+    """
+    now = [1000.0]
+    monkeypatch.setattr('app.utils.rate_limiting.in_memory_rate_limit_store.time', lambda: now[0])
+    return now
+
+
+async def test_hit_rejects_requests_over_the_limit(clock: list[float]) -> None:
+    store = InMemoryRateLimitStore()
+
+    results = [await store.hit(key='key', limit=3, window=10) for _ in range(4)]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results] == [2, 1, 0, 0]
+    assert results[-1].reset_after == pytest.approx(10)
+
+
+async def test_hit_counts_the_cost_of_the_request(clock: list[float]) -> None:
+    store = InMemoryRateLimitStore()
+
+    assert (await store.hit(key='key', limit=100, window=10, cost=60)).allowed
+    assert not (await store.hit(key='key', limit=100, window=10, cost=50)).allowed
+    assert (await store.hit(key='key', limit=100, window=10, cost=40)).allowed
+
+
+async def test_hit_weights_the_previous_window_by_its_overlap(clock: list[float]) -> None:
+    store = InMemoryRateLimitStore()
+    for _ in range(10):
+        await store.hit(key='key', limit=10, window=10)
+
+    # A quarter into the next window, three quarters of the previous window still count
+    clock[0] += 12.5
+    results = [await store.hit(key='key', limit=10, window=10) for _ in range(3)]
+
+    assert [result.allowed for result in results] == [True, True, False]
+    assert results[-1].reset_after == pytest.approx(7.5)
+
+
+async def test_hit_forgets_windows_older_than_the_previous_one(clock: list[float]) -> None:
+    store = InMemoryRateLimitStore()
+    for _ in range(10):
+        await store.hit(key='key', limit=10, window=10)
+
+    clock[0] += 25
+    result = await store.hit(key='key', limit=10, window=10)
+
+    assert result.allowed
+    assert result.remaining == 9
+
+
+async def test_hit_keeps_the_keys_apart(clock: list[float]) -> None:
+    store = InMemoryRateLimitStore()
+
+    assert (await store.hit(key='first', limit=1, window=10)).allowed
+    assert not (await store.hit(key='first', limit=1, window=10)).allowed
+    assert (await store.hit(key='second', limit=1, window=10)).allowed
+
+
+async def test_hit_evicts_the_least_recently_used_keys(clock: list[float]) -> None:
+    store = InMemoryRateLimitStore(max_keys=2)
+    await store.hit(key='first', limit=1, window=10)
+    await store.hit(key='second', limit=1, window=10)
+    await store.hit(key='third', limit=1, window=10)
+
+    assert (await store.hit(key='first', limit=1, window=10)).allowed
+    assert not (await store.hit(key='third', limit=1, window=10)).allowed
+
+
+async def test_acquire_limits_the_concurrent_slots_until_released() -> None:
+    store = InMemoryRateLimitStore()
+
+    assert await store.acquire(key='key', limit=2)
+    assert await store.acquire(key='key', limit=2)
+    assert not await store.acquire(key='key', limit=2)
+
+    await store.release(key='key')
+
+    assert await store.acquire(key='key', limit=2)
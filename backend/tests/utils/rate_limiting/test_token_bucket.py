@@ -0,0 +1,64 @@
+"""
+Tests of the token bucket rate limiter.
+"""
+import pytest
+
+from app.utils.rate_limiting import TokenBucket, TokenBucketRegistry
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """
+    Replace the clock of the token buckets with a manual one.
+
+    Returns:
+        list[float]: Current time, which the tests move forward.
+    """
+    now = [1000.0]
+    monkeypatch.setattr('app.utils.rate_limiting.token_bucket.monotonic', lambda: now[0])
+    return now
+
+
+def test_consume_allows_a_burst_up_to_the_capacity(clock: list[float]) -> None:
+    bucket = TokenBucket(capacity=3, refill_rate=1)
+
+    assert [bucket.consume() for _ in range(3)] == [0, 0, 0]
+    assert bucket.consume() == pytest.approx(1)
+
+
+def test_consume_returns_the_seconds_until_the_tokens_are_refilled(clock: list[float]) -> None:
+    bucket = TokenBucket(capacity=4, refill_rate=2)
+    bucket.consume(tokens=4)
+
+    clock[0] += 0.5
+
+    assert bucket.consume(tokens=3) == pytest.approx(1)
+    assert bucket.consume(tokens=1) == 0
+
+
+def test_consume_does_not_refill_over_the_capacity(clock: list[float]) -> None:
+    bucket = TokenBucket(capacity=2, refill_rate=1)
+    bucket.consume(tokens=2)
+
+    clock[0] += 60
+
+    assert bucket.consume(tokens=2) == 0
+    assert bucket.consume() > 0
+
+
+def test_registry_keeps_a_bucket_per_key(clock: list[float]) -> None:
+    registry = TokenBucketRegistry(capacity=1, refill_rate=1)
+
+    assert registry.consume(key='first') == 0
+    assert registry.consume(key='first') > 0
+    assert registry.consume(key='second') == 0
+
+
+def test_registry_evicts_the_least_recently_used_keys(clock: list[float]) -> None:
+    registry = TokenBucketRegistry(capacity=1, refill_rate=1, max_keys=2)
+    registry.consume(key='first')
+    registry.consume(key='second')
+    registry.consume(key='third')
+
+    assert registry.consume(key='first') == 0
+    assert registry.consume(key='third') > 0